@@ -0,0 +1,128 @@
+"""
+Replay captured websocket frames through gateway websocket api to
+measure cost of decoding and on_packet with each json backend.
+
+Capture frames in a running gateway first, e.g.:
+
+    gateway.market_ws_api.start_capture("huobi_frames.jsonl")
+
+Then run:
+
+    python run.py vnpy.gateway.huobi.huobi_gateway:HuobiDataWebsocketApi \
+        huobi_frames.jsonl --symbols btcusdt ethusdt --exchange HUOBI
+"""
+import argparse
+import base64
+import json
+from importlib import import_module
+from time import perf_counter
+from typing import Callable, List, Union
+
+from vnpy.api.websocket.decoder import JSON_BACKENDS
+from vnpy.trader.constant import Exchange
+from vnpy.trader.object import SubscribeRequest
+
+
+class BenchmarkGateway:
+    """
+    Gateway which ignores all data pushed by websocket api.
+    """
+
+    def __init__(self, gateway_name: str):
+        """"""
+        self.gateway_name = gateway_name
+        self.count = 0
+
+    def on_event(self, *args, **kwargs):
+        """"""
+        self.count += 1
+
+    def write_log(self, msg: str):
+        """"""
+        pass
+
+    def __getattr__(self, name: str) -> Callable:
+        """"""
+        if name.startswith("on_"):
+            return self.on_event
+        return lambda *args, **kwargs: None
+
+
+def load_frames(path: str) -> List[Union[str, bytes]]:
+    """"""
+    frames = []
+
+    with open(path, encoding="UTF-8") as f:
+        for line in f:
+            d = json.loads(line)
+            if "text" in d:
+                frames.append(d["text"])
+            else:
+                frames.append(base64.b64decode(d["binary"]))
+
+    return frames
+
+
+def run_benchmark(
+    class_path: str,
+    frames: List[Union[str, bytes]],
+    symbols: List[str],
+    exchange: Exchange,
+    repeat: int
+):
+    """"""
+    module_name, class_name = class_path.split(":")
+    api_class = getattr(import_module(module_name), class_name)
+
+    print(f"{class_name}，帧数：{len(frames)}，重复：{repeat}")
+
+    for backend, loads in JSON_BACKENDS.items():
+        for record_data in [True, False]:
+            gateway = BenchmarkGateway(class_name)
+            api = api_class(gateway)
+            api.decoder.loads = loads
+            api.record_data = record_data
+
+            for symbol in symbols:
+                api.subscribe(SubscribeRequest(symbol, exchange))
+
+            # Decode only
+            start = perf_counter()
+            for _ in range(repeat):
+                for frame in frames:
+                    api.unpack_data(frame)
+            decode_cost = perf_counter() - start
+
+            # Full processing through on_packet
+            start = perf_counter()
+            for _ in range(repeat):
+                for frame in frames:
+                    api._process_frame(frame)
+            total_cost = perf_counter() - start
+
+            count = len(frames) * repeat
+            print(
+                f"{backend:8s} record_data={record_data!s:5s} "
+                f"解析：{decode_cost / count * 1e6:.2f}us/帧，"
+                f"处理：{total_cost / count * 1e6:.2f}us/帧，"
+                f"吞吐：{count / total_cost:.0f}帧/秒，"
+                f"推送：{gateway.count}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("class_path", help="module:WebsocketApiClass")
+    parser.add_argument("frames", help="file saved by start_capture")
+    parser.add_argument("--symbols", nargs="*", default=[])
+    parser.add_argument("--exchange", default="")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.symbols and not args.exchange:
+        parser.error("--exchange is required when --symbols is given")
+
+    frames = load_frames(args.frames)
+    exchange = Exchange(args.exchange) if args.exchange else None
+
+    run_benchmark(args.class_path, frames, args.symbols, exchange, args.repeat)
@@ -62,6 +62,7 @@ def get_install_requires():
         "qdarkstyle",
         "requests",
         "websocket-client",
+        "aiohttp",
         "peewee",
         "numpy",
         "pandas",
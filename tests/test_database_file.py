@@ -0,0 +1,90 @@
+"""
+Tests of FileManager, run with:
+
+    python -m unittest discover tests
+"""
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from vnpy.trader.constant import Exchange, Interval
+from vnpy.trader.database.database import DB_TZ
+from vnpy.trader.database.database_file import FileManager
+from vnpy.trader.object import BarData, TickData
+
+
+class FileManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        """"""
+        self.folder = tempfile.TemporaryDirectory()
+        self.manager = FileManager(self.folder.name)
+        self.dt = DB_TZ.localize(datetime(2020, 1, 2, 9, 30))
+
+    def tearDown(self):
+        """"""
+        self.folder.cleanup()
+
+    def test_save_mixed_ticks(self):
+        """"""
+        ticks = [
+            TickData("DB", symbol, Exchange.SHFE, self.dt, last_price=price)
+            for symbol, price in [("rb2010", 3500), ("ag2012", 4800)]
+        ]
+        self.manager.save_tick_data(ticks)
+
+        for tick in ticks:
+            data = self.manager.load_tick_data(tick.symbol, tick.exchange, self.dt, self.dt)
+            self.assertEqual(len(data), 1)
+            self.assertEqual(data[0].last_price, tick.last_price)
+
+    def test_save_mixed_bars(self):
+        """"""
+        bars = [
+            BarData("DB", symbol, Exchange.SHFE, self.dt, interval, close_price=price)
+            for symbol, interval, price in [
+                ("rb2010", Interval.MINUTE, 3500),
+                ("rb2010", Interval.HOUR, 3510),
+                ("ag2012", Interval.MINUTE, 4800),
+            ]
+        ]
+        self.manager.save_bar_data(bars)
+
+        for bar in bars:
+            data = self.manager.load_bar_data(
+                bar.symbol, bar.exchange, bar.interval, self.dt, self.dt
+            )
+            self.assertEqual(len(data), 1)
+            self.assertEqual(data[0].close_price, bar.close_price)
+
+    def test_append_and_overwrite(self):
+        """"""
+        bars = [
+            BarData("DB", "rb2010", Exchange.SHFE, self.dt + timedelta(minutes=i), Interval.MINUTE, close_price=i)
+            for i in range(4)
+        ]
+        self.manager.save_bar_data(bars[:2])
+        self.manager.save_bar_data(bars[2:])
+
+        # Older record overwritten and unordered records sorted
+        bars[1].close_price = 10
+        self.manager.save_bar_data([bars[3], bars[1]])
+
+        end = self.dt + timedelta(minutes=3)
+        data = self.manager.load_bar_data("rb2010", Exchange.SHFE, Interval.MINUTE, self.dt, end)
+        self.assertEqual([bar.close_price for bar in data], [0, 10, 2, 3])
+
+    def test_index_shared_by_managers(self):
+        """"""
+        other = FileManager(self.folder.name)
+
+        for i, manager in enumerate([self.manager, other]):
+            bar = BarData("DB", f"rb20{i}", Exchange.SHFE, self.dt, Interval.MINUTE)
+            manager.save_bar_data([bar])
+
+        for manager in [self.manager, other]:
+            self.assertEqual(len(manager.get_bar_data_statistics()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
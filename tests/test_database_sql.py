@@ -0,0 +1,135 @@
+"""
+Tests of bulk saving in SqlManager, run with:
+
+    python -m unittest discover tests
+"""
+import unittest
+from datetime import datetime
+
+from peewee import (
+    AutoField,
+    CharField,
+    DateTimeField,
+    FloatField,
+    Model,
+    MySQLDatabase,
+    SqliteDatabase
+)
+
+from vnpy.trader.database.database import Driver
+from vnpy.trader.database.database_sql import (
+    BAR_FIELDS,
+    deduplicate_rows,
+    init_models,
+    save_rows
+)
+
+
+BAR_KEYS = ["symbol", "exchange", "interval", "datetime"]
+
+
+class RecordingCursor:
+    """"""
+
+    lastrowid = 0
+    rowcount = 0
+
+    def fetchone(self):
+        """"""
+        return None
+
+
+class RecordingMySQLDatabase(MySQLDatabase):
+    """
+    MySQLDatabase which records SQL executed instead of connecting.
+    """
+
+    def __init__(self):
+        """"""
+        super().__init__("test")
+        self.sqls = []
+
+    def execute_sql(self, sql, params=None, commit=None):
+        """"""
+        self.sqls.append((sql, params))
+        return RecordingCursor()
+
+    def begin(self, *args, **kwargs):
+        """"""
+        pass
+
+    def commit(self):
+        """"""
+        pass
+
+    def rollback(self):
+        """"""
+        pass
+
+
+def generate_rows():
+    """
+    Two rows of the same key, and one of another key.
+    """
+    dt = datetime(2020, 1, 1, 9, 30)
+    return [
+        ("rb2010", "SHFE", dt, "1m", 1, 0, 1, 1, 1, 1),
+        ("ag2012", "SHFE", dt, "1m", 2, 0, 2, 2, 2, 2),
+        ("rb2010", "SHFE", dt, "1m", 3, 0, 3, 3, 3, 3),
+    ]
+
+
+class SaveRowsTest(unittest.TestCase):
+
+    def test_deduplicate_rows(self):
+        """"""
+        rows = deduplicate_rows(BAR_FIELDS, generate_rows(), BAR_KEYS)
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual({row[4] for row in rows}, {2, 3})
+
+    def test_mysql(self):
+        """"""
+        db = RecordingMySQLDatabase()
+
+        class DbBarData(Model):
+            id = AutoField()
+            symbol = CharField()
+            exchange = CharField()
+            datetime = DateTimeField()
+            interval = CharField()
+            volume = FloatField()
+            open_interest = FloatField()
+            open_price = FloatField()
+            high_price = FloatField()
+            low_price = FloatField()
+            close_price = FloatField()
+
+            class Meta:
+                database = db
+
+        save_rows(db, Driver.MYSQL, DbBarData, BAR_FIELDS, generate_rows(), BAR_KEYS, 1000)
+
+        self.assertEqual(len(db.sqls), 1)
+
+        sql, params = db.sqls[0]
+        self.assertIn("ON DUPLICATE KEY UPDATE", sql)
+        self.assertEqual(params.count("rb2010"), 1)
+        self.assertIn(3, params)
+
+    def test_sqlite(self):
+        """"""
+        db = SqliteDatabase(":memory:")
+        DbBarData, _ = init_models(db, Driver.SQLITE)
+
+        DbBarData.save_rows(generate_rows())
+        DbBarData.save_rows(generate_rows()[2:])
+
+        self.assertEqual(DbBarData.select().count(), 2)
+
+        bar = DbBarData.get(DbBarData.symbol == "rb2010")
+        self.assertEqual(bar.volume, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import asyncio
+from asyncio import AbstractEventLoop
+from concurrent.futures import Future
+from threading import Lock, Thread
+from typing import Coroutine, Optional
+
+
+_loop: Optional[AbstractEventLoop] = None
+_lock: Lock = Lock()
+
+
+def get_event_loop() -> AbstractEventLoop:
+    """
+    Get the event loop shared by all async api clients, which is
+    running forever in a daemon thread started at the first call.
+    """
+    global _loop
+
+    with _lock:
+        if not _loop:
+            _loop = asyncio.new_event_loop()
+
+            thread = Thread(target=_loop.run_forever, daemon=True)
+            thread.start()
+
+    return _loop
+
+
+def run_coroutine(coro: Coroutine) -> Future:
+    """
+    Submit coroutine to the shared event loop from any thread.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
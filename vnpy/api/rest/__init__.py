@@ -1 +1,2 @@
-from .rest_client import Request, RequestStatus, RestClient
+from .rest_client import Request, RequestStatus, RequestPriority, RateLimiter, RestClient
+from .async_rest_client import AsyncRestClient
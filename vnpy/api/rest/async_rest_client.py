@@ -0,0 +1,201 @@
+import asyncio
+import json
+import sys
+from threading import Lock
+from typing import List
+
+import aiohttp
+
+from ..async_loop import get_event_loop, run_coroutine
+from .rest_client import Request, RequestStatus, RestClient
+
+
+class Response(object):
+    """
+    Response of aiohttp with attributes used by callbacks of requests.Response.
+    """
+
+    def __init__(self, status_code: int, text: str, headers: dict):
+        """"""
+        self.status_code: int = status_code
+        self.text: str = text
+        self.headers: dict = headers
+
+    def json(self) -> dict:
+        """"""
+        return json.loads(self.text)
+
+
+class AsyncRestClient(RestClient):
+    """
+    RestClient running on the event loop shared by all async api clients,
+    instead of creating its own worker threads.
+
+    Same callbacks, priority lane, rate limit and statistics are provided
+    as RestClient. Callbacks are called in the event loop thread, so avoid
+    blocking inside them.
+
+    Gateway switches to it by inheriting AsyncRestClient instead of
+    RestClient, e.g. BinanceRestApi.
+    """
+
+    def __init__(self):
+        """"""
+        super().__init__()
+
+        self._loop: asyncio.AbstractEventLoop = None
+        self._async_queue: asyncio.PriorityQueue = None
+        self._client: aiohttp.ClientSession = None
+        self._workers: List[asyncio.Task] = []
+
+        # Requests added before queue created are kept in pending list,
+        # queue creation and pending check are guarded by the same lock
+        self._pending: List[Request] = []
+        self._pending_lock: Lock = Lock()
+
+    def start(self, n: int = 3) -> None:
+        """
+        Start rest client with worker count n, limited by max_workers.
+        """
+        if self._active:
+            return
+
+        self._active = True
+        self._loop = get_event_loop()
+        run_coroutine(self._start(self.get_worker_count(n))).result()
+
+    def stop(self) -> None:
+        """
+        Stop rest client immediately.
+        """
+        if not self._active:
+            return
+
+        self._active = False
+        run_coroutine(self._stop())
+
+    def join(self) -> None:
+        """
+        Wait till all requests are processed.
+        """
+        if self._async_queue:
+            run_coroutine(self._async_queue.join()).result()
+
+    def _put_request(self, request: Request) -> None:
+        """
+        Put request into queue of event loop from any thread.
+        """
+        with self._pending_lock:
+            if not self._async_queue:
+                self._pending.append(request)
+                return
+
+        item = (request.priority, next(self._count), request)
+        self._loop.call_soon_threadsafe(self._async_queue.put_nowait, item)
+
+    async def _start(self, n: int) -> None:
+        """"""
+        # All workers share connection pool of one session
+        connector = aiohttp.TCPConnector(limit=n)
+        self._client = aiohttp.ClientSession(connector=connector)
+
+        with self._pending_lock:
+            self._async_queue = asyncio.PriorityQueue()
+
+            for request in self._pending:
+                item = (request.priority, next(self._count), request)
+                self._async_queue.put_nowait(item)
+            self._pending.clear()
+
+        self._workers = [
+            self._loop.create_task(self._run_async()) for _ in range(n)
+        ]
+
+    async def _stop(self) -> None:
+        """"""
+        for worker in self._workers:
+            worker.cancel()
+        self._workers.clear()
+
+        if self._client:
+            await self._client.close()
+            self._client = None
+
+    async def _run_async(self) -> None:
+        """"""
+        while self._active:
+            _, _, request = await self._async_queue.get()
+
+            try:
+                if self._rate_limiter:
+                    wait = self._rate_limiter.try_acquire(request.weight)
+                    while wait:
+                        await asyncio.sleep(wait)
+                        wait = self._rate_limiter.try_acquire(request.weight)
+
+                start = self._on_request_start()
+                try:
+                    await self._process_async_request(request)
+                finally:
+                    self._on_request_end(request, start)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                et, ev, tb = sys.exc_info()
+                self.on_error(et, ev, tb, None)
+            finally:
+                self._async_queue.task_done()
+
+    async def _process_async_request(self, request: Request) -> None:
+        """
+        Sending request to server and get result.
+        """
+        try:
+            request = self.sign(request)
+
+            url = self.make_full_url(request.path)
+
+            if self.proxies:
+                proxy = self.proxies["https"]
+            else:
+                proxy = None
+
+            async with self._client.request(
+                request.method,
+                url,
+                headers=request.headers,
+                params=request.params,
+                data=request.data,
+                proxy=proxy,
+            ) as client_response:
+                text = await client_response.text()
+
+            response = Response(
+                client_response.status,
+                text,
+                dict(client_response.headers)
+            )
+            request.response = response
+            status_code = response.status_code
+            if status_code // 100 == 2:  # 2xx codes are all successful
+                if status_code == 204:
+                    json_body = None
+                else:
+                    json_body = response.json()
+
+                request.callback(json_body, request)
+                request.status = RequestStatus.success
+            else:
+                request.status = RequestStatus.failed
+
+                if request.on_failed:
+                    request.on_failed(status_code, request)
+                else:
+                    self.on_failed(status_code, request)
+        except Exception:
+            request.status = RequestStatus.error
+            t, v, tb = sys.exc_info()
+            if request.on_error:
+                request.on_error(t, v, tb, request)
+            else:
+                self.on_error(t, v, tb, request)
@@ -1,13 +1,17 @@
 import sys
 import traceback
+from bisect import bisect_left
 from datetime import datetime
-from enum import Enum
-from multiprocessing.dummy import Pool
-from queue import Empty, Queue
-from typing import Any, Callable, Optional, Union, Type
+from enum import Enum, IntEnum
+from itertools import count
+from queue import Empty, PriorityQueue
+from threading import Lock, Thread
+from time import perf_counter, sleep
+from typing import Any, Callable, Dict, List, Optional, Union, Type
 from types import TracebackType
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 # Use SSL from Python stdlib instead of OpenSSL to avoid [10054 WSAECONNRESET] error
@@ -18,6 +22,9 @@ CALLBACK_TYPE = Callable[[dict, "Request"], Any]
 ON_FAILED_TYPE = Callable[[int, "Request"], Any]
 ON_ERROR_TYPE = Callable[[Type, Exception, TracebackType, "Request"], Any]
 
+# Upper bounds(ms) of request latency histogram buckets
+LATENCY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
 
 class RequestStatus(Enum):
     """"""
@@ -28,6 +35,15 @@ class RequestStatus(Enum):
     error = 3       # Exception raised
 
 
+class RequestPriority(IntEnum):
+    """
+    Requests with smaller value are sent first.
+    """
+
+    high = 0        # Order placement and cancellation
+    normal = 1      # Query and others
+
+
 class Request(object):
     """
     Request object for status check.
@@ -44,6 +60,8 @@ class Request(object):
         on_failed: ON_FAILED_TYPE = None,
         on_error: ON_ERROR_TYPE = None,
         extra: Any = None,
+        priority: RequestPriority = RequestPriority.normal,
+        weight: int = 1,
     ):
         """"""
         self.method: str = method
@@ -56,6 +74,8 @@ class Request(object):
         self.on_failed: ON_FAILED_TYPE = on_failed
         self.on_error: ON_ERROR_TYPE = on_error
         self.extra: Any = extra
+        self.priority: RequestPriority = priority
+        self.weight: int = weight
 
         self.response: requests.Response = None
         self.status: RequestStatus = RequestStatus.ready
@@ -86,6 +106,51 @@ class Request(object):
         )
 
 
+class RateLimiter(object):
+    """
+    Token bucket allowing limit weight of requests in each interval seconds.
+    """
+
+    def __init__(self, limit: int, interval: float = 1.0):
+        """"""
+        self.limit: int = limit
+        self.rate: float = limit / interval
+
+        self.tokens: float = limit
+        self.update_time: float = perf_counter()
+        self.lock: Lock = Lock()
+
+    def try_acquire(self, weight: int = 1) -> float:
+        """
+        Take tokens of weight if available and return 0, otherwise
+        return seconds to wait before trying again.
+        """
+        weight = min(weight, self.limit)
+
+        with self.lock:
+            now = perf_counter()
+            self.tokens = min(
+                self.limit,
+                self.tokens + (now - self.update_time) * self.rate
+            )
+            self.update_time = now
+
+            if self.tokens >= weight:
+                self.tokens -= weight
+                return 0
+
+            return (weight - self.tokens) / self.rate
+
+    def acquire(self, weight: int = 1) -> None:
+        """
+        Block until tokens of weight are available.
+        """
+        wait = self.try_acquire(weight)
+        while wait:
+            sleep(wait)
+            wait = self.try_acquire(weight)
+
+
 class RestClient(object):
     """
     HTTP Client designed for all sorts of trading RESTFul API.
@@ -93,15 +158,39 @@ class RestClient(object):
     * Reimplement on_failed function to handle Non-2xx responses.
     * Use on_failed parameter in add_request function for individual Non-2xx response handling.
     * Reimplement on_error function to handle exception msg.
+    * Use set_rate_limit function to limit request weight sent per interval.
+
+    Requests are sent by worker threads sharing one keep-alive session.
+    Requests other than GET are put into high priority lane by default,
+    so that order placement is not delayed by query requests.
+
+    Only one worker is started by default, so that requests are signed and
+    sent in order. Set max_workers in subclass to opt in concurrent workers,
+    only if signature is not based on time nonce and order of requests
+    (e.g. place then cancel) does not matter.
     """
 
+    max_workers: int = 1
+
     def __init__(self):
         """"""
         self.url_base: str = ""
         self._active: bool = False
 
-        self._queue: Queue = Queue()
-        self._pool: Pool = None
+        self._queue: PriorityQueue = PriorityQueue()
+        self._count = count()
+        self._threads: List[Thread] = []
+        self._session: requests.Session = None
+
+        self._rate_limiter: Optional[RateLimiter] = None
+        self._weights: Dict[str, int] = {}
+
+        self._stats_lock: Lock = Lock()
+        self._in_flight: int = 0
+        self._latency: Dict[RequestPriority, List[int]] = {
+            priority: [0] * (len(LATENCY_BUCKETS) + 1)
+            for priority in RequestPriority
+        }
 
         self.proxies: dict = None
 
@@ -121,16 +210,44 @@ class RestClient(object):
             proxy = f"http://{proxy_host}:{proxy_port}"
             self.proxies = {"http": proxy, "https": proxy}
 
+    def set_rate_limit(
+        self,
+        limit: int,
+        interval: float = 1.0,
+        weights: Dict[str, int] = None
+    ) -> None:
+        """
+        Limit total weight of requests sent in each interval seconds.
+        :param weights: weight of request for each path, default is 1
+        """
+        self._rate_limiter = RateLimiter(limit, interval)
+
+        if weights:
+            self._weights.update(weights)
+
     def start(self, n: int = 3) -> None:
         """
-        Start rest client with session count n.
+        Start rest client with worker count n, limited by max_workers.
         """
         if self._active:
             return
 
         self._active = True
-        self._pool = Pool(n)
-        self._pool.apply_async(self._run)
+        n = self.get_worker_count(n)
+
+        # All workers share connection pool of one session
+        self._session = requests.session()
+        adapter = HTTPAdapter(pool_connections=n, pool_maxsize=n)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._threads = [Thread(target=self._run, daemon=True) for _ in range(n)]
+        for thread in self._threads:
+            thread.start()
+
+    def get_worker_count(self, n: int) -> int:
+        """"""
+        return max(min(n, self.max_workers), 1)
 
     def stop(self) -> None:
         """
@@ -155,6 +272,8 @@ class RestClient(object):
         on_failed: ON_FAILED_TYPE = None,
         on_error: ON_ERROR_TYPE = None,
         extra: Any = None,
+        priority: RequestPriority = None,
+        weight: int = None,
     ) -> Request:
         """
         Add a new request.
@@ -167,8 +286,19 @@ class RestClient(object):
         :param on_failed: callback function if Non-2xx status, type, type: (code, dict, Request)
         :param on_error: callback function when catching Python exception, type: (etype, evalue, tb, Request)
         :param extra: Any extra data which can be used when handling callback
+        :param priority: high for non-GET request and normal for GET by default
+        :param weight: weight for rate limit, use weight set of path by default
         :return: Request
         """
+        if priority is None:
+            if method == "GET":
+                priority = RequestPriority.normal
+            else:
+                priority = RequestPriority.high
+
+        if weight is None:
+            weight = self._weights.get(path, 1)
+
         request = Request(
             method,
             path,
@@ -179,19 +309,46 @@ class RestClient(object):
             on_failed,
             on_error,
             extra,
+            priority,
+            weight,
         )
-        self._queue.put(request)
+        self._put_request(request)
         return request
 
+    def _put_request(self, request: Request) -> None:
+        """
+        Put request into queue ordered by priority.
+        """
+        self._queue.put((request.priority, next(self._count), request))
+
+    def get_stats(self) -> dict:
+        """
+        Get count of requests in flight and in queue, and latency
+        histogram of each priority with LATENCY_BUCKETS.
+        """
+        with self._stats_lock:
+            latency = {
+                priority.name: list(counts)
+                for priority, counts in self._latency.items()
+            }
+
+            return {
+                "in_flight": self._in_flight,
+                "queue_size": self._queue.qsize(),
+                "latency": latency
+            }
+
     def _run(self) -> None:
         """"""
         try:
-            session = requests.session()
             while self._active:
                 try:
-                    request = self._queue.get(timeout=1)
+                    _, _, request = self._queue.get(timeout=1)
                     try:
-                        self._process_request(request, session)
+                        if self._rate_limiter:
+                            self._rate_limiter.acquire(request.weight)
+
+                        self._send_request(request)
                     finally:
                         self._queue.task_done()
                 except Empty:
@@ -200,6 +357,31 @@ class RestClient(object):
             et, ev, tb = sys.exc_info()
             self.on_error(et, ev, tb, None)
 
+    def _send_request(self, request: Request) -> None:
+        """
+        Process request and record latency statistics.
+        """
+        start = self._on_request_start()
+        try:
+            self._process_request(request, self._session)
+        finally:
+            self._on_request_end(request, start)
+
+    def _on_request_start(self) -> float:
+        """"""
+        with self._stats_lock:
+            self._in_flight += 1
+        return perf_counter()
+
+    def _on_request_end(self, request: Request, start: float) -> None:
+        """"""
+        latency = (perf_counter() - start) * 1000
+        bucket = bisect_left(LATENCY_BUCKETS, latency)
+
+        with self._stats_lock:
+            self._in_flight -= 1
+            self._latency[request.priority][bucket] += 1
+
     def sign(self, request: Request) -> None:
         """
         This function is called before sending any request out.
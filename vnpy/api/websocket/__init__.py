@@ -1 +1,3 @@
 from .websocket_client import WebsocketClient
+from .async_websocket_client import AsyncWebsocketClient
+from .decoder import JsonDecoder, GzipJsonDecoder, DeflateJsonDecoder
@@ -0,0 +1,134 @@
+import asyncio
+import sys
+from concurrent.futures import Future
+
+import aiohttp
+
+from ..async_loop import get_event_loop, run_coroutine
+from .websocket_client import WebsocketClient
+
+
+class AsyncWebsocketClient(WebsocketClient):
+    """
+    WebsocketClient running on the event loop shared by all async api
+    clients, so that many websocket streams cost no extra thread.
+
+    Same callbacks as WebsocketClient are provided, which are called in
+    the event loop thread. Ping is sent with heartbeat of aiohttp every
+    ping_interval seconds, and connection is re-established with
+    exponential backoff after lost.
+    """
+
+    min_reconnect_delay: float = 1
+    max_reconnect_delay: float = 60
+
+    def __init__(self):
+        """"""
+        super().__init__()
+
+        self._loop: asyncio.AbstractEventLoop = None
+        self._client: aiohttp.ClientSession = None
+        self._future: Future = None
+
+    def start(self):
+        """
+        Start the client and on_connected function is called after webscoket
+        is connected succesfully.
+
+        Please don't send packet untill on_connected fucntion is called.
+        """
+        self._active = True
+        self._loop = get_event_loop()
+        self._future = run_coroutine(self._run_async())
+
+    def stop(self):
+        """
+        Stop the client.
+        """
+        self._active = False
+
+        ws = self._ws
+        if ws:
+            run_coroutine(ws.close())
+
+    def join(self):
+        """
+        Wait till the client finishes.
+
+        This function cannot be called from callback function.
+        """
+        if self._future:
+            self._future.result()
+
+    def _send_text(self, text: str):
+        """
+        Send a text string to server.
+        """
+        ws = self._ws
+        if ws:
+            run_coroutine(ws.send_str(text))
+            self._log('sent text: %s', text)
+
+    def _send_binary(self, data: bytes):
+        """
+        Send bytes data to server.
+        """
+        ws = self._ws
+        if ws:
+            run_coroutine(ws.send_bytes(data))
+            self._log('sent binary: %s', data)
+
+    async def _run_async(self):
+        """
+        Keep running till stop is called.
+        """
+        self._client = aiohttp.ClientSession()
+
+        if self.proxy_host and self.proxy_port:
+            proxy = f"http://{self.proxy_host}:{self.proxy_port}"
+        else:
+            proxy = None
+
+        delay = self.min_reconnect_delay
+
+        while self._active:
+            try:
+                self._ws = await self._client.ws_connect(
+                    self.host,
+                    proxy=proxy,
+                    headers=self.header,
+                    heartbeat=self.ping_interval,
+                    ssl=False
+                )
+                delay = self.min_reconnect_delay
+
+                self.on_connected()
+
+                async for msg in self._ws:
+                    if msg.type in {aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY}:
+                        self._process_frame(msg.data)
+                    else:
+                        break
+
+            # Connection failed or lost
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                pass
+
+            # other internal exception raised in on_packet
+            except Exception:
+                et, ev, tb = sys.exc_info()
+                self.on_error(et, ev, tb)
+
+            if self._ws:
+                ws = self._ws
+                self._ws = None
+
+                await ws.close()
+                self.on_disconnected()
+
+            if self._active:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+        await self._client.close()
+        self._client = None
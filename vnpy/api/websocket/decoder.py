@@ -0,0 +1,70 @@
+"""
+Decoders for unpacking data received by websocket client.
+
+orjson is used as json backend if installed, which parses bytes directly
+and is several times faster than json module of stdlib.
+"""
+import json
+import zlib
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+JSON_BACKENDS: Dict[str, Callable] = {"json": json.loads}
+
+if orjson:
+    JSON_BACKENDS["orjson"] = orjson.loads
+    DEFAULT_JSON_BACKEND = "orjson"
+else:
+    DEFAULT_JSON_BACKEND = "json"
+
+
+class JsonDecoder:
+    """
+    Decode json text or bytes.
+    """
+
+    def __init__(self, backend: str = DEFAULT_JSON_BACKEND):
+        """"""
+        self.backend: str = backend
+        self.loads: Callable = JSON_BACKENDS[backend]
+
+    def __call__(self, data: Union[str, bytes]) -> Any:
+        """"""
+        return self.loads(data)
+
+
+class CompressedJsonDecoder(JsonDecoder):
+    """
+    Decompress binary frame before decoding json, text frame is decoded
+    directly. The decompressed bytes are passed to backend without decoding
+    into str.
+    """
+
+    wbits: int = zlib.MAX_WBITS
+
+    def __call__(self, data: Union[str, bytes]) -> Any:
+        """"""
+        if isinstance(data, (bytes, bytearray)):
+            data = zlib.decompress(data, self.wbits)
+        return self.loads(data)
+
+
+class GzipJsonDecoder(CompressedJsonDecoder):
+    """
+    Decoder for gzip compressed frame, e.g. huobi.
+    """
+
+    wbits: int = 31
+
+
+class DeflateJsonDecoder(CompressedJsonDecoder):
+    """
+    Decoder for raw deflate compressed frame, e.g. okex.
+    """
+
+    wbits: int = -zlib.MAX_WBITS
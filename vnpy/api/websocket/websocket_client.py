@@ -1,3 +1,4 @@
+import base64
 import json
 import logging
 import socket
@@ -6,13 +7,15 @@ import sys
 import traceback
 from datetime import datetime
 from threading import Lock, Thread
-from time import sleep
-from typing import Optional
+from time import sleep, time
+from typing import Callable, Optional, TextIO, Union
 
 import websocket
 
 from vnpy.trader.utility import get_file_logger
 
+from .decoder import JsonDecoder
+
 
 class WebsocketClient:
     """
@@ -24,7 +27,8 @@ class WebsocketClient:
     Use stop to stop threads and disconnect websocket before destroying the client
     object (especially when exiting the programme).
 
-    Default serialization format is json.
+    Default serialization format is json, decoded by decoder object.
+    Set decoder to GzipJsonDecoder or DeflateJsonDecoder for compressed frames.
 
     Callbacks to overrides:
     * unpack_data
@@ -36,6 +40,9 @@ class WebsocketClient:
     After start() is called, the ping thread will ping server every 60 seconds.
 
     If you want to send anything other than JSON, override send_packet.
+
+    Set record_data to False to skip recording last sent/received text, and
+    use start_capture to save received frames for replaying in benchmark.
     """
 
     def __init__(self):
@@ -55,10 +62,13 @@ class WebsocketClient:
         self.header = {}
 
         self.logger: Optional[logging.Logger] = None
+        self.decoder: Callable = JsonDecoder()
 
         # For debugging
+        self.record_data: bool = True
         self._last_sent_text = None
         self._last_received_text = None
+        self._capture_file: Optional[TextIO] = None
 
     def init(self,
              host: str,
@@ -67,6 +77,7 @@ class WebsocketClient:
              ping_interval: int = 60,
              header: dict = None,
              log_path: Optional[str] = None,
+             record_data: bool = True,
              ):
         """
         :param host:
@@ -75,8 +86,10 @@ class WebsocketClient:
         :param header:
         :param ping_interval: unit: seconds, type: int
         :param log_path: optional. file to save log.
+        :param record_data: record last sent/received text for debugging.
         """
         self.host = host
+        self.record_data = record_data
         self.ping_interval = ping_interval  # seconds
         if log_path is not None:
             self.logger = get_file_logger(log_path)
@@ -127,9 +140,23 @@ class WebsocketClient:
         override this if you want to send non-json packet
         """
         text = json.dumps(packet)
-        self._record_last_sent_text(text)
+        if self.record_data:
+            self._record_last_sent_text(text)
         return self._send_text(text)
 
+    def start_capture(self, path: str):
+        """
+        Save each received frame into file as one line of json,
+        binary frame is encoded with base64.
+        """
+        self._capture_file = open(path, mode="a", encoding="UTF-8")
+
+    def stop_capture(self):
+        """"""
+        if self._capture_file:
+            self._capture_file.close()
+            self._capture_file = None
+
     def _log(self, msg, *args):
         logger = self.logger
         if logger:
@@ -204,16 +231,7 @@ class WebsocketClient:
                             self._disconnect()
                             continue
 
-                        self._record_last_received_text(text)
-
-                        try:
-                            data = self.unpack_data(text)
-                        except ValueError as e:
-                            print("websocket unable to parse data: " + text)
-                            raise e
-
-                        self._log('recv data: %s', data)
-                        self.on_packet(data)
+                        self._process_frame(text)
                 # ws is closed before recv function is called
                 # For socket.error, see Issue #1608
                 except (
@@ -233,14 +251,43 @@ class WebsocketClient:
             self.on_error(et, ev, tb)
         self._disconnect()
 
-    @staticmethod
-    def unpack_data(data: str):
+    def _process_frame(self, frame: Union[str, bytes]):
+        """
+        Unpack frame received and call on_packet.
+        """
+        if self._capture_file:
+            self._capture_frame(frame)
+
+        if self.record_data:
+            self._record_last_received_text(frame)
+
+        try:
+            data = self.unpack_data(frame)
+        except ValueError as e:
+            print("websocket unable to parse data: " + str(frame))
+            raise e
+
+        if self.logger:
+            self._log('recv data: %s', data)
+        self.on_packet(data)
+
+    def _capture_frame(self, frame: Union[str, bytes]):
+        """"""
+        if isinstance(frame, str):
+            d = {"time": time(), "text": frame}
+        else:
+            d = {"time": time(), "binary": base64.b64encode(frame).decode()}
+
+        self._capture_file.write(json.dumps(d) + "\n")
+
+    def unpack_data(self, data: Union[str, bytes]):
         """
         Default serialization format is json.
 
-        override this method if you want to use other serialization format.
+        override this method or set decoder if you want to use other
+        serialization format.
         """
-        return json.loads(data)
+        return self.decoder(data)
 
     def _run_ping(self):
         """"""
@@ -1,7 +1,7 @@
 from typing import Callable
 from vnpy.app.cta_strategy import (
     BarGenerator,
-    ArrayManager
+    RingArrayManager
 )
 from vnpy.trader.object import (
     TickData,
@@ -143,7 +143,7 @@ class TSMBarGenerator(BarGenerator):
         # Cache last bar object
         self.last_bar = bar
 
-class TSMArrayManager(ArrayManager):
+class TSMArrayManager(RingArrayManager):
     def __init__(self, size=100):
         super().__init__(size)
 
@@ -1,15 +1,21 @@
 from collections import defaultdict
-from datetime import date, datetime, timedelta
-from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
 from itertools import product
 from functools import lru_cache
 from time import time
+import hashlib
+import inspect
+import json
 import multiprocessing
+import os
 import random
+import tempfile
 import traceback
 
 import numpy as np
-from pandas import DataFrame
+from pandas import DataFrame, Timedelta, Timestamp, concat
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from deap import creator, base, tools, algorithms
@@ -19,19 +25,21 @@ from vnpy.trader.constant import (Direction, Offset, Exchange,
                                   Interval, Status)
 from vnpy.trader.database import database_manager
 from vnpy.trader.object import OrderData, TradeData, BarData, TickData
-from vnpy.trader.utility import round_to
+from vnpy.trader.utility import round_to, load_json, save_json
 
 from .base import (
     BacktestingMode,
     EngineType,
     STOPORDER_PREFIX,
     StopOrder,
-    StopOrderStatus,
-    INTERVAL_DELTA_MAP
+    StopOrderStatus
 )
 from .template import CtaTemplate
 
 
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
 # Set deap algo
 creator.create("FitnessMax", base.Fitness, weights=(1.0,))
 creator.create("Individual", list, fitness=creator.FitnessMax)
@@ -120,6 +128,9 @@ class BacktestingEngine:
         self.risk_free: float = 0.02
         self.mode = BacktestingMode.BAR
         self.inverse = False
+        self.columnar = False
+        self.streaming = False
+        self.chunk_days = 30
 
         self.strategy_class = None
         self.strategy = None
@@ -131,6 +142,7 @@ class BacktestingEngine:
         self.days = 0
         self.callback = None
         self.history_data = []
+        self.bar_array: BarArray = None
 
         self.stop_order_count = 0
         self.stop_orders = {}
@@ -184,9 +196,20 @@ class BacktestingEngine:
         end: datetime = None,
         mode: BacktestingMode = BacktestingMode.BAR,
         inverse: bool = False,
-        risk_free: float = 0
+        risk_free: float = 0,
+        columnar: bool = False,
+        streaming: bool = False,
+        chunk_days: int = 30
     ):
-        """"""
+        """
+        Set columnar to True for replaying bar history from arrays
+        (only for bar mode), which produces the same result as
+        default mode with less overhead for each bar.
+
+        Set streaming to True for loading history data by chunk of
+        chunk_days during replay instead of loading all before replay,
+        columnar is not used in streaming mode.
+        """
         self.mode = mode
         self.vt_symbol = vt_symbol
         self.interval = Interval(interval)
@@ -204,6 +227,9 @@ class BacktestingEngine:
         self.mode = mode
         self.inverse = inverse
         self.risk_free = risk_free
+        self.columnar = columnar
+        self.streaming = streaming
+        self.chunk_days = chunk_days
 
     def add_strategy(self, strategy_class: type, setting: dict):
         """"""
@@ -224,24 +250,37 @@ class BacktestingEngine:
             return
 
         self.history_data.clear()       # Clear previously loaded history data
+        self.bar_array = None
 
-        # Load 30 days of data each time and allow for progress update
-        total_days = (self.end - self.start).days
-        progress_days = int(total_days / 10)
-        progress_delta = timedelta(days=progress_days)
-        interval_delta = INTERVAL_DELTA_MAP[self.interval]
+        # Data will be loaded during replay in streaming mode
+        if self.streaming:
+            self.output("流式回放模式，历史数据将在回放时分段加载")
+            return
 
-        start = self.start
-        end = self.start + progress_delta
-        progress = 0
+        # Bar data is loaded as DataFrame in columnar mode
+        columnar = self.columnar and self.mode == BacktestingMode.BAR
+        frames = []
 
-        while start < self.end:
+        # Load 1/10 of data each time and allow for progress update
+        total_days = (self.end - self.start).days
+        progress_delta = timedelta(days=max(int(total_days / 10), 1))
+        ranges = split_ranges(self.start, self.end, progress_delta)
+
+        for n, (start, end) in enumerate(ranges):
+            progress = n / len(ranges)
             progress_bar = "#" * int(progress * 10 + 1)
             self.output(f"加载进度：{progress_bar} [{progress:.0%}]")
 
-            end = min(end, self.end)  # Make sure end time stays within set range
-
-            if self.mode == BacktestingMode.BAR:
+            if columnar:
+                df = load_bar_frame(
+                    self.symbol,
+                    self.exchange,
+                    self.interval,
+                    start,
+                    end
+                )
+                frames.append(df)
+            elif self.mode == BacktestingMode.BAR:
                 data = load_bar_data(
                     self.symbol,
                     self.exchange,
@@ -249,6 +288,7 @@ class BacktestingEngine:
                     start,
                     end
                 )
+                self.history_data.extend(data)
             else:
                 data = load_tick_data(
                     self.symbol,
@@ -256,19 +296,45 @@ class BacktestingEngine:
                     start,
                     end
                 )
+                self.history_data.extend(data)
+
+        # Convert bar data into columnar arrays
+        if columnar:
+            self.bar_array = BarArray()
+            self.bar_array.set_info(self.symbol, self.exchange, self.interval, "DB")
+
+            if frames:
+                self.bar_array.set_frame(concat(frames, ignore_index=True))
+
+            self.output(f"历史数据加载完成，数据量：{len(self.bar_array)}")
+        else:
+            self.output(f"历史数据加载完成，数据量：{len(self.history_data)}")
 
-            self.history_data.extend(data)
+    def get_bar_array(self) -> "BarArray":
+        """
+        Return bar history in columnar arrays, load data if not loaded yet.
+        """
+        if self.bar_array:
+            return self.bar_array
 
-            progress += progress_days / total_days
-            progress = min(progress, 1)
+        if not self.history_data:
+            self.load_data()
 
-            start = end + interval_delta
-            end += progress_delta
+        if self.bar_array:
+            return self.bar_array
 
-        self.output(f"历史数据加载完成，数据量：{len(self.history_data)}")
+        return BarArray(self.history_data)
 
     def run_backtesting(self):
         """"""
+        if self.streaming:
+            self.run_streaming_backtesting()
+            return
+
+        if self.columnar and self.mode == BacktestingMode.BAR:
+            self.run_columnar_backtesting()
+            return
+
         if self.mode == BacktestingMode.BAR:
             func = self.new_bar
         else:
@@ -328,6 +394,187 @@ class BacktestingEngine:
         self.strategy.on_stop()
         self.output("历史数据回放结束")
 
+    def iter_history_data(self) -> Iterator[list]:
+        """
+        Yield history data by chunk of chunk_days from database. The next
+        chunk is loaded in background thread during replay of current one.
+        """
+        chunk_delta = timedelta(days=self.chunk_days)
+        ranges = split_ranges(self.start, self.end, chunk_delta)
+
+        if self.mode == BacktestingMode.BAR:
+            def load_func(start: datetime, end: datetime):
+                return database_manager.load_bar_data(
+                    self.symbol, self.exchange, self.interval, start, end
+                )
+        else:
+            def load_func(start: datetime, end: datetime):
+                return database_manager.load_tick_data(
+                    self.symbol, self.exchange, start, end
+                )
+
+        for n, data in enumerate(iter_prefetched(load_func, ranges)):
+            progress = (n + 1) / len(ranges)
+            progress_bar = "=" * int(progress * 10)
+            self.output(f"回放进度：{progress_bar} [{progress:.0%}]")
+
+            yield data
+
+    def run_streaming_backtesting(self):
+        """
+        Replay history data chunk by chunk, result is the same as
+        running after loading all data.
+        """
+        if self.mode == BacktestingMode.BAR:
+            func = self.new_bar
+        else:
+            func = self.new_tick
+
+        self.strategy.on_init()
+
+        # Use the first [days] of history data for initializing strategy
+        day_count = 1
+        inited = False
+        data = None
+
+        for chunk in self.iter_history_data():
+            for data in chunk:
+                if not inited:
+                    if self.datetime and data.datetime.day != self.datetime.day:
+                        day_count += 1
+                        if day_count >= self.days:
+                            inited = True
+                            self.start_replay()
+
+                if not inited:
+                    self.datetime = data.datetime
+
+                    try:
+                        self.callback(data)
+                    except Exception:
+                        self.output("触发异常，回测终止")
+                        self.output(traceback.format_exc())
+                        return
+                    continue
+
+                try:
+                    func(data)
+                except Exception:
+                    self.output("触发异常，回测终止")
+                    self.output(traceback.format_exc())
+                    return
+
+        # Same as loading all data, the last one is replayed if all
+        # history data is used for initializing
+        if not inited:
+            self.start_replay()
+
+            if not data:
+                self.output("历史数据不足，回测终止")
+                return
+
+            try:
+                func(data)
+            except Exception:
+                self.output("触发异常，回测终止")
+                self.output(traceback.format_exc())
+                return
+
+        self.strategy.on_stop()
+        self.output("历史数据回放结束")
+
+    def start_replay(self):
+        """
+        Start strategy trading after initialization.
+        """
+        self.strategy.inited = True
+        self.output("策略初始化完成")
+
+        self.strategy.on_start()
+        self.strategy.trading = True
+        self.output("开始回放历史数据")
+
+    def run_columnar_backtesting(self):
+        """
+        Replay bar history from columnar arrays.
+
+        Strategy receives BarView objects instead of BarData, order
+        matching is skipped if no active order, and daily close prices
+        are calculated once after replay.
+        """
+        bar_array = self.bar_array
+        if not bar_array:
+            self.output("历史数据不足，回测终止")
+            return
+
+        days = bar_array.days
+        size = len(bar_array)
+
+        self.strategy.on_init()
+
+        # Use the first [days] of history data for initializing strategy
+        day_count = 1
+        ix = 0
+
+        for ix in range(size):
+            if ix and days[ix] != days[ix - 1]:
+                day_count += 1
+                if day_count >= self.days:
+                    break
+
+            self.datetime = bar_array.get_datetime(ix)
+
+            try:
+                self.callback(BarView(bar_array, ix))
+            except Exception:
+                self.output("触发异常，回测终止")
+                self.output(traceback.format_exc())
+                return
+
+        self.strategy.inited = True
+        self.output("策略初始化完成")
+
+        self.strategy.on_start()
+        self.strategy.trading = True
+        self.output("开始回放历史数据")
+
+        # Use the rest of history data for running backtesting
+        start_ix = ix
+        total_size = size - start_ix
+        batch_size = max(int(total_size / 10), 1)
+
+        strategy = self.strategy
+        end_ix = start_ix
+
+        for batch, i in enumerate(range(start_ix, size, batch_size)):
+            for ix in range(i, min(i + batch_size, size)):
+                bar = BarView(bar_array, ix)
+                self.bar = bar
+                self.datetime = bar_array.get_datetime(ix)
+
+                try:
+                    if self.active_limit_orders:
+                        self.cross_limit_order()
+                    if self.active_stop_orders:
+                        self.cross_stop_order()
+                    strategy.on_bar(bar)
+                except Exception:
+                    self.update_daily_closes(start_ix, end_ix)
+                    self.output("触发异常，回测终止")
+                    self.output(traceback.format_exc())
+                    return
+
+                end_ix = ix + 1
+
+            progress = min(batch / 10, 1)
+            progress_bar = "=" * (batch + 1)
+            self.output(f"回放进度：{progress_bar} [{progress:.0%}]")
+
+        self.update_daily_closes(start_ix, end_ix)
+
+        self.strategy.on_stop()
+        self.output("历史数据回放结束")
+
     def calculate_result(self):
         """"""
         self.output("开始计算逐日盯市盈亏")
@@ -667,30 +914,54 @@ class BacktestingEngine:
         # Use multiprocessing pool for running backtesting with different setting
         # Force to use spawn method to create new process (instead of fork on Linux)
         ctx = multiprocessing.get_context("spawn")
-        pool = ctx.Pool(multiprocessing.cpu_count())
 
-        results = []
-        for setting in settings:
-            result = (pool.apply_async(optimize, (
-                target_name,
-                self.strategy_class,
-                setting,
-                self.vt_symbol,
-                self.interval,
-                self.start,
-                self.rate,
-                self.slippage,
-                self.size,
-                self.pricetick,
-                self.capital,
-                self.end,
-                self.mode,
-                self.inverse
-            )))
-            results.append(result)
+        # In bar mode, history data is loaded once and shared to workers
+        if self.mode == BacktestingMode.BAR:
+            context = self.get_optimize_context(target_name)
+            shared_array = context["shared_array"]
 
-        pool.close()
-        pool.join()
+            pool = ctx.Pool(
+                multiprocessing.cpu_count(),
+                initializer=init_optimize_worker,
+                initargs=(context,)
+            )
+
+            try:
+                results = [
+                    pool.apply_async(optimize_shared, (setting,))
+                    for setting in settings
+                ]
+
+                pool.close()
+                pool.join()
+            finally:
+                pool.terminate()
+                shared_array.close()
+        else:
+            pool = ctx.Pool(multiprocessing.cpu_count())
+
+            results = []
+            for setting in settings:
+                result = (pool.apply_async(optimize, (
+                    target_name,
+                    self.strategy_class,
+                    setting,
+                    self.vt_symbol,
+                    self.interval,
+                    self.start,
+                    self.rate,
+                    self.slippage,
+                    self.size,
+                    self.pricetick,
+                    self.capital,
+                    self.end,
+                    self.mode,
+                    self.inverse
+                )))
+                results.append(result)
+
+            pool.close()
+            pool.join()
 
         # Sort results and output
         result_values = [result.get() for result in results]
@@ -703,11 +974,75 @@ class BacktestingEngine:
 
         return result_values
 
-    def run_ga_optimization(self, optimization_setting: OptimizationSetting, population_size=100, ngen_size=30, output=True):
-        """"""
-        # Clear lru_cache before running ga optimization
-        _ga_optimize.cache_clear()
+    def get_optimize_context(self, target_name: str) -> dict:
+        """
+        Generate context for initializing optimization worker process.
+        In bar mode, history data is loaded once and shared to workers.
+        """
+        context = {
+            "target_name": target_name,
+            "strategy_class": self.strategy_class,
+            "parameters": {
+                "vt_symbol": self.vt_symbol,
+                "interval": self.interval,
+                "start": self.start,
+                "rate": self.rate,
+                "slippage": self.slippage,
+                "size": self.size,
+                "pricetick": self.pricetick,
+                "capital": self.capital,
+                "end": self.end,
+                "mode": self.mode,
+                "inverse": self.inverse,
+                "risk_free": self.risk_free
+            }
+        }
+
+        if self.mode == BacktestingMode.BAR:
+            bar_array = self.get_bar_array()
+            context["shared_array"] = SharedBarArray(bar_array)
+            context["parameters"]["columnar"] = True
+
+        return context
+
+    def get_ga_cache_key(self, target_name: str) -> str:
+        """
+        Generate key of ga fitness cache from strategy source code,
+        history data range and backtesting costs.
+        """
+        try:
+            source = inspect.getsource(inspect.getmodule(self.strategy_class))
+        except (OSError, TypeError):
+            source = self.strategy_class.__qualname__
+
+        values = (
+            hashlib.md5(source.encode("UTF-8")).hexdigest(),
+            self.strategy_class.__name__,
+            target_name,
+            self.vt_symbol,
+            self.interval.value if self.interval else "",
+            str(self.start),
+            str(self.end),
+            self.mode.value,
+            self.rate,
+            self.slippage,
+            self.size,
+            self.pricetick,
+            self.capital,
+            self.inverse,
+            self.risk_free
+        )
+        return hashlib.md5(repr(values).encode("UTF-8")).hexdigest()
 
+    def run_ga_optimization(
+        self,
+        optimization_setting: OptimizationSetting,
+        population_size=100,
+        ngen_size=30,
+        output=True,
+        use_cache=True
+    ):
+        """"""
         # Get optimization setting and target
         settings = optimization_setting.generate_setting_ga()
         target_name = optimization_setting.target_name
@@ -734,36 +1069,40 @@ class BacktestingEngine:
                     individual[i] = paramlist[i]
             return individual,
 
-        # Create ga object function
-        global ga_target_name
-        global ga_strategy_class
-        global ga_setting
-        global ga_vt_symbol
-        global ga_interval
-        global ga_start
-        global ga_rate
-        global ga_slippage
-        global ga_size
-        global ga_pricetick
-        global ga_capital
-        global ga_end
-        global ga_mode
-        global ga_inverse
-
-        ga_target_name = target_name
-        ga_strategy_class = self.strategy_class
-        ga_setting = settings[0]
-        ga_vt_symbol = self.vt_symbol
-        ga_interval = self.interval
-        ga_start = self.start
-        ga_rate = self.rate
-        ga_slippage = self.slippage
-        ga_size = self.size
-        ga_pricetick = self.pricetick
-        ga_capital = self.capital
-        ga_end = self.end
-        ga_mode = self.mode
-        ga_inverse = self.inverse
+        # Fitness of settings already scored is loaded from cache file
+        cache = GaFitnessCache(self.get_ga_cache_key(target_name), use_cache)
+        cached_size = len(cache)
+
+        # Worker processes are initialized with explicit context
+        ctx = multiprocessing.get_context("spawn")
+        context = self.get_optimize_context(target_name)
+        shared_array = context.get("shared_array", None)
+
+        pool = ctx.Pool(
+            multiprocessing.cpu_count(),
+            initializer=init_optimize_worker,
+            initargs=(context,)
+        )
+
+        def evaluate_population(evaluate: Callable, individuals: list) -> list:
+            """
+            Evaluate each distinct setting not found in cache with pool,
+            the whole batch of individuals is given by algorithms.
+            """
+            keys = [GaFitnessCache.get_setting_key(dict(ind)) for ind in individuals]
+
+            missing = {}
+            for key, individual in zip(keys, individuals):
+                if key not in cache and key not in missing:
+                    missing[key] = dict(individual)
+
+            if missing:
+                values = pool.map(evaluate, missing.values())
+                for key, value in zip(missing.keys(), values):
+                    cache[key] = value
+                cache.save()
+
+            return [(cache[key],) for key in keys]
 
         # Set up genetic algorithm
         toolbox = base.Toolbox()
@@ -772,6 +1111,7 @@ class BacktestingEngine:
         toolbox.register("mate", tools.cxTwoPoint)
         toolbox.register("mutate", mutate_individual, indpb=1)
         toolbox.register("evaluate", ga_optimize)
+        toolbox.register("map", evaluate_population)
         toolbox.register("select", tools.selNSGA2)
 
         total_size = len(settings)
@@ -793,10 +1133,6 @@ class BacktestingEngine:
         stats.register("min", np.min, axis=0)
         stats.register("max", np.max, axis=0)
 
-        # Multiprocessing is not supported yet.
-        # pool = multiprocessing.Pool(multiprocessing.cpu_count())
-        # toolbox.register("map", pool.map)
-
         # Run ga optimization
         self.output(f"参数优化空间：{total_size}")
         self.output(f"每代族群总数：{pop_size}")
@@ -804,32 +1140,41 @@ class BacktestingEngine:
         self.output(f"迭代次数：{ngen}")
         self.output(f"交叉概率：{cxpb:.0%}")
         self.output(f"突变概率：{mutpb:.0%}")
+        self.output(f"缓存结果数：{cached_size}")
 
         start = time()
 
-        algorithms.eaMuPlusLambda(
-            pop,
-            toolbox,
-            mu,
-            lambda_,
-            cxpb,
-            mutpb,
-            ngen,
-            stats,
-            halloffame=hof
-        )
+        try:
+            algorithms.eaMuPlusLambda(
+                pop,
+                toolbox,
+                mu,
+                lambda_,
+                cxpb,
+                mutpb,
+                ngen,
+                stats,
+                halloffame=hof
+            )
+
+            pool.close()
+            pool.join()
+        finally:
+            pool.terminate()
+            if shared_array:
+                shared_array.close()
 
         end = time()
         cost = int((end - start))
 
-        self.output(f"遗传算法优化完成，耗时{cost}秒")
+        self.output(f"遗传算法优化完成，耗时{cost}秒，新增计算{len(cache) - cached_size}次")
 
         # Return result list
         results = []
 
         for parameter_values in hof:
             setting = dict(parameter_values)
-            target_value = ga_optimize(parameter_values)[0]
+            target_value = cache[GaFitnessCache.get_setting_key(setting)]
             results.append((setting, target_value, {}))
 
         return results
@@ -844,6 +1189,27 @@ class BacktestingEngine:
         else:
             self.daily_results[d] = DailyResult(d, price)
 
+    def update_daily_closes(self, start_ix: int, end_ix: int):
+        """
+        Update daily close price with the last bar of each day
+        in columnar bar array.
+        """
+        days = self.bar_array.days[start_ix:end_ix]
+        if not len(days):
+            return
+
+        closes = self.bar_array.close_price[start_ix:end_ix]
+        last_ixs = np.append(np.flatnonzero(np.diff(days)), len(days) - 1)
+
+        for day, close_price in zip(days[last_ixs].tolist(), closes[last_ixs].tolist()):
+            d = date.fromordinal(day)
+
+            daily_result = self.daily_results.get(d, None)
+            if daily_result:
+                daily_result.close_price = close_price
+            else:
+                self.daily_results[d] = DailyResult(d, close_price)
+
     def new_bar(self, bar: BarData):
         """"""
         self.bar = bar
@@ -1303,6 +1669,285 @@ class DailyResult:
         self.net_pnl = self.total_pnl - self.commission - self.slippage
 
 
+class BarArray:
+    """
+    Bar history of one contract stored as columnar arrays.
+
+    Datetime is kept as int64 microseconds from epoch (UTC for datetime
+    with tzinfo), and datetime object is only created for bar replayed.
+    """
+
+    def __init__(self, bars: List[BarData] = None):
+        """"""
+        self.size: int = 0
+        self.symbol: str = ""
+        self.exchange: Exchange = None
+        self.interval: Interval = None
+        self.gateway_name: str = ""
+        self.vt_symbol: str = ""
+        self.tz: tzinfo = None
+
+        if not bars:
+            bars = []
+        else:
+            bar = bars[0]
+            self.set_info(bar.symbol, bar.exchange, bar.interval, bar.gateway_name)
+            self.tz = bar.datetime.tzinfo
+
+        epoch = self.get_epoch()
+
+        self.set_data(
+            np.array([(bar.datetime - epoch) // MICROSECOND for bar in bars], dtype=np.int64),
+            np.array([bar.datetime.toordinal() for bar in bars], dtype=np.int64),
+            np.array([bar.open_price for bar in bars], dtype=float),
+            np.array([bar.high_price for bar in bars], dtype=float),
+            np.array([bar.low_price for bar in bars], dtype=float),
+            np.array([bar.close_price for bar in bars], dtype=float),
+            np.array([bar.volume for bar in bars], dtype=float),
+            np.array([bar.open_interest for bar in bars], dtype=float),
+        )
+
+    def set_info(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        interval: Interval,
+        gateway_name: str
+    ):
+        """"""
+        self.symbol = symbol
+        self.exchange = exchange
+        self.interval = interval
+        self.gateway_name = gateway_name
+        self.vt_symbol = f"{symbol}.{exchange.value}"
+
+    def set_data(
+        self,
+        timestamps: np.ndarray,
+        days: np.ndarray,
+        open_price: np.ndarray,
+        high_price: np.ndarray,
+        low_price: np.ndarray,
+        close_price: np.ndarray,
+        volume: np.ndarray,
+        open_interest: np.ndarray
+    ):
+        """
+        Arrays are used without copy, so that memory-mapped arrays are
+        shared by all worker processes.
+        """
+        self.size = len(timestamps)
+        self.timestamps: np.ndarray = timestamps
+        self.days: np.ndarray = days
+
+        self.open_price: np.ndarray = open_price
+        self.high_price: np.ndarray = high_price
+        self.low_price: np.ndarray = low_price
+        self.close_price: np.ndarray = close_price
+        self.volume: np.ndarray = volume
+        self.open_interest: np.ndarray = open_interest
+
+    def set_frame(self, df: DataFrame):
+        """
+        Set data from DataFrame returned by database_manager.load_bar_frame.
+        """
+        dts = df["datetime"]
+        self.tz = dts.dt.tz
+
+        timestamps = (dts - Timestamp(EPOCH, tz="UTC")) // Timedelta(microseconds=1)
+
+        local_dates = dts.dt.tz_localize(None).dt.normalize()
+        days = (local_dates - Timestamp(EPOCH)).dt.days + EPOCH.toordinal()
+
+        self.set_data(
+            timestamps.to_numpy(dtype=np.int64),
+            days.to_numpy(dtype=np.int64),
+            df["open_price"].to_numpy(),
+            df["high_price"].to_numpy(),
+            df["low_price"].to_numpy(),
+            df["close_price"].to_numpy(),
+            df["volume"].to_numpy(),
+            df["open_interest"].to_numpy(),
+        )
+
+    def get_epoch(self) -> datetime:
+        """"""
+        if self.tz:
+            return EPOCH.replace(tzinfo=timezone.utc)
+        return EPOCH
+
+    def get_datetime(self, ix: int) -> datetime:
+        """
+        Create datetime of bar at index.
+        """
+        dt = self.get_epoch() + timedelta(microseconds=int(self.timestamps[ix]))
+        if self.tz:
+            dt = dt.astimezone(self.tz)
+        return dt
+
+    def __len__(self):
+        """"""
+        return self.size
+
+    def __bool__(self):
+        """"""
+        return bool(self.size)
+
+
+class SharedBarArray:
+    """
+    BarArray stored in a memory-mapped file, which can be attached by
+    optimization worker processes without reloading from database.
+
+    File contains timestamps and days as int64, followed by six price
+    and volume columns as float.
+    """
+
+    def __init__(self, bar_array: BarArray):
+        """
+        Write bar array into a temporary file, only called in parent process.
+        """
+        self.size: int = bar_array.size
+        self.tz: tzinfo = bar_array.tz
+        self.info: tuple = (
+            bar_array.symbol,
+            bar_array.exchange,
+            bar_array.interval,
+            bar_array.gateway_name
+        )
+
+        fd, self.path = tempfile.mkstemp(prefix="vnpy_bar_", suffix=".dat")
+        os.close(fd)
+
+        int_data, float_data = self.map("w+")
+        int_data[0, :self.size] = bar_array.timestamps
+        int_data[1, :self.size] = bar_array.days
+        float_data[0, :self.size] = bar_array.open_price
+        float_data[1, :self.size] = bar_array.high_price
+        float_data[2, :self.size] = bar_array.low_price
+        float_data[3, :self.size] = bar_array.close_price
+        float_data[4, :self.size] = bar_array.volume
+        float_data[5, :self.size] = bar_array.open_interest
+        int_data.flush()
+        float_data.flush()
+        del int_data, float_data
+
+    def map(self, mode: str) -> Tuple[np.ndarray, np.ndarray]:
+        """"""
+        count = max(self.size, 1)
+
+        int_data = np.memmap(self.path, dtype=np.int64, mode=mode, shape=(2, count))
+        float_data = np.memmap(
+            self.path,
+            dtype=float,
+            mode="r+" if mode == "w+" else mode,
+            offset=int_data.nbytes,
+            shape=(6, count)
+        )
+        return int_data, float_data
+
+    def attach(self) -> BarArray:
+        """
+        Map the file and return bar array, called in worker process.
+        """
+        int_data, float_data = self.map("r")
+
+        bar_array = BarArray()
+        bar_array.set_info(*self.info)
+        bar_array.tz = self.tz
+        bar_array.set_data(
+            *int_data[:, :self.size],
+            *float_data[:, :self.size]
+        )
+        return bar_array
+
+    def close(self):
+        """
+        Remove the file, called in parent process after all workers exit.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class BarView:
+    """
+    Read-only view of one bar in BarArray, with the same fields as BarData.
+    """
+
+    __slots__ = ("_array", "_ix")
+
+    def __init__(self, array: BarArray, ix: int):
+        """"""
+        self._array: BarArray = array
+        self._ix: int = ix
+
+    @property
+    def symbol(self) -> str:
+        return self._array.symbol
+
+    @property
+    def exchange(self) -> Exchange:
+        return self._array.exchange
+
+    @property
+    def vt_symbol(self) -> str:
+        return self._array.vt_symbol
+
+    @property
+    def interval(self) -> Interval:
+        return self._array.interval
+
+    @property
+    def gateway_name(self) -> str:
+        return self._array.gateway_name
+
+    @property
+    def datetime(self) -> datetime:
+        return self._array.get_datetime(self._ix)
+
+    @property
+    def open_price(self) -> float:
+        return self._array.open_price[self._ix]
+
+    @property
+    def high_price(self) -> float:
+        return self._array.high_price[self._ix]
+
+    @property
+    def low_price(self) -> float:
+        return self._array.low_price[self._ix]
+
+    @property
+    def close_price(self) -> float:
+        return self._array.close_price[self._ix]
+
+    @property
+    def volume(self) -> float:
+        return self._array.volume[self._ix]
+
+    @property
+    def open_interest(self) -> float:
+        return self._array.open_interest[self._ix]
+
+    def to_bar(self) -> BarData:
+        """
+        Create BarData object with same data.
+        """
+        return BarData(
+            symbol=self.symbol,
+            exchange=self.exchange,
+            datetime=self.datetime,
+            interval=self.interval,
+            volume=self.volume,
+            open_interest=self.open_interest,
+            open_price=self.open_price,
+            high_price=self.high_price,
+            low_price=self.low_price,
+            close_price=self.close_price,
+            gateway_name=self.gateway_name
+        )
+
+
 def optimize(
     target_name: str,
     strategy_class: CtaTemplate,
@@ -1348,33 +1993,139 @@ def optimize(
     return (str(setting), target_value, statistics, result_df)
 
 
-@lru_cache(maxsize=1000000)
-def _ga_optimize(parameter_values: tuple):
-    """"""
-    setting = dict(parameter_values)
-
-    result = optimize(
-        ga_target_name,
-        ga_strategy_class,
-        setting,
-        ga_vt_symbol,
-        ga_interval,
-        ga_start,
-        ga_rate,
-        ga_slippage,
-        ga_size,
-        ga_pricetick,
-        ga_capital,
-        ga_end,
-        ga_mode,
-        ga_inverse
-    )
-    return (result[1],)
+def iter_prefetched(func: Callable, args_list: Sequence[tuple]) -> Iterator:
+    """
+    Yield func result of each args in order, calling func with the next
+    args in background thread while current result is being consumed.
+    """
+    if not args_list:
+        return
 
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(func, *args_list[0])
 
-def ga_optimize(parameter_values: list):
-    """"""
-    return _ga_optimize(tuple(parameter_values))
+        for args in args_list[1:]:
+            result = future.result()
+            future = executor.submit(func, *args)
+            yield result
+
+        yield future.result()
+
+
+def split_ranges(
+    start: datetime,
+    end: datetime,
+    delta: timedelta
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Split [start, end] into ranges of delta for loading from database.
+
+    Ranges are contiguous: since database query includes both ends, each
+    range ends 1 microsecond before the start of the next one, so that no
+    data is dropped between ranges whatever the size of delta.
+    """
+    ranges = []
+
+    while start < end:
+        range_end = min(start + delta, end)
+        if range_end < end:
+            ranges.append((start, range_end - MICROSECOND))
+        else:
+            ranges.append((start, range_end))
+        start = range_end
+
+    return ranges
+
+
+# Context of optimization worker process
+optimize_context: dict = {}
+
+
+def init_optimize_worker(context: dict):
+    """
+    Initialize worker process with strategy class and shared history,
+    which are kept for all following tasks.
+    """
+    optimize_context.update(context)
+
+    shared_array = optimize_context.pop("shared_array", None)
+    if shared_array:
+        optimize_context["bar_array"] = shared_array.attach()
+
+
+def optimize_shared(setting: dict):
+    """
+    Function for running in multiprocessing.pool with shared history.
+    """
+    engine = BacktestingEngine()
+    engine.set_parameters(**optimize_context["parameters"])
+    engine.add_strategy(optimize_context["strategy_class"], setting)
+
+    if "bar_array" in optimize_context:
+        engine.bar_array = optimize_context["bar_array"]
+    else:
+        engine.load_data()
+
+    engine.run_backtesting()
+
+    result_df = engine.calculate_result()
+    statistics = engine.calculate_statistics(output=False)
+
+    target_value = statistics[optimize_context["target_name"]]
+    return (str(setting), target_value, statistics, result_df)
+
+
+def ga_optimize(setting: dict) -> float:
+    """
+    Function for evaluating ga individual in multiprocessing.pool.
+    """
+    result = optimize_shared(setting)
+    return float(result[1])
+
+
+class GaFitnessCache:
+    """
+    Fitness of ga individuals, persisted in json file and keyed by
+    strategy source, history data range and backtesting costs.
+    """
+
+    filename: str = "cta_ga_cache.json"
+
+    def __init__(self, key: str, persist: bool = True):
+        """"""
+        self.key: str = key
+        self.persist: bool = persist
+        self.values: Dict[str, float] = {}
+
+        if persist:
+            data = load_json(self.filename)
+            self.values = data.get(key, {})
+
+    @staticmethod
+    def get_setting_key(setting: dict) -> str:
+        """"""
+        return json.dumps(setting, sort_keys=True)
+
+    def save(self):
+        """"""
+        if not self.persist:
+            return
+
+        data = load_json(self.filename)
+        data[self.key] = self.values
+        save_json(self.filename, data)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.values
+
+    def __getitem__(self, key: str) -> float:
+        return self.values[key]
+
+    def __setitem__(self, key: str, value: float):
+        self.values[key] = value
+
+    def __len__(self) -> int:
+        return len(self.values)
 
 
 @lru_cache(maxsize=999)
@@ -1391,6 +2142,20 @@ def load_bar_data(
     )
 
 
+@lru_cache(maxsize=999)
+def load_bar_frame(
+    symbol: str,
+    exchange: Exchange,
+    interval: Interval,
+    start: datetime,
+    end: datetime
+):
+    """"""
+    return database_manager.load_bar_frame(
+        symbol, exchange, interval, start, end
+    )
+
+
 @lru_cache(maxsize=999)
 def load_tick_data(
     symbol: str,
@@ -1403,18 +2168,3 @@ def load_tick_data(
         symbol, exchange, start, end
     )
 
-
-# GA related global value
-ga_end = None
-ga_mode = None
-ga_target_name = None
-ga_strategy_class = None
-ga_setting = None
-ga_vt_symbol = None
-ga_interval = None
-ga_start = None
-ga_rate = None
-ga_slippage = None
-ga_size = None
-ga_pricetick = None
-ga_capital = None
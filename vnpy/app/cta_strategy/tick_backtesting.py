@@ -28,6 +28,7 @@ from .base import (
 )
 #from vnpy.app.portfolio_strategy.template import StrategyTemplate
 from .template import CtaTemplate
+from .backtesting import iter_prefetched
 
 
 # 排队初始量
@@ -112,6 +113,7 @@ class BacktestingEngine:
 
         self.callback = None
         self.history_data = []
+        self.streaming = False
 
         self.limit_order_count = 0
         self.limit_orders = {}
@@ -160,10 +162,14 @@ class BacktestingEngine:
         size,
         pricetick,
         capital = 0,
-        end = None
+        end = None,
+        streaming: bool = False
     ):
-        """"""
-        
+        """
+        Set streaming to True for loading tick data by chunk during
+        replay instead of loading all before replay.
+        """
+
         self.vt_symbol = vt_symbol
         self.rate = rate
         self.slippage = slippage
@@ -176,6 +182,7 @@ class BacktestingEngine:
 
         self.capital = capital
         self.end = end
+        self.streaming = streaming
 
     def add_strategy(self, strategy_class: type, setting: dict):
         """"""
@@ -204,30 +211,62 @@ class BacktestingEngine:
 
         self.history_data.clear()       # Clear previously loaded history data
 
+        # Data will be loaded during replay in streaming mode
+        if self.streaming:
+            self.output("流式回放模式，历史数据将在回放时分段加载")
+            return
+
+        ranges = self.get_load_ranges()
+
+        for n, (start, end) in enumerate(ranges):
+            data = load_tick_data(self.symbol, self.exchange, start, end, self.symbol)
+            self.history_data.extend(data)
+
+            progress = (n + 1) / len(ranges)
+            progress_bar = "#" * int(progress * 10)
+            self.output(f"加载进度：{progress_bar} [{progress:.0%}]")
+
+        self.output(f"历史数据加载完成，{self.symbol}数据量：{len(self.history_data)}")
+
+    def get_load_ranges(self) -> list:
+        """
+        Split backtesting period into (start, end) ranges for loading data.
+        """
         # 每次循环读一天，时间向后递推1秒，再读下一天
         progress_delta = timedelta(hours=8)
-        total_delta = self.end - self.start
         interval_delta = timedelta(seconds=1)
 
+        ranges = []
         start = self.start
         end = self.start + progress_delta
-        progress = 0
 
         while start < self.end:
             end = min(end, self.end)  # Make sure end time stays within set range
-
-            data = load_tick_data(self.symbol, self.exchange, start, end, self.symbol)
-            self.history_data.extend(data)
-
-            progress += progress_delta / total_delta
-            progress = min(progress, 1)
-            progress_bar = "#" * int(progress * 10)
-            self.output(f"加载进度：{progress_bar} [{progress:.0%}]")
+            ranges.append((start, end))
 
             start = end + interval_delta
             end += (progress_delta + interval_delta)
 
-        self.output(f"历史数据加载完成，{self.symbol}数据量：{len(self.history_data)}")
+        return ranges
+
+    def iter_history_data(self):
+        """
+        Yield tick data by chunk from database. The next chunk is loaded
+        in background thread during replay of current one.
+        """
+        ranges = self.get_load_ranges()
+
+        def load_func(start: datetime, end: datetime):
+            return database_manager.load_tick_data(
+                self.symbol, self.exchange, start, end, self.symbol
+            )
+
+        for n, data in enumerate(iter_prefetched(load_func, ranges)):
+            progress = (n + 1) / len(ranges)
+            progress_bar = "=" * int(progress * 10)
+            self.output(f"回放进度：{progress_bar} [{progress:.0%}]")
+
+            yield data
 
     def run_backtesting(self):
 
@@ -239,18 +278,19 @@ class BacktestingEngine:
         self.strategy.trading = True
         self.output("开始回放历史数据")
 
-        data_index = 0
-        while data_index < len(self.history_data):
-            
-            data = self.history_data[data_index]
-
-            try:
-                self.new_tick(data)
-                data_index += 1
-            except Exception:
-                self.output("推送tick时触发异常，回测终止")
-                self.output(traceback.format_exc())
-                return
+        if self.streaming:
+            chunks = self.iter_history_data()
+        else:
+            chunks = [self.history_data]
+
+        for chunk in chunks:
+            for data in chunk:
+                try:
+                    self.new_tick(data)
+                except Exception:
+                    self.output("推送tick时触发异常，回测终止")
+                    self.output(traceback.format_exc())
+                    return
 
         self.output("历史数据回放结束")
         self.output(f"见价成交数量：{self.price_trade_count}  排队成交数量：{self.volume_trade_count}")
@@ -1,5 +1,6 @@
 import csv
 from datetime import datetime
+from itertools import repeat
 from typing import List, Dict, Tuple
 
 from vnpy.trader.engine import BaseEngine, MainEngine, EventEngine
@@ -93,7 +94,7 @@ class ManagerEngine(BaseEngine):
         end: datetime
     ) -> bool:
         """"""
-        bars = self.load_bar_data(symbol, exchange, interval, start, end)
+        df = database_manager.load_bar_frame(symbol, exchange, interval, start, end)
 
         fieldnames = [
             "symbol",
@@ -107,24 +108,23 @@ class ManagerEngine(BaseEngine):
             "open_interest"
         ]
 
+        rows = zip(
+            repeat(symbol),
+            repeat(exchange.value),
+            df["datetime"].dt.strftime("%Y-%m-%d %H:%M:%S").tolist(),
+            df["open_price"].tolist(),
+            df["high_price"].tolist(),
+            df["low_price"].tolist(),
+            df["close_price"].tolist(),
+            df["volume"].tolist(),
+            df["open_interest"].tolist(),
+        )
+
         try:
             with open(file_path, "w") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n")
-                writer.writeheader()
-
-                for bar in bars:
-                    d = {
-                        "symbol": bar.symbol,
-                        "exchange": bar.exchange.value,
-                        "datetime": bar.datetime.strftime("%Y-%m-%d %H:%M:%S"),
-                        "open": bar.open_price,
-                        "high": bar.high_price,
-                        "low": bar.low_price,
-                        "close": bar.close_price,
-                        "volume": bar.volume,
-                        "open_interest": bar.open_interest,
-                    }
-                    writer.writerow(d)
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(fieldnames)
+                writer.writerows(rows)
 
             return True
         except PermissionError:
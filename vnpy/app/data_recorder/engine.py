@@ -1,9 +1,16 @@
 """"""
 
+import os
+import pickle
+import shutil
 import sys
+from collections import defaultdict
 from threading import Thread
-from queue import Queue, Empty
+from time import time
+from queue import Queue, Empty, Full
 from copy import copy
+from datetime import date
+from typing import Dict, List, Optional, Tuple
 
 from vnpy.event import Event, EventEngine
 from vnpy.trader.engine import BaseEngine, MainEngine
@@ -15,10 +22,18 @@ from vnpy.trader.object import (
     ContractData
 )
 from vnpy.trader.event import EVENT_TICK, EVENT_CONTRACT
-from vnpy.trader.utility import load_json, save_json, BarGenerator
+from vnpy.trader.utility import (
+    load_json,
+    save_json,
+    get_file_path,
+    get_folder_path,
+    BarGenerator
+)
 from vnpy.trader.database import database_manager
 from vnpy.app.spread_trading.base import EVENT_SPREAD_DATA, SpreadData
 
+from .journal import TickJournal
+
 
 APP_NAME = "DataRecorder"
 
@@ -30,12 +45,13 @@ EVENT_RECORDER_EXCEPTION = "eRecorderException"
 class RecorderEngine(BaseEngine):
     """"""
     setting_filename = "data_recorder_setting.json"
+    spill_filename = "data_recorder_spill.pkl"
+    journal_foldername = "tick_journal"
 
     def __init__(self, main_engine: MainEngine, event_engine: EventEngine):
         """"""
         super().__init__(main_engine, event_engine, APP_NAME)
 
-        self.queue = Queue()
         self.thread = Thread(target=self.run)
         self.active = False
 
@@ -43,7 +59,34 @@ class RecorderEngine(BaseEngine):
         self.bar_recordings = {}
         self.bar_generators = {}
 
+        # Data is written into database in batches
+        self.batch_size: int = 1000             # flush when rows reached
+        self.flush_interval: float = 0.5        # flush when seconds passed
+        self.queue_size: int = 100000           # max tasks waiting in queue
+        self.block: bool = False                # block or drop when queue is full
+        self.spill: bool = True                 # save batch to file when database failed
+
+        # Ticks are written into journal files instead of database in journal mode
+        self.journal_mode: bool = False
+        self.journal_rollover_hour: int = 20    # night session belongs to next trading day
+        self.journal: Optional[TickJournal] = None
+
+        self.buffers: Dict[str, list] = {"tick": [], "bar": []}
+        self.buffer_time: float = 0
+        self.spill_path = get_file_path(self.spill_filename)
+
+        self.received_count: int = 0
+        self.written_count: int = 0
+        self.dropped_count: int = 0
+        self.spilled_count: int = 0
+        self.lag: float = 0
+        self.throughput: float = 0
+
         self.load_setting()
+        self.queue = Queue(maxsize=self.queue_size)
+
+        if self.journal_mode:
+            self.journal = self.create_journal()
         self.register_event()
         self.start()
         self.put_event()
@@ -54,11 +97,26 @@ class RecorderEngine(BaseEngine):
         self.tick_recordings = setting.get("tick", {})
         self.bar_recordings = setting.get("bar", {})
 
+        self.batch_size = setting.get("batch_size", self.batch_size)
+        self.flush_interval = setting.get("flush_interval", self.flush_interval)
+        self.queue_size = setting.get("queue_size", self.queue_size)
+        self.block = setting.get("block", self.block)
+        self.spill = setting.get("spill", self.spill)
+        self.journal_mode = setting.get("journal_mode", self.journal_mode)
+        self.journal_rollover_hour = setting.get("journal_rollover_hour", self.journal_rollover_hour)
+
     def save_setting(self):
         """"""
         setting = {
             "tick": self.tick_recordings,
-            "bar": self.bar_recordings
+            "bar": self.bar_recordings,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "queue_size": self.queue_size,
+            "block": self.block,
+            "spill": self.spill,
+            "journal_mode": self.journal_mode,
+            "journal_rollover_hour": self.journal_rollover_hour
         }
         save_json(self.setting_filename, setting)
 
@@ -66,31 +124,194 @@ class RecorderEngine(BaseEngine):
         """"""
         while self.active:
             try:
-                task = self.queue.get(timeout=1)
-                task_type, data = task
+                task = self.queue.get(timeout=self.flush_interval)
+                self.buffer_task(task)
+            except Empty:
+                pass
 
-                if task_type == "tick":
-                    database_manager.save_tick_data([data])
-                elif task_type == "bar":
-                    database_manager.save_bar_data([data])
+            # Sync journal files here to keep fsync out of event processing
+            if self.journal:
+                self.journal.check_sync()
 
+            if self.check_flush():
+                if not self.flush():
+                    self.active = False
+
+        # Write all data left before exit
+        while True:
+            try:
+                task = self.queue.get_nowait()
+                self.buffer_task(task)
             except Empty:
-                continue
+                break
 
-            except Exception:
-                self.active = False
+        self.flush()
 
-                info = sys.exc_info()
-                event = Event(EVENT_RECORDER_EXCEPTION, info)
-                self.event_engine.put(event)
+    def buffer_task(self, task: Tuple[str, object, float]):
+        """"""
+        task_type, data, put_time = task
+
+        if not self.buffer_time:
+            self.buffer_time = put_time
+
+        self.buffers[task_type].append(data)
+
+    def check_flush(self) -> bool:
+        """
+        Check if buffered data reaches batch size or flush interval.
+        """
+        if not self.buffer_time:
+            return False
+
+        count = len(self.buffers["tick"]) + len(self.buffers["bar"])
+        if count >= self.batch_size:
+            return True
+
+        return time() - self.buffer_time >= self.flush_interval
+
+    def flush(self) -> bool:
+        """
+        Write buffered data into database. Return False if failed and
+        recorder should be stopped.
+        """
+        if not self.buffer_time:
+            return True
+
+        batches = [
+            (task_type, datas)
+            for task_type, datas in self.buffers.items()
+            if datas
+        ]
+        buffer_time = self.buffer_time
+
+        self.buffers = {"tick": [], "bar": []}
+        self.buffer_time = 0
+
+        start = time()
+
+        try:
+            for task_type, datas in batches:
+                save_data(task_type, datas)
+
+            # Database recovered, write data spilled before
+            if self.spill and os.path.exists(self.spill_path):
+                self.load_spill()
+        except Exception:
+            if not self.spill:
+                self.put_exception()
+                return False
+
+            self.save_spill(batches)
+            return True
+
+        end = time()
+        count = sum(len(datas) for _, datas in batches)
+
+        self.written_count += count
+        self.lag = end - buffer_time
+        self.throughput = count / max(end - start, 1e-6)
+        return True
+
+    def save_spill(self, batches: List[Tuple[str, list]]):
+        """
+        Append batches into spill file when database is not available.
+        """
+        with open(self.spill_path, "ab") as f:
+            for batch in batches:
+                pickle.dump(batch, f)
+
+        count = sum(len(datas) for _, datas in batches)
+        self.spilled_count += count
+        self.write_log(f"数据库写入失败，{count}条数据已保存到本地缓存文件")
+
+    def load_spill(self):
+        """
+        Write batches in spill file into database then delete the file.
+        """
+        batches = []
+        with open(self.spill_path, "rb") as f:
+            while True:
+                try:
+                    batches.append(pickle.load(f))
+                except EOFError:
+                    break
+
+        for task_type, datas in batches:
+            save_data(task_type, datas)
+
+        os.remove(self.spill_path)
+
+        count = sum(len(datas) for _, datas in batches)
+        self.written_count += count
+        self.spilled_count -= min(count, self.spilled_count)
+        self.write_log(f"本地缓存文件中{count}条数据已写入数据库")
+
+    def put_exception(self):
+        """"""
+        info = sys.exc_info()
+        event = Event(EVENT_RECORDER_EXCEPTION, info)
+        self.event_engine.put(event)
+
+    def get_statistics(self) -> dict:
+        """
+        Get counters of recorder, lag is seconds from the first data
+        buffered to the batch written, throughput is rows written per
+        second of database.
+        """
+        return {
+            "received": self.received_count,
+            "written": self.written_count,
+            "dropped": self.dropped_count,
+            "spilled": self.spilled_count,
+            "queue": self.queue.qsize(),
+            "lag": self.lag,
+            "throughput": self.throughput
+        }
 
     def close(self):
         """"""
         self.active = False
 
-        if self.thread.isAlive():
+        if self.thread.is_alive():
             self.thread.join()
 
+        if self.journal:
+            self.journal.close()
+
+    def compact_journal(self, day: date, delete: bool = False) -> int:
+        """
+        Load tick journal of the trading day into database, should be
+        called after the day session of the trading day is finished.
+        """
+        if not self.journal:
+            self.journal = self.create_journal()
+
+        total = 0
+
+        for vt_symbol in self.journal.get_symbols(day):
+            ticks = self.journal.load_ticks(day, vt_symbol)
+
+            for i in range(0, len(ticks), self.batch_size):
+                save_data("tick", ticks[i: i + self.batch_size])
+
+            total += len(ticks)
+            self.write_log(f"Tick日志{day} {vt_symbol}写入数据库，数据量：{len(ticks)}")
+
+        if delete:
+            folder = self.journal.get_folder(day)
+            if folder.exists():
+                shutil.rmtree(folder)
+
+        self.write_log(f"Tick日志{day}压缩完成，总数据量：{total}")
+        return total
+
+    def create_journal(self) -> TickJournal:
+        """"""
+        return TickJournal(
+            get_folder_path(self.journal_foldername),
+            rollover_hour=self.journal_rollover_hour
+        )
+
     def start(self):
         """"""
         self.active = True
@@ -242,13 +463,28 @@ class RecorderEngine(BaseEngine):
 
     def record_tick(self, tick: TickData):
         """"""
-        task = ("tick", copy(tick))
-        self.queue.put(task)
+        if self.journal:
+            self.journal.write(tick)
+            return
+
+        task = ("tick", copy(tick), time())
+        self.put_task(task)
 
     def record_bar(self, bar: BarData):
         """"""
-        task = ("bar", copy(bar))
-        self.queue.put(task)
+        task = ("bar", copy(bar), time())
+        self.put_task(task)
+
+    def put_task(self, task: Tuple[str, object, float]):
+        """
+        Put task into queue, block or drop the task when queue is full.
+        """
+        self.received_count += 1
+
+        try:
+            self.queue.put(task, block=self.block)
+        except Full:
+            self.dropped_count += 1
 
     def get_bar_generator(self, vt_symbol: str):
         """"""
@@ -267,3 +503,27 @@ class RecorderEngine(BaseEngine):
             exchange=contract.exchange
         )
         self.main_engine.subscribe(req, contract.gateway_name)
+
+
+def save_data(task_type: str, datas: list):
+    """
+    Save batch of data with one bulk write if supported by database
+    manager, otherwise save data of each symbol separately.
+    """
+    if task_type == "tick":
+        bulk_save = getattr(database_manager, "bulk_save_tick_data", None)
+        save = database_manager.save_tick_data
+    else:
+        bulk_save = getattr(database_manager, "bulk_save_bar_data", None)
+        save = database_manager.save_bar_data
+
+    if bulk_save:
+        bulk_save(datas)
+        return
+
+    groups = defaultdict(list)
+    for data in datas:
+        groups[data.vt_symbol].append(data)
+
+    for group in groups.values():
+        save(group)
@@ -0,0 +1,266 @@
+""""""
+import os
+import struct
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import BinaryIO, Dict, List, Tuple
+
+import numpy as np
+
+from vnpy.trader.constant import Exchange
+from vnpy.trader.object import TickData
+from vnpy.trader.database.database import TICK_FRAME_FIELDS
+from vnpy.trader.database.database_file import (
+    TICK_DTYPE,
+    EPOCH,
+    DAY_FORMAT,
+    to_timestamp,
+    to_datetime
+)
+
+
+# Same layout as TICK_DTYPE, packed with struct for lower cost of each tick
+TICK_STRUCT = struct.Struct("<q" + "d" * (len(TICK_FRAME_FIELDS) - 1))
+TICK_FIELDS = TICK_FRAME_FIELDS[1:]
+
+MICROSECONDS_PER_DAY = 86400 * 1_000_000
+MICROSECONDS_PER_HOUR = 3600 * 1_000_000
+
+
+class TickJournal:
+    """
+    Append-only binary journal of tick data, saved as fixed-size records
+    into one file for each trading day and each vt_symbol:
+
+        root/{YYYYMMDD}/{vt_symbol}.dat
+
+    Ticks received from rollover_hour (in DB_TZ) are saved into journal of
+    the next trading day, so that night session is kept with the day
+    session after it, and weekend is skipped. Set rollover_hour to 0 for
+    journal of calendar day.
+
+    Files are flushed and fsynced in batches, by count of records written
+    or seconds passed since last sync. Syncing is done in check_sync, which
+    should be called regularly from a thread other than the one writing
+    ticks, so that disk latency does not block tick processing.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        sync_count: int = 1000,
+        sync_interval: float = 1.0,
+        rollover_hour: int = 20
+    ):
+        """"""
+        self.root: Path = Path(root)
+        self.sync_count: int = sync_count
+        self.sync_interval: float = sync_interval
+        self.rollover_offset: int = (24 - rollover_hour) % 24 * MICROSECONDS_PER_HOUR
+
+        self.files: Dict[Tuple[int, str], BinaryIO] = {}
+        self.lock: Lock = Lock()
+
+        # Duplicated descriptors of files closed but not fsynced yet
+        self.closed_fds: List[int] = []
+
+        self.day: int = 0
+        self.unsynced: int = 0
+        self.sync_time: float = time()
+
+    def write(self, tick: TickData) -> None:
+        """
+        Append tick into journal file.
+        """
+        timestamp = to_timestamp(tick.datetime)
+        day = self.get_trading_day(timestamp)
+
+        record = TICK_STRUCT.pack(
+            timestamp,
+            *[getattr(tick, name) or 0 for name in TICK_FIELDS]
+        )
+
+        with self.lock:
+            # Close files of previous trading day
+            if day > self.day:
+                self.close_files()
+                self.day = day
+
+            f = self.files.get((day, tick.vt_symbol), None)
+            if not f:
+                f = self.open_file(day, tick.vt_symbol)
+
+            f.write(record)
+            self.unsynced += 1
+
+    def get_trading_day(self, timestamp: int) -> int:
+        """
+        Get trading day of timestamp as day count from epoch.
+        """
+        if not self.rollover_offset:
+            return timestamp // MICROSECONDS_PER_DAY
+
+        day = (timestamp + self.rollover_offset) // MICROSECONDS_PER_DAY
+
+        # Epoch is Thursday, Saturday and Sunday belong to next Monday
+        weekday = (day + 3) % 7
+        if weekday >= 5:
+            day += 7 - weekday
+
+        return day
+
+    def check_sync(self) -> None:
+        """
+        Sync files if sync count reached or sync interval passed, call this
+        function regularly. Only flush is done with lock held, and fsync
+        is done after lock released.
+        """
+        with self.lock:
+            if not self.unsynced and not self.closed_fds:
+                return
+
+            if (
+                self.unsynced < self.sync_count
+                and time() - self.sync_time < self.sync_interval
+                and not self.closed_fds
+            ):
+                return
+
+            fds = self.flush_files()
+
+        sync_fds(fds)
+
+    def close(self) -> None:
+        """"""
+        with self.lock:
+            self.close_files()
+            fds = self.closed_fds
+            self.closed_fds = []
+
+        sync_fds(fds)
+
+    def open_file(self, day: int, vt_symbol: str) -> BinaryIO:
+        """"""
+        folder = self.root.joinpath(get_day_name(day))
+        folder.mkdir(parents=True, exist_ok=True)
+
+        path = folder.joinpath(f"{vt_symbol}.dat")
+        f = open(path, "ab")
+
+        # Drop partial record left by crash before
+        size = f.tell()
+        remainder = size % TICK_STRUCT.size
+        if remainder:
+            f.truncate(size - remainder)
+
+        self.files[(day, vt_symbol)] = f
+        return f
+
+    def flush_files(self) -> List[int]:
+        """
+        Flush files and return duplicated descriptors to be fsynced, which
+        are still valid if files are closed before fsync.
+        """
+        fds = self.closed_fds
+        self.closed_fds = []
+
+        for f in self.files.values():
+            f.flush()
+            fds.append(os.dup(f.fileno()))
+
+        self.unsynced = 0
+        self.sync_time = time()
+
+        return fds
+
+    def close_files(self) -> None:
+        """
+        Close files, which are fsynced later in check_sync or close.
+        """
+        # Descriptors returned include those closed before
+        self.closed_fds = self.flush_files()
+
+        for f in self.files.values():
+            f.close()
+        self.files.clear()
+
+    def get_days(self) -> List[date]:
+        """
+        Get all trading days with journal files.
+        """
+        if not self.root.exists():
+            return []
+
+        days = []
+        for name in sorted(os.listdir(self.root)):
+            try:
+                days.append(datetime.strptime(name, DAY_FORMAT).date())
+            except ValueError:
+                continue
+        return days
+
+    def get_folder(self, day: date) -> Path:
+        """"""
+        return self.root.joinpath(day.strftime(DAY_FORMAT))
+
+    def load_ticks(self, day: date, vt_symbol: str) -> List[TickData]:
+        """
+        Load all ticks of vt_symbol in journal of the trading day.
+        """
+        path = self.get_folder(day).joinpath(f"{vt_symbol}.dat")
+
+        count = os.path.getsize(path) // TICK_DTYPE.itemsize
+        records = np.fromfile(path, dtype=TICK_DTYPE, count=count)
+
+        symbol, exchange_value = vt_symbol.rsplit(".", 1)
+        exchange = Exchange(exchange_value)
+
+        ticks = []
+        for r in records.tolist():
+            tick = TickData(
+                symbol=symbol,
+                exchange=exchange,
+                datetime=to_datetime(r[0]),
+                gateway_name="JOURNAL"
+            )
+
+            for name, value in zip(TICK_FIELDS, r[1:]):
+                setattr(tick, name, value)
+
+            ticks.append(tick)
+
+        return ticks
+
+    def get_symbols(self, day: date) -> List[str]:
+        """
+        Get vt_symbols with journal file of the trading day.
+        """
+        folder = self.get_folder(day)
+        if not folder.exists():
+            return []
+
+        return [
+            name[:-4] for name in sorted(os.listdir(folder))
+            if name.endswith(".dat")
+        ]
+
+
+def sync_fds(fds: List[int]) -> None:
+    """
+    Fsync and close file descriptors.
+    """
+    for fd in fds:
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def get_day_name(day: int) -> str:
+    """
+    Convert day count from epoch into folder name.
+    """
+    dt = EPOCH + timedelta(days=day)
+    return dt.strftime(DAY_FORMAT)
@@ -1,9 +1,11 @@
 import traceback
-from typing import Dict, Set, Any
+from types import CodeType
+from typing import Dict, List, Set, Any
 from datetime import datetime
 from collections import defaultdict
+from time import perf_counter
 
-from vnpy.event import Event, EventEngine
+from vnpy.event import Event, EventEngine, EVENT_TIMER
 from vnpy.trader.utility import save_json, load_json
 from vnpy.trader.engine import BaseEngine, MainEngine
 from vnpy.trader.object import (
@@ -19,15 +21,65 @@ EVENT_RADAR_UPDATE = "eRadarUpdate"
 EVENT_RADAR_LOG = "eRaderLog"
 
 
-class RadarRule:
-    """"""
+# Globals for evaluating formula, shared by all rules
+FORMULA_GLOBALS: Dict[str, Any] = {"__builtins__": __builtins__}
+
 
-    def __init__(self, name: str, formula: str, params: Dict[str, str], ndigits: int):
+class RadarRule:
+    """
+    Formula is compiled once, and param values are cached in dict used as
+    locals of evaluation, so only value of the leg with new tick is updated.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        formula: str,
+        params: Dict[str, str],
+        ndigits: int,
+        interval: float = 0
+    ):
         """"""
         self.name: str = name
-        self.formula: str = formula
-        self.params: Dict[str, str] = params
-        self.ndigits = ndigits
+        self.ndigits: int = ndigits
+        self.interval: float = interval
+
+        self.formula: str = ""
+        self.params: Dict[str, str] = {}
+        self.code: CodeType = None
+        self.symbol_names: Dict[str, List[str]] = {}
+        self.values: Dict[str, float] = {}
+
+        self.update_time: float = 0
+        self.pending: bool = False
+
+        self.set_formula(formula, params)
+
+    def set_formula(self, formula: str, params: Dict[str, str]) -> None:
+        """"""
+        self.formula = formula
+        self.params = params
+        self.code = compile_formula(formula)
+
+        self.symbol_names = defaultdict(list)
+        for name, vt_symbol in params.items():
+            self.symbol_names[vt_symbol].append(name)
+
+        self.values = {}
+        self.pending = False
+
+    def update_value(self, vt_symbol: str, value: float) -> None:
+        """"""
+        for name in self.symbol_names[vt_symbol]:
+            self.values[name] = value
+
+    def is_ready(self) -> bool:
+        """"""
+        return len(self.values) == len(self.params)
+
+    def calculate(self) -> float:
+        """"""
+        return eval(self.code, FORMULA_GLOBALS, self.values)
 
 
 class RadarEngine(BaseEngine):
@@ -57,16 +109,37 @@ class RadarEngine(BaseEngine):
         """"""
         self.event_engine.register(EVENT_TICK, self.process_tick_event)
         self.event_engine.register(EVENT_CONTRACT, self.process_contract_event)
+        self.event_engine.register(EVENT_TIMER, self.process_timer_event)
 
     def process_tick_event(self, event: Event) -> None:
         """"""
         tick: TickData = event.data
+        vt_symbol = tick.vt_symbol
 
-        if tick.vt_symbol not in self.symbol_rule_map:
+        rules = self.symbol_rule_map.get(vt_symbol, None)
+        if not rules:
             return
 
-        for rule in self.symbol_rule_map[tick.vt_symbol]:
-            self.calculate_rule(rule)
+        now = perf_counter()
+
+        for rule in rules:
+            rule.update_value(vt_symbol, tick.last_price)
+
+            # Throttle calculation by interval of rule
+            if now - rule.update_time < rule.interval:
+                rule.pending = True
+            else:
+                self.calculate_rule(rule, now)
+
+    def process_timer_event(self, event: Event) -> None:
+        """
+        Calculate rules throttled with no new tick received after.
+        """
+        now = perf_counter()
+
+        for rule in self.rules.values():
+            if rule.pending and now - rule.update_time >= rule.interval:
+                self.calculate_rule(rule, now)
 
     def process_contract_event(self, event: Event) -> None:
         """"""
@@ -84,7 +157,12 @@ class RadarEngine(BaseEngine):
             self.main_engine.subscribe(req, contract.gateway_name)
 
     def add_rule(
-        self, name: str, formula: str, params: Dict[str, str], ndigits: int
+        self,
+        name: str,
+        formula: str,
+        params: Dict[str, str],
+        ndigits: int,
+        interval: float = 0
     ) -> bool:
         """"""
         if name in self.rules:
@@ -95,7 +173,7 @@ class RadarEngine(BaseEngine):
             self.write_log(f"添加失败，公式无法运算{formula}")
             return False
 
-        rule = RadarRule(name, formula, params, ndigits)
+        rule = RadarRule(name, formula, params, ndigits, interval)
         self.rules[name] = rule
 
         for vt_symbol in params.values():
@@ -108,17 +186,23 @@ class RadarEngine(BaseEngine):
             "name": name,
             "formula": formula,
             "params": params,
-            "ndigits": ndigits
+            "ndigits": ndigits,
+            "interval": interval
         }
         self.put_event(EVENT_RADAR_RULE, rule_data)
 
-        self.calculate_rule(rule)
+        self.init_rule(rule)
 
         self.write_log(f"添加成功{name}")
         return True
 
     def edit_rule(
-        self, name: str, formula: str, params: Dict[str, str], ndigits: int
+        self,
+        name: str,
+        formula: str,
+        params: Dict[str, str],
+        ndigits: int,
+        interval: float = 0
     ) -> bool:
         """"""
         # Check valid
@@ -138,9 +222,9 @@ class RadarEngine(BaseEngine):
                 rules.remove(rule)
 
         # Add new symbol map
-        rule.formula = formula
-        rule.params = params
+        rule.set_formula(formula, params)
         rule.ndigits = ndigits
+        rule.interval = interval
 
         for vt_symbol in params.values():
             if vt_symbol not in self.symbol_rule_map:
@@ -153,11 +237,12 @@ class RadarEngine(BaseEngine):
             "name": name,
             "formula": formula,
             "params": params,
-            "ndigits": ndigits
+            "ndigits": ndigits,
+            "interval": interval
         }
         self.put_event(EVENT_RADAR_RULE, rule_data)
 
-        self.calculate_rule(rule)
+        self.init_rule(rule)
 
         self.write_log(f"修改成功{name}")
         return True
@@ -181,7 +266,13 @@ class RadarEngine(BaseEngine):
         setting = load_json(self.setting_filename)
 
         for d in setting:
-            self.add_rule(d["name"], d["formula"], d["params"], d["ndigits"])
+            self.add_rule(
+                d["name"],
+                d["formula"],
+                d["params"],
+                d["ndigits"],
+                d.get("interval", 0)
+            )
 
     def save_setting(self) -> None:
         """"""
@@ -192,25 +283,34 @@ class RadarEngine(BaseEngine):
                 "name": rule.name,
                 "formula": rule.formula,
                 "params": rule.params,
-                "ndigits": rule.ndigits
+                "ndigits": rule.ndigits,
+                "interval": rule.interval
             }
             setting.append(d)
 
         save_json(self.setting_filename, setting)
 
-    def calculate_rule(self, rule: RadarRule) -> None:
+    def init_rule(self, rule: RadarRule) -> None:
+        """
+        Load param values from latest ticks after rule added or edited.
+        """
+        for vt_symbol in rule.symbol_names.keys():
+            tick = self.main_engine.get_tick(vt_symbol)
+            if tick:
+                rule.update_value(vt_symbol, tick.last_price)
+
+        self.calculate_rule(rule, perf_counter())
+
+    def calculate_rule(self, rule: RadarRule, now: float) -> None:
         """"""
-        data = {}
+        rule.pending = False
 
-        for name, vt_symbol in rule.params.items():
-            tick = self.main_engine.get_tick(vt_symbol)
+        if not rule.is_ready():
+            return
 
-            if not tick:
-                return
-            else:
-                data[name] = tick.last_price
+        rule.update_time = now
 
-        value = parse_formula(rule.formula, data)
+        value = rule.calculate()
         if value is None:
             return
         value = round(value, rule.ndigits)
@@ -232,9 +332,9 @@ class RadarEngine(BaseEngine):
             data[name] = 1
 
         try:
-            parse_formula(formula, data)
+            eval(compile_formula(formula), FORMULA_GLOBALS, data)
         except Exception:
-            msg = f"价差公式校验出错，细节：\n{traceback.format_exec()}"
+            msg = f"价差公式校验出错，细节：\n{traceback.format_exc()}"
             self.write_log(msg)
 
             return False
@@ -252,8 +352,11 @@ class RadarEngine(BaseEngine):
         self.put_event(EVENT_RADAR_LOG, log)
 
 
+def compile_formula(formula: str) -> CodeType:
+    """"""
+    return compile(formula, "<radar>", "eval")
+
+
 def parse_formula(formula: str, data: Dict[str, float]) -> float:
     """"""
-    locals().update(data)
-    result = eval(formula)
-    return result
+    return eval(compile_formula(formula), FORMULA_GLOBALS, dict(data))
@@ -51,6 +51,11 @@ class RadarManager(QtWidgets.QWidget):
         self.ndigits_spin.setMinimum(0)
         self.ndigits_spin.setValue(2)
 
+        self.interval_spin = QtWidgets.QDoubleSpinBox()
+        self.interval_spin.setMinimum(0)
+        self.interval_spin.setDecimals(1)
+        self.interval_spin.setSingleStep(0.1)
+
         add_button = QtWidgets.QPushButton("添加")
         add_button.clicked.connect(self.add_rule)
 
@@ -69,6 +74,7 @@ class RadarManager(QtWidgets.QWidget):
         form.addRow("D", self.d_line)
         form.addRow("E", self.e_line)
         form.addRow("小数", self.ndigits_spin)
+        form.addRow("间隔（秒）", self.interval_spin)
         form.addRow(add_button)
         form.addRow(edit_button)
 
@@ -101,14 +107,14 @@ class RadarManager(QtWidgets.QWidget):
 
     def add_rule(self) -> None:
         """"""
-        name, formula, params, ndigits = self.get_rule_setting()
-        self.radar_engine.add_rule(name, formula, params, ndigits)
+        name, formula, params, ndigits, interval = self.get_rule_setting()
+        self.radar_engine.add_rule(name, formula, params, ndigits, interval)
         self.radar_engine.save_setting()
 
     def edit_rule(self) -> None:
         """"""
-        name, formula, params, ndigits = self.get_rule_setting()
-        self.radar_engine.edit_rule(name, formula, params, ndigits)
+        name, formula, params, ndigits, interval = self.get_rule_setting()
+        self.radar_engine.edit_rule(name, formula, params, ndigits, interval)
         self.radar_engine.save_setting()
 
     def get_rule_setting(self) -> tuple:
@@ -135,8 +141,9 @@ class RadarManager(QtWidgets.QWidget):
             params["E"] = e
 
         ndigits = self.ndigits_spin.value()
+        interval = self.interval_spin.value()
 
-        return name, formula, params, ndigits
+        return name, formula, params, ndigits, interval
 
     def show(self):
         """"""
@@ -162,6 +169,7 @@ class RadarManager(QtWidgets.QWidget):
                 name = row["名称"]
                 formula = row["公式"]
                 ndigits = int(row["小数"])
+                interval = float(row.get("间隔", 0) or 0)
 
                 params = {}
                 for param in ["A", "B", "C", "D", "E"]:
@@ -169,7 +177,7 @@ class RadarManager(QtWidgets.QWidget):
                     if vt_symbol:
                         params[param] = vt_symbol
 
-                self.radar_engine.add_rule(name, formula, params, ndigits)
+                self.radar_engine.add_rule(name, formula, params, ndigits, interval)
                 self.radar_engine.save_setting()
 
 
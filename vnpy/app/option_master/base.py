@@ -1,12 +1,15 @@
 from datetime import datetime, timedelta
-from typing import Dict, List, Callable
+from time import perf_counter
+from typing import Dict, List, Set, Callable
 from types import ModuleType
 
+import numpy as np
+
 from vnpy.trader.object import ContractData, TickData, TradeData
 from vnpy.trader.constant import Exchange, OptionType, Direction, Offset
 from vnpy.trader.converter import PositionHolding
 
-from .time import calculate_days_to_expiry, ANNUAL_DAYS
+from .time import calculate_days_to_expiry, calculate_time_to_expiry
 
 
 APP_NAME = "OptionMaster"
@@ -16,6 +19,7 @@ EVENT_OPTION_ALGO_PRICING = "eOptionAlgoPricing"
 EVENT_OPTION_ALGO_TRADING = "eOptionAlgoTrading"
 EVENT_OPTION_ALGO_STATUS = "eOptionAlgoStatus"
 EVENT_OPTION_ALGO_LOG = "eOptionAlgoLog"
+EVENT_OPTION_REPRICE = "eOptionReprice"
 
 
 CHAIN_UNDERLYING_MAP = {
@@ -126,7 +130,9 @@ class OptionData(InstrumentData):
         self.days_to_expiry: int = calculate_days_to_expiry(
             contract.option_expiry
         )
-        self.time_to_expiry: float = self.days_to_expiry / ANNUAL_DAYS
+        self.time_to_expiry: float = calculate_time_to_expiry(
+            contract.option_expiry
+        )
 
         self.interest_rate: float = 0
         self.inverse: bool = False
@@ -267,7 +273,19 @@ class OptionData(InstrumentData):
             self.days_to_expiry = self.option_expiry - current_dt
             self.time_to_expiry = self.days_to_expiry / timedelta(365)
 
+    def update_time_to_expiry(self) -> None:
+        """
+        Update intraday time to expiry with remaining trading sessions.
+        """
+        if not self.inverse:
+            self.time_to_expiry = calculate_time_to_expiry(self.option_expiry)
+
+    def reprice(self) -> None:
+        """
+        Calculate implied volatility and cash greeks with latest tick.
+        """
         self.calculate_option_impv()
+        self.calculate_cash_greeks()
 
     def update_trade(self, trade: TradeData) -> None:
         """"""
@@ -321,13 +339,12 @@ class UnderlyingData(InstrumentData):
         self.chains[chain.chain_symbol] = chain
 
     def update_tick(self, tick: TickData) -> None:
-        """"""
+        """
+        Chains of the underlying are repriced later by portfolio.
+        """
         super().update_tick(tick)
 
         self.cash_delta = self.size * self.mid_price / 100
-        for chain in self.chains.values():
-            chain.update_underlying_tick()
-
         self.calculate_pos_greeks()
 
     def update_trade(self, trade: TradeData) -> None:
@@ -373,6 +390,10 @@ class ChainData:
         self.days_to_expiry: int = 0
         self.inverse: bool = False
 
+        # Array pricing functions for calculating whole chain in one call
+        self.calculate_greeks_array: Callable = None
+        self.calculate_impv_array: Callable = None
+
     def add_option(self, option: OptionData) -> None:
         """"""
         self.options[option.vt_symbol] = option
@@ -421,25 +442,118 @@ class ChainData:
 
         self.net_pos = self.long_pos - self.short_pos
 
-    def update_tick(self, tick: TickData) -> None:
+    def update_tick(self, tick: TickData) -> OptionData:
         """"""
         option = self.options[tick.vt_symbol]
         option.update_tick(tick)
+        return option
 
     def update_underlying_tick(self) -> None:
         """"""
         self.calculate_underlying_adjustment()
+        self.reprice_options(list(self.options.values()))
+
+    def reprice_options(self, options: List[OptionData]) -> None:
+        """
+        Reprice options of the chain, and update chain pos greeks with
+        change of each option.
+        """
+        for option in options:
+            option.underlying_adjustment = self.underlying_adjustment
+
+        if self.calculate_impv_array:
+            self.calculate_chain_greeks(options)
+        else:
+            for option in options:
+                option.reprice()
+
+        for option in options:
+            self.remove_option_greeks(option)
+            option.calculate_pos_greeks()
+            self.add_option_greeks(option)
+
+    def calculate_chain_greeks(self, options: List[OptionData]) -> None:
+        """
+        Calculate implied volatility and cash greeks of options with array
+        pricing functions in one call.
+        """
+        underlying_price = self.underlying.mid_price
+        options = [option for option in options if option.tick]
 
-        for option in self.options.values():
-            option.update_underlying_tick(self.underlying_adjustment)
+        if not underlying_price or not options:
+            return
 
-        self.calculate_pos_greeks()
+        underlying_price += self.underlying_adjustment
+
+        k = np.array([option.strike_price for option in options])
+        r = np.array([option.interest_rate for option in options])
+        t = np.array([option.time_to_expiry for option in options])
+        cp = np.array([option.option_type for option in options], dtype=float)
+        size = np.array([option.size for option in options], dtype=float)
+
+        ask_price = np.array([option.tick.ask_price_1 for option in options])
+        bid_price = np.array([option.tick.bid_price_1 for option in options])
+
+        # Adjustment for crypto inverse option contract
+        if self.inverse:
+            ask_price *= underlying_price
+            bid_price *= underlying_price
+
+        ask_impv = self.calculate_impv_array(ask_price, underlying_price, k, r, t, cp)
+        bid_impv = self.calculate_impv_array(bid_price, underlying_price, k, r, t, cp)
+        mid_impv = (ask_impv + bid_impv) / 2
+
+        price, delta, gamma, theta, vega = self.calculate_greeks_array(
+            underlying_price, k, r, t, mid_impv, cp
+        )
+
+        cash_delta = delta * size
+        cash_gamma = gamma * size
+        cash_theta = theta * size
+        cash_vega = vega * size
+
+        if self.inverse:
+            cash_delta /= underlying_price
+            cash_gamma /= underlying_price
+            cash_theta /= underlying_price
+            cash_vega /= underlying_price
+
+        # Cash greeks are kept unchanged if mid impv not available
+        for option, ask, bid, mid, delta, gamma, theta, vega in zip(
+            options,
+            ask_impv.tolist(),
+            bid_impv.tolist(),
+            mid_impv.tolist(),
+            cash_delta.tolist(),
+            cash_gamma.tolist(),
+            cash_theta.tolist(),
+            cash_vega.tolist()
+        ):
+            option.ask_impv = ask
+            option.bid_impv = bid
+            option.mid_impv = mid
+
+            if mid:
+                option.cash_delta = delta
+                option.cash_gamma = gamma
+                option.cash_theta = theta
+                option.cash_vega = vega
 
     def update_trade(self, trade: TradeData) -> None:
         """"""
         option = self.options[trade.vt_symbol]
 
         # Deduct old option pos greeks
+        self.remove_option_greeks(option)
+
+        # Calculate new option pos greeks
+        option.update_trade(trade)
+
+        # Add new option pos greeks
+        self.add_option_greeks(option)
+
+    def remove_option_greeks(self, option: OptionData) -> None:
+        """"""
         self.long_pos -= option.long_pos
         self.short_pos -= option.short_pos
         self.pos_value -= option.pos_value
@@ -448,10 +562,10 @@ class ChainData:
         self.pos_theta -= option.pos_theta
         self.pos_vega -= option.pos_vega
 
-        # Calculate new option pos greeks
-        option.update_trade(trade)
+        self.net_pos = self.long_pos - self.short_pos
 
-        # Add new option pos greeks
+    def add_option_greeks(self, option: OptionData) -> None:
+        """"""
         self.long_pos += option.long_pos
         self.short_pos += option.short_pos
         self.pos_value += option.pos_value
@@ -480,6 +594,10 @@ class ChainData:
         for option in self.options.values():
             option.set_pricing_model(pricing_model)
 
+        # Cython and binomial tree models are calculated option by option
+        self.calculate_greeks_array = getattr(pricing_model, "calculate_greeks_array", None)
+        self.calculate_impv_array = getattr(pricing_model, "calculate_impv_array", None)
+
     def set_inverse(self, inverse: bool) -> None:
         """"""
         self.inverse = inverse
@@ -489,7 +607,9 @@ class ChainData:
 
     def set_portfolio(self, portfolio: "PortfolioData") -> None:
         """"""
-        for option in self.options:
+        self.portfolio = portfolio
+
+        for option in self.options.values():
             option.set_portfolio(portfolio)
 
     def calculate_atm_price(self) -> None:
@@ -558,6 +678,13 @@ class PortfolioData:
         # Greeks decimals precision
         self.precision: int = 0
 
+        # Instruments with new tick are marked dirty, and repriced at most
+        # once every reprice_interval seconds
+        self.reprice_interval: float = 0.1
+        self.reprice_time: float = 0
+        self.dirty_chains: Set[ChainData] = set()
+        self.dirty_options: Set[OptionData] = set()
+
     def calculate_pos_greeks(self) -> None:
         """"""
         self.long_pos = 0
@@ -584,17 +711,72 @@ class PortfolioData:
 
         self.net_pos = self.long_pos - self.short_pos
 
-    def update_tick(self, tick: TickData) -> None:
-        """"""
+    def update_tick(self, tick: TickData) -> List[OptionData]:
+        """
+        Return options repriced, empty if reprice is deferred.
+        """
         if tick.vt_symbol in self.options:
             option = self.options[tick.vt_symbol]
             chain = option.chain
             chain.update_tick(tick)
-            self.calculate_pos_greeks()
+            self.dirty_options.add(option)
         elif tick.vt_symbol in self.underlyings:
             underlying = self.underlyings[tick.vt_symbol]
             underlying.update_tick(tick)
-            self.calculate_pos_greeks()
+            self.dirty_chains.update(underlying.chains.values())
+        else:
+            return []
+
+        return self.check_reprice()
+
+    def is_dirty(self) -> bool:
+        """
+        Whether any tick is received but not repriced yet.
+        """
+        return bool(self.dirty_chains or self.dirty_options)
+
+    def check_reprice(self) -> List[OptionData]:
+        """
+        Reprice dirty instruments if reprice interval passed, also called
+        by timer to reprice instruments with no new tick after.
+        """
+        if not self.is_dirty():
+            return []
+
+        now = perf_counter()
+        if now - self.reprice_time < self.reprice_interval:
+            return []
+        self.reprice_time = now
+
+        return self.reprice()
+
+    def reprice(self) -> List[OptionData]:
+        """
+        Reprice dirty instruments and return options repriced.
+        """
+        repriced: List[OptionData] = []
+
+        for chain in self.dirty_chains:
+            chain.update_underlying_tick()
+            repriced.extend(chain.options.values())
+
+        # Group options with new tick by chain for pricing in one call
+        chain_options: Dict[ChainData, List[OptionData]] = {}
+        for option in self.dirty_options:
+            chain = option.chain
+            if chain not in self.dirty_chains:
+                chain_options.setdefault(chain, []).append(option)
+
+        for chain, options in chain_options.items():
+            chain.reprice_options(options)
+            repriced.extend(options)
+
+        self.dirty_chains.clear()
+        self.dirty_options.clear()
+
+        self.calculate_pos_greeks()
+
+        return repriced
 
     def update_trade(self, trade: TradeData) -> None:
         """"""
@@ -627,6 +809,10 @@ class PortfolioData:
         """"""
         self.precision = precision
 
+    def set_reprice_interval(self, reprice_interval: float) -> None:
+        """"""
+        self.reprice_interval = reprice_interval
+
     def set_chain_underlying(self, chain_symbol: str, contract: ContractData) -> None:
         """"""
         underlying = self.underlyings.get(contract.vt_symbol, None)
@@ -671,3 +857,8 @@ class PortfolioData:
         """"""
         for chain in self.chains.values():
             chain.calculate_atm_price()
+
+    def update_time_to_expiry(self) -> None:
+        """"""
+        for option in self.options.values():
+            option.update_time_to_expiry()
@@ -26,7 +26,8 @@ from .base import (
     EVENT_OPTION_NEW_PORTFOLIO,
     EVENT_OPTION_ALGO_PRICING, EVENT_OPTION_ALGO_TRADING,
     EVENT_OPTION_ALGO_STATUS, EVENT_OPTION_ALGO_LOG,
-    InstrumentData, PortfolioData
+    EVENT_OPTION_REPRICE,
+    InstrumentData, OptionData, PortfolioData
 )
 try:
     from .pricing import black_76_cython as black_76
@@ -170,7 +171,9 @@ class OptionEngine(BaseEngine):
         if not portfolio:
             return
 
-        portfolio.update_tick(tick)
+        options = portfolio.update_tick(tick)
+        if options:
+            self.put_reprice_event(options)
 
     def process_order_event(self, event: Event) -> None:
         """"""
@@ -212,6 +215,11 @@ class OptionEngine(BaseEngine):
 
     def process_timer_event(self, event: Event) -> None:
         """"""
+        for portfolio in self.active_portfolios.values():
+            options = portfolio.check_reprice()
+            if options:
+                self.put_reprice_event(options)
+
         self.timer_count += 1
         if self.timer_count < self.timer_trigger:
             return
@@ -219,6 +227,15 @@ class OptionEngine(BaseEngine):
 
         for portfolio in self.active_portfolios.values():
             portfolio.calculate_atm_price()
+            portfolio.update_time_to_expiry()
+
+    def put_reprice_event(self, options: List[OptionData]) -> None:
+        """
+        Notify monitors and hedge engine that greeks of options and their
+        portfolio are updated.
+        """
+        event = Event(EVENT_OPTION_REPRICE, options)
+        self.event_engine.put(event)
 
     def get_portfolio(self, portfolio_name: str) -> PortfolioData:
         """"""
@@ -245,7 +262,8 @@ class OptionEngine(BaseEngine):
         interest_rate: float,
         chain_underlying_map: Dict[str, str],
         inverse: bool = False,
-        precision: int = 0
+        precision: int = 0,
+        reprice_interval: float = 0.1
     ) -> None:
         """"""
         portfolio = self.get_portfolio(portfolio_name)
@@ -260,6 +278,7 @@ class OptionEngine(BaseEngine):
         portfolio.set_pricing_model(pricing_model)
         portfolio.set_inverse(inverse)
         portfolio.set_precision(precision)
+        portfolio.set_reprice_interval(reprice_interval)
 
         portfolio_settings = self.setting.setdefault("portfolio_settings", {})
         portfolio_settings[portfolio_name] = {
@@ -267,7 +286,8 @@ class OptionEngine(BaseEngine):
             "interest_rate": interest_rate,
             "chain_underlying_map": chain_underlying_map,
             "inverse": inverse,
-            "precision": precision
+            "precision": precision,
+            "reprice_interval": reprice_interval
         }
         self.save_setting()
 
@@ -305,6 +325,8 @@ class OptionEngine(BaseEngine):
             if holding:
                 instrument.update_holding(holding)
 
+        for chain in portfolio.chains.values():
+            chain.calculate_pos_greeks()
         portfolio.calculate_pos_greeks()
 
         # Load chain adjustment and pricing impv data
@@ -363,6 +385,7 @@ class OptionHedgeEngine:
         self.active: bool = False
         self.active_orderids: Set[str] = set()
         self.timer_count = 0
+        self.hedge_pending: bool = False
 
         self.register_event()
 
@@ -370,6 +393,7 @@ class OptionHedgeEngine:
         """"""
         self.event_engine.register(EVENT_ORDER, self.process_order_event)
         self.event_engine.register(EVENT_TIMER, self.process_timer_event)
+        self.event_engine.register(EVENT_OPTION_REPRICE, self.process_reprice_event)
 
     def process_order_event(self, event: Event) -> None:
         """"""
@@ -391,6 +415,33 @@ class OptionHedgeEngine:
             return
         self.timer_count = 0
 
+        self.hedge_pending = True
+        self.check_hedge()
+
+    def process_reprice_event(self, event: Event) -> None:
+        """"""
+        if not self.active or not self.hedge_pending:
+            return
+
+        options: List[OptionData] = event.data
+        if options[0].portfolio.name != self.portfolio_name:
+            return
+
+        # Portfolio greeks are only updated by reprice, so hedge now with
+        # greeks of the finished reprice even if new ticks are received
+        self.hedge_pending = False
+        self.run()
+
+    def check_hedge(self) -> None:
+        """
+        Run hedging at once if all ticks are repriced, otherwise run with
+        greeks of the next reprice event.
+        """
+        portfolio = self.option_engine.get_portfolio(self.portfolio_name)
+        if portfolio.is_dirty():
+            return
+
+        self.hedge_pending = False
         self.run()
 
     def start(
@@ -422,6 +473,7 @@ class OptionHedgeEngine:
 
         self.active = False
         self.timer_count = 0
+        self.hedge_pending = False
 
     def run(self) -> None:
         """"""
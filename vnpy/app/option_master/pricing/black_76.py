@@ -2,6 +2,8 @@ from scipy import stats
 from math import log, pow, sqrt, exp
 from typing import Tuple
 
+import numpy as np
+
 cdf = stats.norm.cdf
 pdf = stats.norm.pdf
 
@@ -215,3 +217,126 @@ def calculate_impv(
     v = round(v, 4)
 
     return v
+
+
+def calculate_price_array(
+    s: np.ndarray,
+    k: np.ndarray,
+    r: np.ndarray,
+    t: np.ndarray,
+    v: np.ndarray,
+    cp: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate option price and original vega of arrays"""
+    valid = v > 0
+    v = np.where(valid, v, 1)
+
+    sqrt_t = np.sqrt(t)
+    discount = np.exp(-r * t)
+
+    d1 = (np.log(s / k) + (0.5 * v ** 2) * t) / (v * sqrt_t)
+    d2 = d1 - v * sqrt_t
+
+    price = cp * (s * cdf(cp * d1) - k * cdf(cp * d2)) * discount
+    vega = s * discount * pdf(d1) * sqrt_t
+
+    price = np.where(valid, price, np.maximum(0, cp * (s - k)))
+    vega = np.where(valid, vega, 0)
+
+    return price, vega
+
+
+def calculate_greeks_array(
+    s: np.ndarray,
+    k: np.ndarray,
+    r: np.ndarray,
+    t: np.ndarray,
+    v: np.ndarray,
+    cp: np.ndarray,
+    annual_days: int = 240
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate option price and greeks of arrays"""
+    valid = v > 0
+    v = np.where(valid, v, 1)
+
+    sqrt_t = np.sqrt(t)
+    discount = np.exp(-r * t)
+
+    d1 = (np.log(s / k) + (0.5 * v ** 2) * t) / (v * sqrt_t)
+    d2 = d1 - v * sqrt_t
+
+    price = cp * (s * cdf(cp * d1) - k * cdf(cp * d2)) * discount
+    delta = cp * discount * cdf(cp * d1) * s * 0.01
+    gamma = discount * pdf(d1) / (s * v * sqrt_t) * s ** 2 * 0.0001
+    theta = (-s * discount * pdf(d1) * v / (2 * sqrt_t) \
+            + cp * r * s * discount * cdf(cp * d1) \
+            - cp * r * k * discount * cdf(cp * d2)) / annual_days
+    vega = s * discount * pdf(d1) * sqrt_t / 100
+
+    price = np.where(valid, price, np.maximum(0, cp * (s - k)))
+    delta = np.where(valid, delta, 0)
+    gamma = np.where(valid, gamma, 0)
+    theta = np.where(valid, theta, 0)
+    vega = np.where(valid, vega, 0)
+
+    return price, delta, gamma, theta, vega
+
+
+def calculate_impv_array(
+    price: np.ndarray,
+    s: np.ndarray,
+    k: np.ndarray,
+    r: np.ndarray,
+    t: np.ndarray,
+    cp: np.ndarray
+) -> np.ndarray:
+    """Calculate option implied volatility of arrays"""
+    price, s, k, r, t, cp = np.broadcast_arrays(
+        *[np.asarray(a, dtype=float) for a in (price, s, k, r, t, cp)]
+    )
+
+    discount = np.exp(-r * t)
+
+    # Check option price must be positive and meet minimum value
+    meet = (price > 0) & (t > 0) & (price > cp * (s - k) * discount)
+
+    # Initial guess with rational approximation of Corrado-Miller
+    call = np.where(cp > 0, price, price + (s - k) * discount)
+    forward = s * discount
+    strike = k * discount
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        diff = call - (forward - strike) / 2
+        root = np.sqrt(np.maximum(diff ** 2 - (forward - strike) ** 2 / np.pi, 0))
+        v = np.sqrt(2 * np.pi / t) / (forward + strike) * (diff + root)
+
+    v = np.where(np.isfinite(v), v, 0.3)
+    v = np.clip(v, 0.01, 5)
+
+    # Newton's method with bisection fallback inside bracket
+    low = np.zeros_like(v)
+    high = np.full_like(v, 10)
+    active = meet.copy()
+
+    for i in range(50):
+        p, vega = calculate_price_array(s, k, r, t, v, cp)
+
+        low = np.where(active & (p < price), v, low)
+        high = np.where(active & (p >= price), v, high)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dx = (price - p) / vega
+
+        converged = ~np.isfinite(dx) | (np.abs(dx) < 0.00001)
+        active &= ~converged
+        if not active.any():
+            break
+
+        new_v = v + dx
+        outside = (new_v <= low) | (new_v >= high) | ~np.isfinite(new_v)
+        new_v = np.where(outside, (low + high) / 2, new_v)
+        v = np.where(active, new_v, v)
+
+    # Check end result to be non-negative and round to 4 decimal places
+    v = np.where(meet & (v > 0), v, 0)
+    return np.round(v, 4)
@@ -1,33 +1,146 @@
-from datetime import datetime, timedelta
-import trading_calendars
+from datetime import datetime, date, time, timedelta
+from typing import List, Tuple
+
+import numpy as np
+
+from vnpy.trader.utility import load_json, save_json
 
 ANNUAL_DAYS = 240
 
-# Get public holidays data from Shanghai Stock Exchange
-cn_calendar = trading_calendars.get_calendar('XSHG')
-holidays = [x.to_pydatetime() for x in cn_calendar.precomputed_holidays]
+CALENDAR_FILENAME = "option_master_calendar.json"
+
+# Trading sessions of a day, used for intraday time to expiry
+DAY_SESSIONS: List[Tuple[time, time]] = [
+    (time(9, 30), time(11, 30)),
+    (time(13, 0), time(15, 0)),
+]
+
+
+class TradingCalendar:
+    """
+    Business day calendar with public holidays, business days between dates
+    are counted with numpy busday functions in O(log n).
+
+    Holidays are cached into local json file, so trading_calendars is only
+    imported when cache not found.
+    """
+
+    def __init__(self, holidays: List[date], sessions: List[Tuple[time, time]]):
+        """"""
+        self.holidays: List[date] = sorted(holidays)
+        self.sessions: List[Tuple[time, time]] = sessions
+
+        self.busdaycal: np.busdaycalendar = np.busdaycalendar(
+            holidays=np.array(self.holidays, dtype="datetime64[D]")
+        )
+        self.session_minutes: float = sum(
+            get_minutes(end) - get_minutes(start) for start, end in sessions
+        )
+
+    def count_days(self, start: date, end: date) -> int:
+        """
+        Count business days in [start, end).
+        """
+        return int(np.busday_count(start, end, busdaycal=self.busdaycal))
+
+    def is_business_day(self, d: date) -> bool:
+        """"""
+        return bool(np.is_busday(d, busdaycal=self.busdaycal))
+
+    def get_day_fraction(self, dt: datetime) -> float:
+        """
+        Get fraction of trading sessions remaining in the day of dt.
+        """
+        if not self.is_business_day(dt.date()) or not self.session_minutes:
+            return 0
+
+        minutes = get_minutes(dt.time())
+
+        remaining = 0
+        for start, end in self.sessions:
+            start_minutes = get_minutes(start)
+            end_minutes = get_minutes(end)
+
+            if minutes <= start_minutes:
+                remaining += end_minutes - start_minutes
+            elif minutes < end_minutes:
+                remaining += end_minutes - minutes
+
+        return remaining / self.session_minutes
 
-# Filter future public holidays
-start = datetime.today()
-PUBLIC_HOLIDAYS = [x for x in holidays if x >= start]
+
+def get_minutes(t: time) -> float:
+    """"""
+    return t.hour * 60 + t.minute + t.second / 60
+
+
+def load_holidays() -> List[date]:
+    """
+    Load public holidays from cache file, or from trading_calendars if
+    cache not found.
+    """
+    data = load_json(CALENDAR_FILENAME)
+    if data:
+        return [datetime.strptime(d, "%Y-%m-%d").date() for d in data["holidays"]]
+
+    return update_holidays()
+
+
+def update_holidays() -> List[date]:
+    """
+    Get public holidays data from Shanghai Stock Exchange with
+    trading_calendars, and save into cache file.
+    """
+    try:
+        import trading_calendars
+    except ImportError:
+        print("找不到trading_calendars，交易日历只排除周末")
+        return []
+
+    cn_calendar = trading_calendars.get_calendar("XSHG")
+    holidays = [x.date() for x in cn_calendar.precomputed_holidays]
+
+    data = {"holidays": [d.strftime("%Y-%m-%d") for d in holidays]}
+    save_json(CALENDAR_FILENAME, data)
+
+    return holidays
+
+
+calendar = TradingCalendar(load_holidays(), DAY_SESSIONS)
 
 
 def calculate_days_to_expiry(option_expiry: datetime) -> int:
     """"""
-    current_dt = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    days = 1
+    # Count from tomorrow to the day after expiry, plus today
+    today = date.today()
+    start = today + timedelta(days=1)
+    end = option_expiry.date() + timedelta(days=2)
+
+    if option_expiry < datetime.combine(today, time()):
+        return 1
+
+    return calendar.count_days(start, end) + 1
+
 
-    while current_dt <= option_expiry:
-        current_dt += timedelta(days=1)
+def calculate_time_to_expiry(
+    option_expiry: datetime,
+    dt: datetime = None
+) -> float:
+    """
+    Calculate time to expiry in year, with remaining trading sessions of
+    today counted as fraction of a day.
+    """
+    if not dt:
+        dt = datetime.now()
 
-        # Ignore weekends
-        if current_dt.weekday() in [5, 6]:
-            continue
+    start = dt.date() + timedelta(days=1)
+    end = option_expiry.date() + timedelta(days=1)
 
-        # Ignore public holidays
-        if current_dt in PUBLIC_HOLIDAYS:
-            continue
+    days = max(calendar.count_days(start, end), 0)
+    days += calendar.get_day_fraction(dt)
 
-        days += 1
+    # Keep at least one minute to avoid zero time in pricing
+    if calendar.session_minutes:
+        days = max(days, 1 / calendar.session_minutes)
 
-    return days
+    return days / ANNUAL_DAYS
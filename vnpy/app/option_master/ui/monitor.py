@@ -10,7 +10,10 @@ from vnpy.trader.event import (
 )
 from vnpy.trader.utility import round_to
 from ..engine import OptionEngine
-from ..base import UnderlyingData, OptionData, ChainData, PortfolioData
+from ..base import (
+    UnderlyingData, OptionData, ChainData, PortfolioData,
+    EVENT_OPTION_REPRICE
+)
 
 
 COLOR_WHITE = QtGui.QColor("white")
@@ -112,6 +115,7 @@ class OptionMarketMonitor(MonitorTable):
     signal_tick = QtCore.pyqtSignal(Event)
     signal_trade = QtCore.pyqtSignal(Event)
     signal_position = QtCore.pyqtSignal(Event)
+    signal_reprice = QtCore.pyqtSignal(Event)
 
     headers: List[Dict] = [
         {"name": "symbol", "display": "代码", "cell": MonitorCell},
@@ -241,10 +245,12 @@ class OptionMarketMonitor(MonitorTable):
         self.signal_tick.connect(self.process_tick_event)
         self.signal_trade.connect(self.process_trade_event)
         self.signal_position.connect(self.process_position_event)
+        self.signal_reprice.connect(self.process_reprice_event)
 
         self.event_engine.register(EVENT_TICK, self.signal_tick.emit)
         self.event_engine.register(EVENT_TRADE, self.signal_trade.emit)
         self.event_engine.register(EVENT_POSITION, self.signal_position.emit)
+        self.event_engine.register(EVENT_OPTION_REPRICE, self.signal_reprice.emit)
 
     def process_tick_event(self, event: Event) -> None:
         """"""
@@ -252,13 +258,17 @@ class OptionMarketMonitor(MonitorTable):
 
         if tick.vt_symbol in self.option_symbols:
             self.update_price(tick.vt_symbol)
-            self.update_impv(tick.vt_symbol)
-        elif tick.vt_symbol in self.underlying_option_map:
-            option_symbols = self.underlying_option_map[tick.vt_symbol]
 
-            for vt_symbol in option_symbols:
-                self.update_impv(vt_symbol)
-                self.update_greeks(vt_symbol)
+    def process_reprice_event(self, event: Event) -> None:
+        """
+        Impv and greeks are updated after reprice of portfolio.
+        """
+        options: List[OptionData] = event.data
+
+        for option in options:
+            if option.vt_symbol in self.option_symbols:
+                self.update_impv(option.vt_symbol)
+                self.update_greeks(option.vt_symbol)
 
     def process_trade_event(self, event: Event) -> None:
         """"""
@@ -321,9 +331,9 @@ class OptionMarketMonitor(MonitorTable):
 
 class OptionGreeksMonitor(MonitorTable):
     """"""
-    signal_tick = QtCore.pyqtSignal(Event)
     signal_trade = QtCore.pyqtSignal(Event)
     signal_position = QtCore.pyqtSignal(Event)
+    signal_reprice = QtCore.pyqtSignal(Event)
 
     headers: List[Dict] = [
         {"name": "long_pos", "display": "多仓", "cell": PosCell},
@@ -436,22 +446,41 @@ class OptionGreeksMonitor(MonitorTable):
 
     def register_event(self) -> None:
         """"""
-        self.signal_tick.connect(self.process_tick_event)
         self.signal_trade.connect(self.process_trade_event)
         self.signal_position.connect(self.process_position_event)
+        self.signal_reprice.connect(self.process_reprice_event)
 
-        self.event_engine.register(EVENT_TICK, self.signal_tick.emit)
         self.event_engine.register(EVENT_TRADE, self.signal_trade.emit)
         self.event_engine.register(EVENT_POSITION, self.signal_position.emit)
+        self.event_engine.register(EVENT_OPTION_REPRICE, self.signal_reprice.emit)
 
-    def process_tick_event(self, event: Event) -> None:
-        """"""
-        tick = event.data
+    def process_reprice_event(self, event: Event) -> None:
+        """
+        Update rows of options repriced, and their chains, underlyings
+        and portfolio.
+        """
+        options: List[OptionData] = event.data
 
-        if tick.vt_symbol not in self.underlying_option_map:
+        portfolio = options[0].portfolio
+        if portfolio.name != self.portfolio_name:
             return
 
-        self.update_underlying_tick(tick.vt_symbol)
+        chains = {}
+        underlyings = {}
+
+        for option in options:
+            self.update_row(option.vt_symbol, option)
+
+            chains[option.chain.chain_symbol] = option.chain
+            underlyings[option.underlying.vt_symbol] = option.underlying
+
+        for vt_symbol, underlying in underlyings.items():
+            self.update_row(vt_symbol, underlying)
+
+        for chain_symbol, chain in chains.items():
+            self.update_row(chain_symbol, chain)
+
+        self.update_row(portfolio.name, portfolio)
 
     def process_trade_event(self, event: Event) -> None:
         """"""
@@ -469,20 +498,6 @@ class OptionGreeksMonitor(MonitorTable):
 
         self.update_pos(position.vt_symbol)
 
-    def update_underlying_tick(self, vt_symbol: str) -> None:
-        """"""
-        underlying = self.option_engine.get_instrument(vt_symbol)
-        self.update_row(vt_symbol, underlying)
-
-        for chain in underlying.chains.values():
-            self.update_row(chain.chain_symbol, chain)
-
-            for option in chain.options.values():
-                self.update_row(option.vt_symbol, option)
-
-        portfolio = underlying.portfolio
-        self.update_row(portfolio.name, portfolio)
-
     def update_pos(self, vt_symbol: str) -> None:
         """"""
         instrument = self.option_engine.get_instrument(vt_symbol)
@@ -252,6 +252,19 @@ class PortfolioDialog(QtWidgets.QDialog):
 
         form.addRow("Greeks小数位", self.precision_spin)
 
+        # Max rate of repricing
+        self.reprice_spin = QtWidgets.QDoubleSpinBox()
+        self.reprice_spin.setMinimum(0)
+        self.reprice_spin.setMaximum(10)
+        self.reprice_spin.setDecimals(2)
+        self.reprice_spin.setSingleStep(0.1)
+        self.reprice_spin.setSuffix("秒")
+
+        reprice_interval = portfolio_setting.get("reprice_interval", 0.1)
+        self.reprice_spin.setValue(reprice_interval)
+
+        form.addRow("重算间隔", self.reprice_spin)
+
         # Underlying for each chain
         self.combos: Dict[str, QtWidgets.QComboBox] = {}
 
@@ -295,6 +308,7 @@ class PortfolioDialog(QtWidgets.QDialog):
             inverse = True
 
         precision = self.precision_spin.value()
+        reprice_interval = self.reprice_spin.value()
 
         chain_underlying_map = {}
         for chain_symbol, combo in self.combos.items():
@@ -309,7 +323,8 @@ class PortfolioDialog(QtWidgets.QDialog):
             interest_rate,
             chain_underlying_map,
             inverse,
-            precision
+            precision,
+            reprice_interval
         )
 
         result = self.option_engine.init_portfolio(self.portfolio_name)
@@ -53,19 +53,10 @@ class ContractResult:
         else:
             self.last_pos -= trade.volume
 
-    def calculate_pnl(self) -> None:
-        """"""
-        vt_symbol = self.vt_symbol
-
-        contract = self.engine.get_contract(vt_symbol)
-        tick = self.engine.get_tick(vt_symbol)
-        if not contract or not tick:
-            return
-
-        last_price = tick.last_price
-        size = contract.size
-
-        # Sum new trade cost
+    def update_cost(self, size: float) -> None:
+        """
+        Sum volume and cost of new trades.
+        """
         for trade in self.new_trades:
             trade_volume = trade.volume
             trade_cost = trade.price * trade_volume * size
@@ -79,19 +70,6 @@ class ContractResult:
 
         self.new_trades.clear()
 
-        # Calculate trading pnl
-        long_value = self.long_volume * last_price * size
-        long_pnl = long_value - self.long_cost
-
-        shrot_value = self.short_volume * last_price * size
-        short_pnl = self.short_cost - shrot_value
-
-        self.trading_pnl = long_pnl + short_pnl
-
-        # Calculate holding and total pnl
-        self.holding_pnl = (last_price - tick.pre_close) * self.open_pos * size
-        self.total_pnl = self.holding_pnl + self.trading_pnl
-
 
 class PortfolioResult:
     """"""
@@ -104,9 +82,3 @@ class PortfolioResult:
         self.trading_pnl: float = 0
         self.holding_pnl: float = 0
         self.total_pnl: float = 0
-
-    def clear_pnl(self) -> None:
-        """"""
-        self.trading_pnl = 0
-        self.holding_pnl = 0
-        self.total_pnl = 0
@@ -1,6 +1,8 @@
-from typing import Dict, Set
+from typing import Dict, List, Set, Tuple
 from datetime import datetime
 
+import numpy as np
+
 from vnpy.event import Event
 from vnpy.trader.engine import (
     MainEngine,
@@ -21,8 +23,7 @@ from .base import ContractResult, PortfolioResult
 
 APP_NAME = "PortfolioManager"
 
-EVENT_PM_CONTRACT = "ePmContract"
-EVENT_PM_PORTFOLIO = "ePmPortfolio"
+EVENT_PM_UPDATE = "ePmUpdate"
 EVENT_PM_TRADE = "ePmTrade"
 
 
@@ -45,6 +46,12 @@ class PortfolioEngine(BaseEngine):
         self.contract_results: Dict[str, ContractResult] = {}
         self.portfolio_results: Dict[str, PortfolioResult] = {}
 
+        # Results with new trades, or waiting for contract and tick data
+        self.symbol_results: Dict[str, List[ContractResult]] = {}
+        self.symbol_prices: Dict[str, Tuple[float, float]] = {}
+        self.dirty_results: Set[ContractResult] = set()
+        self.waiting_results: Set[ContractResult] = set()
+
         self.timer_count: int = 0
         self.timer_interval: int = 5
 
@@ -83,9 +90,10 @@ class PortfolioEngine(BaseEngine):
         contract_result = self.contract_results.get(key, None)
         if not contract_result:
             contract_result = ContractResult(self, reference, vt_symbol)
-            self.contract_results[key] = contract_result
+            self.add_contract_result(contract_result)
 
         contract_result.update_trade(trade)
+        self.dirty_results.add(contract_result)
 
         # Push trade data with reference
         trade.reference = reference
@@ -109,23 +117,97 @@ class PortfolioEngine(BaseEngine):
             return
         self.timer_count = 0
 
-        for portfolio_result in self.portfolio_results.values():
-            portfolio_result.clear_pnl()
+        self.calculate_pnl()
 
-        for contract_result in self.contract_results.values():
-            contract_result.calculate_pnl()
+    def calculate_pnl(self) -> None:
+        """
+        Calculate pnl of contract results with new trades or price changed,
+        then push all updated results in one event.
+        """
+        dirty_results = self.dirty_results
+        candidates = dirty_results | self.waiting_results
+
+        self.dirty_results = set()
+        self.waiting_results = set()
 
+        # Find symbols with price changed since last calculation
+        for vt_symbol, results in self.symbol_results.items():
+            tick = self.get_tick(vt_symbol)
+            if not tick:
+                continue
+
+            prices = (tick.last_price, tick.pre_close)
+            if prices != self.symbol_prices.get(vt_symbol, None):
+                self.symbol_prices[vt_symbol] = prices
+                candidates.update(results)
+
+        if not candidates:
+            return
+
+        # Collect data of results ready for calculation
+        calculated: List[ContractResult] = []
+        sizes = []
+        last_prices = []
+        pre_closes = []
+
+        for contract_result in candidates:
+            vt_symbol = contract_result.vt_symbol
+
+            contract = self.get_contract(vt_symbol)
+            tick = self.get_tick(vt_symbol)
+            if not contract or not tick:
+                self.waiting_results.add(contract_result)
+                continue
+
+            contract_result.update_cost(contract.size)
+
+            calculated.append(contract_result)
+            sizes.append(contract.size)
+            last_prices.append(tick.last_price)
+            pre_closes.append(tick.pre_close)
+
+        # Calculate pnl of all results with arrays
+        size = np.array(sizes, dtype=float)
+        last_price = np.array(last_prices, dtype=float)
+        pre_close = np.array(pre_closes, dtype=float)
+
+        long_volume = np.array([r.long_volume for r in calculated], dtype=float)
+        short_volume = np.array([r.short_volume for r in calculated], dtype=float)
+        long_cost = np.array([r.long_cost for r in calculated], dtype=float)
+        short_cost = np.array([r.short_cost for r in calculated], dtype=float)
+        open_pos = np.array([r.open_pos for r in calculated], dtype=float)
+
+        trading_pnl = (long_volume - short_volume) * last_price * size - long_cost + short_cost
+        holding_pnl = (last_price - pre_close) * open_pos * size
+        total_pnl = trading_pnl + holding_pnl
+
+        # Update portfolio results with change of contract pnl
+        portfolio_results: Dict[str, PortfolioResult] = {}
+
+        for contract_result, trading, holding, total in zip(
+            calculated,
+            trading_pnl.tolist(),
+            holding_pnl.tolist(),
+            total_pnl.tolist()
+        ):
             portfolio_result = self.get_portfolio_result(contract_result.reference)
-            portfolio_result.trading_pnl += contract_result.trading_pnl
-            portfolio_result.holding_pnl += contract_result.holding_pnl
-            portfolio_result.total_pnl += contract_result.total_pnl
+            portfolio_result.trading_pnl += trading - contract_result.trading_pnl
+            portfolio_result.holding_pnl += holding - contract_result.holding_pnl
+            portfolio_result.total_pnl += total - contract_result.total_pnl
+            portfolio_results[contract_result.reference] = portfolio_result
+
+            contract_result.trading_pnl = trading
+            contract_result.holding_pnl = holding
+            contract_result.total_pnl = total
 
-            event = Event(EVENT_PM_CONTRACT, contract_result)
-            self.event_engine.put(event)
+        # Results with new trades are pushed even if not calculated
+        contract_results = calculated + list(dirty_results & self.waiting_results)
 
-        for portfolio_result in self.portfolio_results.values():
-            event = Event(EVENT_PM_PORTFOLIO, portfolio_result)
-            self.event_engine.put(event)
+        data = {
+            "contracts": contract_results,
+            "portfolios": list(portfolio_results.values())
+        }
+        self.event_engine.put(Event(EVENT_PM_UPDATE, data))
 
     def process_contract_event(self, event: Event) -> None:
         """"""
@@ -158,12 +240,12 @@ class PortfolioEngine(BaseEngine):
                 date_changed = True
 
             self.result_symbols.add(vt_symbol)
-            self.contract_results[(reference, vt_symbol)] = ContractResult(
+            self.add_contract_result(ContractResult(
                 self,
                 reference,
                 vt_symbol,
                 pos
-            )
+            ))
 
         # Re-save latest data if date changed
         if date_changed:
@@ -216,6 +298,15 @@ class PortfolioEngine(BaseEngine):
         self.save_data()
         self.save_order()
 
+    def add_contract_result(self, contract_result: ContractResult) -> None:
+        """"""
+        vt_symbol = contract_result.vt_symbol
+        key = (contract_result.reference, vt_symbol)
+
+        self.contract_results[key] = contract_result
+        self.symbol_results.setdefault(vt_symbol, []).append(contract_result)
+        self.dirty_results.add(contract_result)
+
     def get_portfolio_result(self, reference: str) -> PortfolioResult:
         """"""
         portfolio_result = self.portfolio_results.get(reference, None)
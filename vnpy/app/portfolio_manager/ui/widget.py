@@ -15,8 +15,7 @@ from vnpy.trader.ui.widget import (
 from ..base import ContractResult, PortfolioResult
 from ..engine import (
     APP_NAME,
-    EVENT_PM_CONTRACT,
-    EVENT_PM_PORTFOLIO,
+    EVENT_PM_UPDATE,
     EVENT_TRADE,
     PortfolioEngine
 )
@@ -30,8 +29,7 @@ WHITE_COLOR = QtGui.QColor("white")
 class PortfolioManager(QtWidgets.QWidget):
     """"""
 
-    signal_contract = QtCore.pyqtSignal(Event)
-    signal_portfolio = QtCore.pyqtSignal(Event)
+    signal_update = QtCore.pyqtSignal(Event)
     signal_trade = QtCore.pyqtSignal(Event)
 
     def __init__(self, main_engine: MainEngine, event_engine: EventEngine) -> None:
@@ -121,12 +119,10 @@ class PortfolioManager(QtWidgets.QWidget):
 
     def register_event(self) -> None:
         """"""
-        self.signal_contract.connect(self.process_contract_event)
-        self.signal_portfolio.connect(self.process_portfolio_event)
+        self.signal_update.connect(self.process_update_event)
         self.signal_trade.connect(self.process_trade_event)
 
-        self.event_engine.register(EVENT_PM_CONTRACT, self.signal_contract.emit)
-        self.event_engine.register(EVENT_PM_PORTFOLIO, self.signal_portfolio.emit)
+        self.event_engine.register(EVENT_PM_UPDATE, self.signal_update.emit)
         self.event_engine.register(EVENT_TRADE, self.signal_trade.emit)
 
     def update_trades(self) -> None:
@@ -172,10 +168,18 @@ class PortfolioManager(QtWidgets.QWidget):
 
         return contract_item
 
-    def process_contract_event(self, event: Event) -> None:
+    def process_update_event(self, event: Event) -> None:
         """"""
-        contract_result: ContractResult = event.data
+        data: dict = event.data
 
+        for contract_result in data["contracts"]:
+            self.update_contract(contract_result)
+
+        for portfolio_result in data["portfolios"]:
+            self.update_portfolio(portfolio_result)
+
+    def update_contract(self, contract_result: ContractResult) -> None:
+        """"""
         contract_item = self.get_contract_item(
             contract_result.reference,
             contract_result.vt_symbol
@@ -190,10 +194,8 @@ class PortfolioManager(QtWidgets.QWidget):
 
         self.update_item_color(contract_item, contract_result)
 
-    def process_portfolio_event(self, event: Event) -> None:
+    def update_portfolio(self, portfolio_result: PortfolioResult) -> None:
         """"""
-        portfolio_result: PortfolioResult = event.data
-
         portfolio_item = self.get_portfolio_item(portfolio_result.reference)
         portfolio_item.setText(4, str(portfolio_result.trading_pnl))
         portfolio_item.setText(5, str(portfolio_result.holding_pnl))
@@ -8,13 +8,14 @@ import traceback
 import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from pandas import DataFrame
+from pandas import DataFrame, DatetimeIndex, concat
 
-from vnpy.trader.constant import Direction, Offset, Interval, Status
+from vnpy.trader.constant import Direction, Exchange, Offset, Interval, Status
 from vnpy.trader.database import database_manager
 from vnpy.trader.object import OrderData, TradeData, BarData
 from vnpy.trader.utility import round_to, extract_vt_symbol
 
+from .base import load_concurrently
 from .template import StrategyTemplate
 
 
@@ -53,6 +54,10 @@ class BacktestingEngine:
         self.history_data: Dict[Tuple, BarData] = {}
         self.dts: Set[datetime] = set()
 
+        self.columnar: bool = False
+        self.load_workers: int = 4
+        self.bar_array: AlignedBarArray = None
+
         self.limit_order_count = 0
         self.limit_orders = {}
         self.active_limit_orders = {}
@@ -95,9 +100,18 @@ class BacktestingEngine:
         priceticks: Dict[str, float],
         capital: int = 0,
         end: datetime = None,
-        risk_free: float = 0
+        risk_free: float = 0,
+        columnar: bool = False,
+        load_workers: int = 4
     ) -> None:
-        """"""
+        """
+        Set columnar to True for replaying bar history from arrays aligned
+        by datetime and vt_symbol, with gaps forward-filled once after
+        loading instead of during replay.
+
+        load_workers is the max number of concurrent database queries when
+        loading history data.
+        """
         self.vt_symbols = vt_symbols
         self.interval = interval
 
@@ -110,6 +124,8 @@ class BacktestingEngine:
         self.end = end
         self.capital = capital
         self.risk_free = risk_free
+        self.columnar = columnar
+        self.load_workers = load_workers
 
     def add_strategy(self, strategy_class: type, setting: dict) -> None:
         """"""
@@ -131,47 +147,80 @@ class BacktestingEngine:
         # Clear previously loaded history data
         self.history_data.clear()
         self.dts.clear()
+        self.bar_array = None
 
-        # Load 30 days of data each time and allow for progress update
+        # Load 30 days of data each time, slices of all vt_symbols are
+        # loaded concurrently and merged as they arrive
         progress_delta = timedelta(days=30)
-        total_delta = self.end - self.start
         interval_delta = INTERVAL_DELTA_MAP[self.interval]
 
+        args_list = []
         for vt_symbol in self.vt_symbols:
             start = self.start
             end = self.start + progress_delta
-            progress = 0
 
-            data_count = 0
             while start < self.end:
                 end = min(end, self.end)  # Make sure end time stays within set range
+                args_list.append((vt_symbol, self.interval, start, end))
 
-                data = load_bar_data(
-                    vt_symbol,
-                    self.interval,
-                    start,
-                    end
-                )
+                start = end + interval_delta
+                end += (progress_delta + interval_delta)
 
+        if self.columnar:
+            load_func = load_bar_frame
+        else:
+            load_func = load_bar_data
+
+        slice_counts: Dict[str, int] = defaultdict(int)
+        for args in args_list:
+            slice_counts[args[0]] += 1
+
+        data_counts: Dict[str, int] = defaultdict(int)
+        frames: Dict[str, List[Tuple[datetime, DataFrame]]] = defaultdict(list)
+
+        for args, data in load_concurrently(
+            load_func,
+            args_list,
+            self.load_workers,
+            self.output
+        ):
+            vt_symbol, _, start, _ = args
+
+            if self.columnar:
+                frames[vt_symbol].append((start, data))
+            else:
                 for bar in data:
                     self.dts.add(bar.datetime)
                     self.history_data[(bar.datetime, vt_symbol)] = bar
-                    data_count += 1
-
-                progress += progress_delta / total_delta
-                progress = min(progress, 1)
-                progress_bar = "#" * int(progress * 10)
-                self.output(f"{vt_symbol}加载进度：{progress_bar} [{progress:.0%}]")
-
-                start = end + interval_delta
-                end += (progress_delta + interval_delta)
 
-            self.output(f"{vt_symbol}历史数据加载完成，数据量：{data_count}")
+            data_counts[vt_symbol] += len(data)
+            slice_counts[vt_symbol] -= 1
+
+            if not slice_counts[vt_symbol]:
+                self.output(f"{vt_symbol}历史数据加载完成，数据量：{data_counts[vt_symbol]}")
+
+        # Align bar data of all vt_symbols by datetime
+        if self.columnar:
+            self.bar_array = AlignedBarArray(
+                self.vt_symbols,
+                self.interval,
+                {
+                    vt_symbol: concat(
+                        [df for _, df in sorted(frames[vt_symbol], key=lambda x: x[0])],
+                        ignore_index=True
+                    )
+                    for vt_symbol in self.vt_symbols if frames[vt_symbol]
+                }
+            )
 
         self.output("所有历史数据加载完成")
 
     def run_backtesting(self) -> None:
         """"""
+        if self.columnar:
+            self.run_columnar_backtesting()
+            return
+
         self.strategy.on_init()
 
         # Generate sorted datetime list
@@ -213,6 +262,98 @@ class BacktestingEngine:
 
         self.output("历史数据回放结束")
 
+    def run_columnar_backtesting(self) -> None:
+        """
+        Replay bar history from aligned arrays.
+
+        Strategy receives AlignedBarView objects instead of BarData, order
+        matching is skipped if no active order, and daily close prices are
+        calculated once after replay.
+        """
+        bar_array = self.bar_array
+        if not bar_array:
+            self.output("历史数据不足，回测终止")
+            return
+
+        self.strategy.on_init()
+
+        # Use the first [days] of history data for initializing strategy
+        day_count = 0
+        ix = 0
+        end_ix = 0
+
+        for ix, dt in enumerate(bar_array.datetime):
+            if self.datetime and dt.day != self.datetime.day:
+                day_count += 1
+                if day_count >= self.days:
+                    break
+
+            try:
+                self.new_bar_views(ix)
+            except Exception:
+                self.update_daily_closes(end_ix)
+                self.output("触发异常，回测终止")
+                self.output(traceback.format_exc())
+                return
+
+            end_ix = ix + 1
+
+        self.strategy.inited = True
+        self.output("策略初始化完成")
+
+        self.strategy.on_start()
+        self.strategy.trading = True
+        self.output("开始回放历史数据")
+
+        # Use the rest of history data for running backtesting
+        for ix in range(ix, len(bar_array)):
+            try:
+                self.new_bar_views(ix)
+            except Exception:
+                self.update_daily_closes(end_ix)
+                self.output("触发异常，回测终止")
+                self.output(traceback.format_exc())
+                return
+
+            end_ix = ix + 1
+
+        self.update_daily_closes(end_ix)
+        self.output("历史数据回放结束")
+
+    def new_bar_views(self, ix: int) -> None:
+        """"""
+        bar_array = self.bar_array
+        self.datetime = bar_array.datetime[ix]
+
+        # Symbols are added into dict after first bar received
+        bars = self.bars
+        for vt_symbol in bar_array.starts.get(ix, []):
+            bars[vt_symbol] = None
+
+        for vt_symbol in bars.keys():
+            bars[vt_symbol] = AlignedBarView(bar_array, vt_symbol, ix)
+
+        if self.active_limit_orders:
+            self.cross_limit_order()
+        self.strategy.on_bars(bars)
+
+    def update_daily_closes(self, end_ix: int) -> None:
+        """
+        Generate daily results with close prices of the last bar in each
+        day replayed.
+        """
+        bar_array = self.bar_array
+
+        for ix in bar_array.get_day_ends(end_ix):
+            dt = bar_array.datetime[ix]
+
+            close_prices = {}
+            for vt_symbol, start_ix in bar_array.start_ixs.items():
+                if start_ix <= ix:
+                    close_prices[vt_symbol] = bar_array.columns[vt_symbol][3][ix]
+
+            self.daily_results[dt.date()] = PortfolioDailyResult(dt.date(), close_prices)
+
     def calculate_result(self) -> None:
         """"""
         self.output("开始计算逐日盯市盈亏")
@@ -834,6 +975,218 @@ class PortfolioDailyResult:
                 contract_result.update_close_price(close_price)
 
 
+class AlignedBarArray:
+    """
+    Bar history of all vt_symbols aligned by datetime into 2-D arrays with
+    shape (datetime, vt_symbol).
+
+    Gaps after the first bar of each vt_symbol are backfilled once with
+    previous close price and zero volume.
+    """
+
+    def __init__(
+        self,
+        vt_symbols: List[str],
+        interval: Interval,
+        frames: Dict[str, DataFrame]
+    ):
+        """"""
+        self.vt_symbols: List[str] = [v for v in vt_symbols if v in frames]
+        self.interval: Interval = interval
+
+        # Union of datetimes of all vt_symbols
+        indexes = {
+            vt_symbol: DatetimeIndex(frames[vt_symbol]["datetime"])
+            for vt_symbol in self.vt_symbols
+        }
+
+        index = None
+        for vt_index in indexes.values():
+            if index is None:
+                index = vt_index
+            else:
+                index = index.union(vt_index)
+
+        if index is None:
+            index = DatetimeIndex([])
+        index = index.unique().sort_values()
+
+        self.size: int = len(index)
+        self.datetime: List[datetime] = index.to_pydatetime().tolist()
+        self.days: np.ndarray = np.array(
+            [dt.toordinal() for dt in self.datetime], dtype=np.int64
+        )
+
+        shape = (self.size, len(self.vt_symbols))
+        self.open_price: np.ndarray = np.zeros(shape)
+        self.high_price: np.ndarray = np.zeros(shape)
+        self.low_price: np.ndarray = np.zeros(shape)
+        self.close_price: np.ndarray = np.zeros(shape)
+        self.volume: np.ndarray = np.zeros(shape)
+        self.open_interest: np.ndarray = np.zeros(shape)
+
+        self.start_ixs: Dict[str, int] = {}
+        self.starts: Dict[int, List[str]] = defaultdict(list)
+        self.columns: Dict[str, tuple] = {}
+        self.info: Dict[str, tuple] = {}
+
+        rows = np.arange(self.size)
+
+        for n, vt_symbol in enumerate(self.vt_symbols):
+            df = frames[vt_symbol]
+            vt_index = indexes[vt_symbol]
+
+            # Drop duplicated datetimes, keep the last one as dict did
+            unique = ~vt_index.duplicated(keep="last")
+            df = df[unique]
+            ixs = index.get_indexer(vt_index[unique])
+
+            close = df["close_price"].to_numpy(dtype=float)
+
+            # Row of last existing bar for each datetime
+            last = np.full(self.size, -1)
+            last[ixs] = ixs
+            last = np.maximum.accumulate(last)
+
+            start_ix = int(ixs.min()) if len(ixs) else self.size
+            self.start_ixs[vt_symbol] = start_ix
+            self.starts[start_ix].append(vt_symbol)
+
+            # Backfill price with previous close, volume stays zero
+            filled = np.zeros(self.size)
+            filled[ixs] = close
+            filled = filled[np.maximum(last, 0)]
+            for array in [self.open_price, self.high_price, self.low_price]:
+                array[:, n] = filled
+            self.close_price[:, n] = filled
+
+            self.open_price[ixs, n] = df["open_price"].to_numpy(dtype=float)
+            self.high_price[ixs, n] = df["high_price"].to_numpy(dtype=float)
+            self.low_price[ixs, n] = df["low_price"].to_numpy(dtype=float)
+            self.volume[ixs, n] = df["volume"].to_numpy(dtype=float)
+            self.open_interest[ixs, n] = df["open_interest"].to_numpy(dtype=float)
+
+            self.open_price[rows < start_ix, n] = 0
+            self.high_price[rows < start_ix, n] = 0
+            self.low_price[rows < start_ix, n] = 0
+            self.close_price[rows < start_ix, n] = 0
+
+            # Python float lists for fast scalar access during replay
+            self.columns[vt_symbol] = (
+                self.open_price[:, n].tolist(),
+                self.high_price[:, n].tolist(),
+                self.low_price[:, n].tolist(),
+                self.close_price[:, n].tolist(),
+                self.volume[:, n].tolist(),
+                self.open_interest[:, n].tolist(),
+            )
+
+            symbol, exchange_value = vt_symbol.rsplit(".", 1)
+            self.info[vt_symbol] = (symbol, Exchange(exchange_value))
+
+    def get_day_ends(self, end_ix: int) -> List[int]:
+        """
+        Get index of the last datetime in each day before end_ix.
+        """
+        days = self.days[:end_ix]
+        if not len(days):
+            return []
+
+        ends = np.flatnonzero(np.diff(days)).tolist()
+        ends.append(len(days) - 1)
+        return ends
+
+    def __len__(self) -> int:
+        """"""
+        return self.size
+
+    def __bool__(self) -> bool:
+        """"""
+        return bool(self.size)
+
+
+class AlignedBarView:
+    """
+    Read-only view of one bar in AlignedBarArray, with the same fields as
+    BarData.
+    """
+
+    __slots__ = ("_array", "_columns", "_vt_symbol", "_ix")
+
+    def __init__(self, array: AlignedBarArray, vt_symbol: str, ix: int):
+        """"""
+        self._array: AlignedBarArray = array
+        self._columns: tuple = array.columns[vt_symbol]
+        self._vt_symbol: str = vt_symbol
+        self._ix: int = ix
+
+    @property
+    def symbol(self) -> str:
+        return self._array.info[self._vt_symbol][0]
+
+    @property
+    def exchange(self) -> Exchange:
+        return self._array.info[self._vt_symbol][1]
+
+    @property
+    def vt_symbol(self) -> str:
+        return self._vt_symbol
+
+    @property
+    def interval(self) -> Interval:
+        return self._array.interval
+
+    @property
+    def gateway_name(self) -> str:
+        return "DB"
+
+    @property
+    def datetime(self) -> datetime:
+        return self._array.datetime[self._ix]
+
+    @property
+    def open_price(self) -> float:
+        return self._columns[0][self._ix]
+
+    @property
+    def high_price(self) -> float:
+        return self._columns[1][self._ix]
+
+    @property
+    def low_price(self) -> float:
+        return self._columns[2][self._ix]
+
+    @property
+    def close_price(self) -> float:
+        return self._columns[3][self._ix]
+
+    @property
+    def volume(self) -> float:
+        return self._columns[4][self._ix]
+
+    @property
+    def open_interest(self) -> float:
+        return self._columns[5][self._ix]
+
+    def to_bar(self) -> BarData:
+        """
+        Create BarData object with same data.
+        """
+        return BarData(
+            symbol=self.symbol,
+            exchange=self.exchange,
+            datetime=self.datetime,
+            interval=self.interval,
+            volume=self.volume,
+            open_interest=self.open_interest,
+            open_price=self.open_price,
+            high_price=self.high_price,
+            low_price=self.low_price,
+            close_price=self.close_price,
+            gateway_name=self.gateway_name
+        )
+
+
 @lru_cache(maxsize=999)
 def load_bar_data(
     vt_symbol: str,
@@ -847,3 +1200,18 @@ def load_bar_data(
     return database_manager.load_bar_data(
         symbol, exchange, interval, start, end
     )
+
+
+@lru_cache(maxsize=999)
+def load_bar_frame(
+    vt_symbol: str,
+    interval: Interval,
+    start: datetime,
+    end: datetime
+):
+    """"""
+    symbol, exchange = extract_vt_symbol(vt_symbol)
+
+    return database_manager.load_bar_frame(
+        symbol, exchange, interval, start, end
+    )
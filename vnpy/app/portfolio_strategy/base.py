@@ -2,7 +2,10 @@
 Defines constants and objects used in PortfolioStrategy App.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
+from time import perf_counter
+from typing import Any, Callable, Iterator, List, Tuple
 
 
 APP_NAME = "PortfolioStrategy"
@@ -15,3 +18,52 @@ class EngineType(Enum):
 
 EVENT_PORTFOLIO_LOG = "ePortfolioLog"
 EVENT_PORTFOLIO_STRATEGY = "ePortfolioStrategy"
+
+
+def load_concurrently(
+    func: Callable,
+    args_list: List[tuple],
+    max_workers: int,
+    output: Callable[[str], None]
+) -> Iterator[Tuple[tuple, Any]]:
+    """
+    Call func with each args in thread pool, and yield (args, result) in
+    the order of completion, so that results can be merged as they arrive.
+
+    Aggregate progress and throughput are reported with output, result of
+    func should be a sized collection of loaded data.
+    """
+    if not args_list:
+        return
+
+    start_time = perf_counter()
+    total = len(args_list)
+    data_count = 0
+    progress_step = 1
+
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        futures = {executor.submit(func, *args): args for args in args_list}
+
+        try:
+            for n, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                data_count += len(result)
+
+                yield futures[future], result
+
+                # Report progress every 10 percent
+                progress = n / total
+                if int(progress * 10) < progress_step and n < total:
+                    continue
+                progress_step = int(progress * 10) + 1
+
+                cost = max(perf_counter() - start_time, 1e-6)
+                progress_bar = "#" * int(progress * 10)
+                output(
+                    f"加载进度：{progress_bar} [{progress:.0%}]，"
+                    f"数据量：{data_count}，速度：{data_count / cost:.0f}条/秒"
+                )
+        finally:
+            # Skip pending tasks if stopped by exception
+            for future in futures:
+                future.cancel()
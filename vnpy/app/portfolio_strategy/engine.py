@@ -45,7 +45,8 @@ from vnpy.trader.converter import OffsetConverter
 from .base import (
     APP_NAME,
     EVENT_PORTFOLIO_LOG,
-    EVENT_PORTFOLIO_STRATEGY
+    EVENT_PORTFOLIO_STRATEGY,
+    load_concurrently
 )
 from .template import StrategyTemplate
 
@@ -70,6 +71,9 @@ class StrategyEngine(BaseEngine):
 
         self.init_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
 
+        # Max number of concurrent database queries when loading bars
+        self.load_workers: int = 4
+
         self.vt_tradeids: Set[str] = set()
 
         self.offset_converter: OffsetConverter = OffsetConverter(self.main_engine)
@@ -243,9 +247,30 @@ class StrategyEngine(BaseEngine):
         dts: Set[datetime] = set()
         history_data: Dict[Tuple, BarData] = {}
 
-        # Load data from rqdata/gateway/database
+        end = datetime.now(get_localzone())
+        start = end - timedelta(days)
+
+        # Query data from gateway/rqdata one by one, to avoid rate limit
+        args_list = []
+
         for vt_symbol in vt_symbols:
-            data = self.load_bar(vt_symbol, days, interval)
+            data = self.query_bar(vt_symbol, interval, start, end)
+
+            if data:
+                for bar in data:
+                    dts.add(bar.datetime)
+                    history_data[(bar.datetime, vt_symbol)] = bar
+            else:
+                args_list.append((vt_symbol, interval, start, end))
+
+        # Load the rest from database concurrently
+        for args, data in load_concurrently(
+            self.load_database_bar,
+            args_list,
+            self.load_workers,
+            lambda msg: self.write_log(msg, strategy)
+        ):
+            vt_symbol = args[0]
 
             for bar in data:
                 dts.add(bar.datetime)
@@ -284,9 +309,26 @@ class StrategyEngine(BaseEngine):
 
     def load_bar(self, vt_symbol: str, days: int, interval: Interval) -> List[BarData]:
         """"""
-        symbol, exchange = extract_vt_symbol(vt_symbol)
         end = datetime.now(get_localzone())
         start = end - timedelta(days)
+
+        data = self.query_bar(vt_symbol, interval, start, end)
+        if not data:
+            data = self.load_database_bar(vt_symbol, interval, start, end)
+
+        return data
+
+    def query_bar(
+        self,
+        vt_symbol: str,
+        interval: Interval,
+        start: datetime,
+        end: datetime
+    ) -> List[BarData]:
+        """
+        Query bars from gateway or RQData.
+        """
+        symbol, exchange = extract_vt_symbol(vt_symbol)
         contract: ContractData = self.main_engine.get_contract(vt_symbol)
         data = []
 
@@ -300,21 +342,30 @@ class StrategyEngine(BaseEngine):
                 end=end
             )
             data = self.main_engine.query_history(req, contract.gateway_name)
-        # Try to query bars from RQData, if not found, load from database.
+        # Try to query bars from RQData
         else:
             data = self.query_bar_from_rq(symbol, exchange, interval, start, end)
 
-        if not data:
-            data = database_manager.load_bar_data(
-                symbol=symbol,
-                exchange=exchange,
-                interval=interval,
-                start=start,
-                end=end,
-            )
-
         return data
 
+    def load_database_bar(
+        self,
+        vt_symbol: str,
+        interval: Interval,
+        start: datetime,
+        end: datetime
+    ) -> List[BarData]:
+        """"""
+        symbol, exchange = extract_vt_symbol(vt_symbol)
+
+        return database_manager.load_bar_data(
+            symbol=symbol,
+            exchange=exchange,
+            interval=interval,
+            start=start,
+            end=end,
+        )
+
     def call_strategy_func(
         self, strategy: StrategyTemplate, func: Callable, params: Any = None
     ):
@@ -1,11 +1,18 @@
 """"""
 
-from collections import defaultdict
-from vnpy.trader.object import OrderRequest, LogData
-from vnpy.event import Event, EventEngine, EVENT_TIMER
+from collections import defaultdict, deque
+from time import perf_counter
+from typing import Deque, Dict, Tuple
+
+from vnpy.trader.object import (
+    OrderRequest, LogData, OrderData, TradeData, PositionData
+)
+from vnpy.event import Event, EventEngine
 from vnpy.trader.engine import BaseEngine, MainEngine
-from vnpy.trader.event import EVENT_TRADE, EVENT_ORDER, EVENT_LOG
-from vnpy.trader.constant import Status
+from vnpy.trader.event import (
+    EVENT_TRADE, EVENT_ORDER, EVENT_POSITION, EVENT_LOG
+)
+from vnpy.trader.constant import Direction, Status
 from vnpy.trader.utility import load_json, save_json
 
 
@@ -22,11 +29,10 @@ class RiskManagerEngine(BaseEngine):
 
         self.active = False
 
-        self.order_flow_count = 0
+        # Send time of orders in sliding window of order_flow_clear seconds
         self.order_flow_limit = 50
-
         self.order_flow_clear = 1
-        self.order_flow_timer = 0
+        self.order_flow_times: Deque[float] = deque()
 
         self.order_size_limit = 100
 
@@ -36,10 +42,40 @@ class RiskManagerEngine(BaseEngine):
         self.order_cancel_limit = 500
         self.order_cancel_counts = defaultdict(int)
 
+        # Active orders are tracked with order events
         self.active_order_limit = 50
+        self.active_orders: Dict[str, OrderData] = {}
+
+        # Reference of order is kept until all its trades are attributed,
+        # traded volume of terminal order is kept in finished_orders
+        self.order_references: Dict[str, str] = {}
+        self.order_traded: Dict[str, float] = defaultdict(float)
+        self.finished_orders: Dict[str, float] = {}
+
+        # Net position(long as positive) and notional, 0 limit is not checked
+        self.symbol_position_limit = 0
+        self.symbol_notional_limit = 0
+        self.strategy_position_limit = 0
+        self.strategy_notional_limit = 0
+
+        # Net position of symbol is reset with position data from gateway
+        # and updated with trades between position updates
+        self.symbol_positions: Dict[str, float] = defaultdict(float)
+        self.gateway_positions: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self.strategy_positions: Dict[Tuple[str, str], float] = defaultdict(float)
+        self.strategy_notionals: Dict[str, float] = defaultdict(float)
+        self.strategy_contributions: Dict[Tuple[str, str], float] = defaultdict(float)
+        self.prices: Dict[str, float] = {}
+        self.sizes: Dict[str, float] = {}
+
+        # Statistics of check latency
+        self.check_count = 0
+        self.check_total = 0
+        self.check_max = 0
 
         self.load_setting()
         self.register_event()
+        self.init_positions()
         self.patch_send_order()
 
     def patch_send_order(self):
@@ -51,10 +87,19 @@ class RiskManagerEngine(BaseEngine):
 
     def send_order(self, req: OrderRequest, gateway_name: str):
         """"""
+        start = perf_counter()
         result = self.check_risk(req, gateway_name)
+
+        latency = perf_counter() - start
+        self.check_count += 1
+        self.check_total += latency
+        self.check_max = max(self.check_max, latency)
+
         if not result:
             return ""
 
+        # Active orders and references are tracked only with order events,
+        # since terminal event may be processed before send_order returns
         return self._send_order(req, gateway_name)
 
     def update_setting(self, setting: dict):
@@ -67,6 +112,11 @@ class RiskManagerEngine(BaseEngine):
         self.active_order_limit = setting["active_order_limit"]
         self.order_cancel_limit = setting["order_cancel_limit"]
 
+        self.symbol_position_limit = setting.get("symbol_position_limit", 0)
+        self.symbol_notional_limit = setting.get("symbol_notional_limit", 0)
+        self.strategy_position_limit = setting.get("strategy_position_limit", 0)
+        self.strategy_notional_limit = setting.get("strategy_notional_limit", 0)
+
         if self.active:
             self.write_log("交易风控功能启动")
         else:
@@ -82,9 +132,28 @@ class RiskManagerEngine(BaseEngine):
             "trade_limit": self.trade_limit,
             "active_order_limit": self.active_order_limit,
             "order_cancel_limit": self.order_cancel_limit,
+            "symbol_position_limit": self.symbol_position_limit,
+            "symbol_notional_limit": self.symbol_notional_limit,
+            "strategy_position_limit": self.strategy_position_limit,
+            "strategy_notional_limit": self.strategy_notional_limit,
         }
         return setting
 
+    def get_check_latency(self) -> dict:
+        """
+        Get count, average and max seconds of risk check.
+        """
+        if self.check_count:
+            average = self.check_total / self.check_count
+        else:
+            average = 0
+
+        return {
+            "count": self.check_count,
+            "average": average,
+            "max": self.check_max
+        }
+
     def load_setting(self):
         """"""
         setting = load_json(self.setting_filename)
@@ -101,28 +170,124 @@ class RiskManagerEngine(BaseEngine):
     def register_event(self):
         """"""
         self.event_engine.register(EVENT_TRADE, self.process_trade_event)
-        self.event_engine.register(EVENT_TIMER, self.process_timer_event)
         self.event_engine.register(EVENT_ORDER, self.process_order_event)
+        self.event_engine.register(EVENT_POSITION, self.process_position_event)
+
+    def init_positions(self):
+        """
+        Seed net position of symbols with positions already received.
+        """
+        for position in self.main_engine.get_all_positions():
+            self.update_position(position)
+
+    def process_position_event(self, event: Event):
+        """"""
+        position: PositionData = event.data
+        self.update_position(position)
+
+    def update_position(self, position: PositionData):
+        """"""
+        if position.direction == Direction.SHORT:
+            volume = -position.volume
+        else:
+            volume = position.volume
+
+        positions = self.gateway_positions[position.vt_symbol]
+        positions[position.vt_positionid] = volume
+        self.symbol_positions[position.vt_symbol] = sum(positions.values())
 
     def process_order_event(self, event: Event):
         """"""
-        order = event.data
+        order: OrderData = event.data
+        vt_orderid = order.vt_orderid
+
+        if order.is_active():
+            self.active_orders[vt_orderid] = order
+            self.order_references[vt_orderid] = order.reference
+        else:
+            self.active_orders.pop(vt_orderid, None)
+
+            if vt_orderid in self.order_references or vt_orderid in self.order_traded:
+                self.finished_orders[vt_orderid] = order.traded
+                self.check_finished(vt_orderid)
+
         if order.status != Status.CANCELLED:
             return
         self.order_cancel_counts[order.symbol] += 1
 
     def process_trade_event(self, event: Event):
         """"""
-        trade = event.data
+        trade: TradeData = event.data
         self.trade_count += trade.volume
 
-    def process_timer_event(self, event: Event):
+        vt_symbol = trade.vt_symbol
+        if trade.direction == Direction.LONG:
+            change = trade.volume
+        else:
+            change = -trade.volume
+
+        self.symbol_positions[vt_symbol] += change
+        self.prices[vt_symbol] = trade.price
+
+        # Update notional of strategy with contribution of this symbol
+        reference = self.order_references.get(trade.vt_orderid, "")
+        key = (reference, vt_symbol)
+
+        self.strategy_positions[key] += change
+        contribution = abs(self.strategy_positions[key]) * trade.price * self.get_size(vt_symbol)
+
+        self.strategy_notionals[reference] += contribution - self.strategy_contributions[key]
+        self.strategy_contributions[key] = contribution
+
+        self.order_traded[trade.vt_orderid] += trade.volume
+        self.check_finished(trade.vt_orderid)
+
+    def check_finished(self, vt_orderid: str):
+        """
+        Remove reference of terminal order after all its trades attributed.
+        """
+        traded = self.finished_orders.get(vt_orderid, None)
+        if traded is None or self.order_traded[vt_orderid] < traded:
+            return
+
+        self.finished_orders.pop(vt_orderid)
+        self.order_traded.pop(vt_orderid, None)
+        self.order_references.pop(vt_orderid, None)
+
+    def get_pending(self, req: OrderRequest, reference: str = None) -> float:
+        """
+        Get untraded volume of active orders in same direction as request,
+        filtered by strategy reference if given.
+        """
+        pending = 0
+
+        for order in self.active_orders.values():
+            if (
+                order.vt_symbol != req.vt_symbol
+                or order.direction != req.direction
+                or (reference is not None and order.reference != reference)
+            ):
+                continue
+            pending += order.volume - order.traded
+
+        if req.direction == Direction.LONG:
+            return pending
+        else:
+            return -pending
+
+    def get_size(self, vt_symbol: str) -> float:
         """"""
-        self.order_flow_timer += 1
+        size = self.sizes.get(vt_symbol, 0)
 
-        if self.order_flow_timer >= self.order_flow_clear:
-            self.order_flow_count = 0
-            self.order_flow_timer = 0
+        if not size:
+            contract = self.main_engine.get_contract(vt_symbol)
+            if not contract:
+                return 1
+
+            size = contract.size
+            self.sizes[vt_symbol] = size
+
+        return size
 
     def write_log(self, msg: str):
         """"""
@@ -151,14 +316,19 @@ class RiskManagerEngine(BaseEngine):
                 f"今日总成交合约数量{self.trade_count}，超过限制{self.trade_limit}")
             return False
 
-        # Check flow count
-        if self.order_flow_count >= self.order_flow_limit:
+        # Check flow count in sliding window
+        now = perf_counter()
+        flow_times = self.order_flow_times
+        while flow_times and flow_times[0] <= now - self.order_flow_clear:
+            flow_times.popleft()
+
+        if len(flow_times) >= self.order_flow_limit:
             self.write_log(
-                f"委托流数量{self.order_flow_count}，超过限制每{self.order_flow_clear}秒{self.order_flow_limit}次")
+                f"委托流数量{len(flow_times)}，超过限制每{self.order_flow_clear}秒{self.order_flow_limit}次")
             return False
 
         # Check all active orders
-        active_order_count = len(self.main_engine.get_all_active_orders())
+        active_order_count = len(self.active_orders)
         if active_order_count >= self.active_order_limit:
             self.write_log(
                 f"当前活动委托次数{active_order_count}，超过限制{self.active_order_limit}")
@@ -170,6 +340,81 @@ class RiskManagerEngine(BaseEngine):
                 f"当日{req.symbol}撤单次数{self.order_cancel_counts[req.symbol]}，超过限制{self.order_cancel_limit}")
             return False
 
+        # Check position and notional after order traded
+        if not self.check_position(req):
+            return False
+
         # Add flow count if pass all checks
-        self.order_flow_count += 1
+        flow_times.append(now)
+        return True
+
+    def check_position(self, req: OrderRequest) -> bool:
+        """
+        Check net position and notional of symbol and strategy if order
+        and active orders in same direction are traded, order reducing
+        position is always allowed.
+        """
+        if not (
+            self.symbol_position_limit
+            or self.symbol_notional_limit
+            or self.strategy_position_limit
+            or self.strategy_notional_limit
+        ):
+            return True
+
+        vt_symbol = req.vt_symbol
+        if req.direction == Direction.LONG:
+            change = req.volume
+        else:
+            change = -req.volume
+
+        pos = self.symbol_positions[vt_symbol] + self.get_pending(req)
+        new_pos = pos + change
+        if abs(new_pos) <= abs(pos):
+            return True
+
+        if self.symbol_position_limit and abs(new_pos) > self.symbol_position_limit:
+            self.write_log(
+                f"{vt_symbol}委托后净持仓{new_pos}，超过限制{self.symbol_position_limit}")
+            return False
+
+        price = req.price or self.prices.get(vt_symbol, 0)
+        size = self.get_size(vt_symbol)
+
+        notional = abs(new_pos) * price * size
+        if self.symbol_notional_limit and notional > self.symbol_notional_limit:
+            self.write_log(
+                f"{vt_symbol}委托后持仓市值{notional}，超过限制{self.symbol_notional_limit}")
+            return False
+
+        key = (req.reference, vt_symbol)
+        strategy_pos = (
+            self.strategy_positions[key]
+            + self.get_pending(req, req.reference)
+        )
+        new_strategy_pos = strategy_pos + change
+        if abs(new_strategy_pos) <= abs(strategy_pos):
+            return True
+
+        if (
+            self.strategy_position_limit
+            and abs(new_strategy_pos) > self.strategy_position_limit
+        ):
+            self.write_log(
+                f"{req.reference}委托后{vt_symbol}净持仓{new_strategy_pos}，超过限制{self.strategy_position_limit}")
+            return False
+
+        if self.strategy_notional_limit:
+            contribution = abs(new_strategy_pos) * price * size
+            strategy_notional = (
+                self.strategy_notionals[req.reference]
+                - self.strategy_contributions[key]
+                + contribution
+            )
+
+            if strategy_notional > self.strategy_notional_limit:
+                self.write_log(
+                    f"{req.reference}委托后持仓市值{strategy_notional}，超过限制{self.strategy_notional_limit}")
+                return False
+
         return True
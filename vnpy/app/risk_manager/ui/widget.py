@@ -31,6 +31,10 @@ class RiskManager(QtWidgets.QDialog):
         self.trade_limit_spin = RiskManagerSpinBox()
         self.active_limit_spin = RiskManagerSpinBox()
         self.cancel_limit_spin = RiskManagerSpinBox()
+        self.position_limit_spin = RiskManagerSpinBox()
+        self.notional_limit_spin = RiskManagerDoubleSpinBox()
+        self.strategy_position_limit_spin = RiskManagerSpinBox()
+        self.strategy_notional_limit_spin = RiskManagerDoubleSpinBox()
 
         save_button = QtWidgets.QPushButton("保存")
         save_button.clicked.connect(self.save_setting)
@@ -44,6 +48,10 @@ class RiskManager(QtWidgets.QDialog):
         form.addRow("总成交上限（笔）", self.trade_limit_spin)
         form.addRow("活动委托上限（笔）", self.active_limit_spin)
         form.addRow("合约撤单上限（笔）", self.cancel_limit_spin)
+        form.addRow("合约净持仓上限（数量）", self.position_limit_spin)
+        form.addRow("合约持仓市值上限", self.notional_limit_spin)
+        form.addRow("策略净持仓上限（数量）", self.strategy_position_limit_spin)
+        form.addRow("策略持仓市值上限", self.strategy_notional_limit_spin)
         form.addRow(save_button)
 
         self.setLayout(form)
@@ -68,6 +76,10 @@ class RiskManager(QtWidgets.QDialog):
             "trade_limit": self.trade_limit_spin.value(),
             "active_order_limit": self.active_limit_spin.value(),
             "order_cancel_limit": self.cancel_limit_spin.value(),
+            "symbol_position_limit": self.position_limit_spin.value(),
+            "symbol_notional_limit": self.notional_limit_spin.value(),
+            "strategy_position_limit": self.strategy_position_limit_spin.value(),
+            "strategy_notional_limit": self.strategy_notional_limit_spin.value(),
         }
 
         self.rm_engine.update_setting(setting)
@@ -89,6 +101,10 @@ class RiskManager(QtWidgets.QDialog):
         self.trade_limit_spin.setValue(setting["trade_limit"])
         self.active_limit_spin.setValue(setting["active_order_limit"])
         self.cancel_limit_spin.setValue(setting["order_cancel_limit"])
+        self.position_limit_spin.setValue(setting["symbol_position_limit"])
+        self.notional_limit_spin.setValue(setting["symbol_notional_limit"])
+        self.strategy_position_limit_spin.setValue(setting["strategy_position_limit"])
+        self.strategy_notional_limit_spin.setValue(setting["strategy_notional_limit"])
 
     def exec_(self):
         """"""
@@ -105,3 +121,15 @@ class RiskManagerSpinBox(QtWidgets.QSpinBox):
         self.setMinimum(0)
         self.setMaximum(1000000)
         self.setValue(value)
+
+
+class RiskManagerDoubleSpinBox(QtWidgets.QDoubleSpinBox):
+    """"""
+
+    def __init__(self, value: float = 0):
+        """"""
+        super().__init__()
+        self.setDecimals(0)
+        self.setMinimum(0)
+        self.setMaximum(1e12)
+        self.setValue(value)
@@ -1,14 +1,18 @@
-from typing import Dict, List
+import ast
+from typing import Any, Dict, List, Optional, Set, Tuple
+from types import CodeType
 from datetime import datetime
 from enum import Enum
 from functools import lru_cache
-from parser import expr
+from math import floor
 
 from vnpy.trader.object import (
     TickData, PositionData, TradeData, ContractData, BarData
 )
 from vnpy.trader.constant import Direction, Offset, Exchange, Interval
-from vnpy.trader.utility import floor_to, ceil_to, round_to, extract_vt_symbol
+from vnpy.trader.utility import (
+    floor_to, ceil_to, round_to, extract_vt_symbol, get_digits
+)
 from vnpy.trader.database import database_manager
 
 
@@ -18,6 +22,12 @@ EVENT_SPREAD_LOG = "eSpreadLog"
 EVENT_SPREAD_ALGO = "eSpreadAlgo"
 EVENT_SPREAD_STRATEGY = "eSpreadStrategy"
 
+# Globals for evaluating price formula
+FORMULA_GLOBALS: Dict[str, Any] = {"__builtins__": __builtins__}
+
+# Tolerance of float error when dividing volume by min volume
+VOLUME_TOLERANCE = 1e-9
+
 
 class LegData:
     """"""
@@ -195,74 +205,109 @@ class SpreadData:
         self.net_pos: float = 0
         self.datetime: datetime = None
 
-    def calculate_price(self):
-        """"""
-        self.clear_price()
+        # Cached leg data, updated only for leg with new tick
+        self.price_inited: bool = False
+        self.unready_legs: Set[str] = set(self.legs.keys())
+        self.leg_bid_volumes: Dict[str, float] = {}
+        self.leg_ask_volumes: Dict[str, float] = {}
+
+        # For rounding with integer number of ticks instead of Decimal
+        self.price_digits: int = get_digits(self.pricetick)
+        self.volume_digits: int = get_digits(self.min_volume)
+
+    def calculate_price(self, vt_symbol: str = ""):
+        """
+        Calculate spread price and volume. If vt_symbol is given, only data
+        of the leg is updated, other legs use cached data.
+        """
+        if vt_symbol and self.price_inited:
+            self.update_leg(self.legs[vt_symbol])
+        else:
+            for leg in self.legs.values():
+                self.update_leg(leg)
+            self.price_inited = True
 
-        # Go through all legs to calculate price
-        for n, leg in enumerate(self.legs.values()):
-            # Filter not all leg price data has been received
-            if not leg.bid_volume or not leg.ask_volume:
-                self.clear_price()
-                return
+        # Filter not all leg price data has been received
+        if self.unready_legs:
+            self.clear_price()
+            return
+
+        self.calculate_spread_price()
+
+        # Round price to pricetick
+        if self.pricetick:
+            self.bid_price = self.round_price(self.bid_price)
+            self.ask_price = self.round_price(self.ask_price)
+
+        # Use min value of each leg quoting volume
+        self.bid_volume = min(self.leg_bid_volumes.values())
+        self.ask_volume = min(self.leg_ask_volumes.values())
+
+        # Update calculate time
+        self.datetime = datetime.now()
+
+    def calculate_spread_price(self):
+        """"""
+        bid_price = 0
+        ask_price = 0
 
-            # Calculate price
+        for leg in self.legs.values():
             price_multiplier = self.price_multipliers[leg.vt_symbol]
             if price_multiplier > 0:
-                self.bid_price += leg.bid_price * price_multiplier
-                self.ask_price += leg.ask_price * price_multiplier
+                bid_price += leg.bid_price * price_multiplier
+                ask_price += leg.ask_price * price_multiplier
             else:
-                self.bid_price += leg.ask_price * price_multiplier
-                self.ask_price += leg.bid_price * price_multiplier
+                bid_price += leg.ask_price * price_multiplier
+                ask_price += leg.bid_price * price_multiplier
 
-            # Round price to pricetick
-            if self.pricetick:
-                self.bid_price = round_to(self.bid_price, self.pricetick)
-                self.ask_price = round_to(self.ask_price, self.pricetick)
+        self.bid_price = bid_price
+        self.ask_price = ask_price
 
-            # Calculate volume
-            trading_multiplier = self.trading_multipliers[leg.vt_symbol]
-            inverse_contract = self.inverse_contracts[leg.vt_symbol]
+    def update_leg(self, leg: LegData):
+        """
+        Update readiness and adjusted quoting volume of leg.
+        """
+        vt_symbol = leg.vt_symbol
 
-            if not inverse_contract:
-                leg_bid_volume = leg.bid_volume
-                leg_ask_volume = leg.ask_volume
-            else:
-                leg_bid_volume = calculate_inverse_volume(
-                    leg.bid_volume, leg.bid_price, leg.size)
-                leg_ask_volume = calculate_inverse_volume(
-                    leg.ask_volume, leg.ask_price, leg.size)
+        if not leg.bid_volume or not leg.ask_volume:
+            self.unready_legs.add(vt_symbol)
+            return
+        self.unready_legs.discard(vt_symbol)
 
-            if trading_multiplier > 0:
-                adjusted_bid_volume = floor_to(
-                    leg_bid_volume / trading_multiplier,
-                    self.min_volume
-                )
-                adjusted_ask_volume = floor_to(
-                    leg_ask_volume / trading_multiplier,
-                    self.min_volume
-                )
-            else:
-                adjusted_bid_volume = floor_to(
-                    leg_ask_volume / abs(trading_multiplier),
-                    self.min_volume
-                )
-                adjusted_ask_volume = floor_to(
-                    leg_bid_volume / abs(trading_multiplier),
-                    self.min_volume
-                )
-
-            # For the first leg, just initialize
-            if not n:
-                self.bid_volume = adjusted_bid_volume
-                self.ask_volume = adjusted_ask_volume
-            # For following legs, use min value of each leg quoting volume
-            else:
-                self.bid_volume = min(self.bid_volume, adjusted_bid_volume)
-                self.ask_volume = min(self.ask_volume, adjusted_ask_volume)
+        trading_multiplier = self.trading_multipliers[vt_symbol]
+        if not trading_multiplier:
+            return
 
-            # Update calculate time
-            self.datetime = datetime.now()
+        inverse_contract = self.inverse_contracts[vt_symbol]
+        if not inverse_contract:
+            leg_bid_volume = leg.bid_volume
+            leg_ask_volume = leg.ask_volume
+        else:
+            leg_bid_volume = calculate_inverse_volume(
+                leg.bid_volume, leg.bid_price, leg.size)
+            leg_ask_volume = calculate_inverse_volume(
+                leg.ask_volume, leg.ask_price, leg.size)
+
+        if trading_multiplier > 0:
+            self.leg_bid_volumes[vt_symbol] = self.floor_volume(
+                leg_bid_volume / trading_multiplier)
+            self.leg_ask_volumes[vt_symbol] = self.floor_volume(
+                leg_ask_volume / trading_multiplier)
+        else:
+            self.leg_bid_volumes[vt_symbol] = self.floor_volume(
+                leg_ask_volume / abs(trading_multiplier))
+            self.leg_ask_volumes[vt_symbol] = self.floor_volume(
+                leg_bid_volume / abs(trading_multiplier))
+
+    def round_price(self, price: float) -> float:
+        """"""
+        ticks = round(price / self.pricetick)
+        return round(ticks * self.pricetick, self.price_digits)
+
+    def floor_volume(self, volume: float) -> float:
+        """"""
+        count = floor(volume / self.min_volume + VOLUME_TOLERANCE)
+        return round(count * self.min_volume, self.volume_digits)
 
     def calculate_pos(self):
         """"""
@@ -388,98 +433,119 @@ class AdvancedSpreadData(SpreadData):
         self.variable_symbols = variable_symbols
         self.variable_directions = variable_directions
         self.price_formula = price_formula
-        self.price_code = expr(price_formula).compile()
+        self.price_code = compile_formula(price_formula)
+
+        # Constant and coefficients if price formula is linear
+        self.price_linear: Optional[Tuple[float, Dict[str, float]]] = get_linear_form(
+            price_formula, list(variable_symbols.keys())
+        )
 
         self.variable_legs = {}
+        self.symbol_variables: Dict[str, List[str]] = {}
         for variable, vt_symbol in variable_symbols.items():
             leg = self.legs[vt_symbol]
             self.variable_legs[variable] = leg
+            self.symbol_variables.setdefault(vt_symbol, []).append(variable)
 
-    def calculate_price(self):
-        """"""
-        self.clear_price()
-
-        # Go through all legs to calculate price
-        bid_data = {}
-        ask_data = {}
-        volume_inited = False
+        # Price dicts for calculating spread bid/ask
+        self.bid_data: Dict[str, float] = {}
+        self.ask_data: Dict[str, float] = {}
 
-        for variable, leg in self.variable_legs.items():
-            # Filter not all leg price data has been received
-            if not leg.bid_volume or not leg.ask_volume:
-                self.clear_price()
-                return
+    def update_leg(self, leg: LegData):
+        """"""
+        super().update_leg(leg)
 
-            # Generate price dict for calculating spread bid/ask
+        for variable in self.symbol_variables.get(leg.vt_symbol, []):
             variable_direction = self.variable_directions[variable]
             if variable_direction > 0:
-                bid_data[variable] = leg.bid_price
-                ask_data[variable] = leg.ask_price
+                self.bid_data[variable] = leg.bid_price
+                self.ask_data[variable] = leg.ask_price
             else:
-                bid_data[variable] = leg.ask_price
-                ask_data[variable] = leg.bid_price
+                self.bid_data[variable] = leg.ask_price
+                self.ask_data[variable] = leg.bid_price
 
-            # Calculate volume
-            trading_multiplier = self.trading_multipliers[leg.vt_symbol]
-            if not trading_multiplier:
-                continue
+    def calculate_spread_price(self):
+        """"""
+        self.bid_price = self.calculate_formula(self.bid_data)
+        self.ask_price = self.calculate_formula(self.ask_data)
+
+    def calculate_formula(self, data: Dict[str, float]) -> float:
+        """
+        Calculate price formula with linear form if possible.
+        """
+        if not self.price_linear:
+            return self.parse_formula(self.price_code, data)
+
+        value, coefficients = self.price_linear
+        for variable, coefficient in coefficients.items():
+            value += coefficient * data[variable]
+        return value
 
-            inverse_contract = self.inverse_contracts[leg.vt_symbol]
-            if not inverse_contract:
-                leg_bid_volume = leg.bid_volume
-                leg_ask_volume = leg.ask_volume
-            else:
-                leg_bid_volume = calculate_inverse_volume(
-                    leg.bid_volume, leg.bid_price, leg.size)
-                leg_ask_volume = calculate_inverse_volume(
-                    leg.ask_volume, leg.ask_price, leg.size)
+    def parse_formula(self, formula: CodeType, data: Dict[str, float]):
+        """"""
+        return eval(formula, FORMULA_GLOBALS, data)
 
-            if trading_multiplier > 0:
-                adjusted_bid_volume = floor_to(
-                    leg_bid_volume / trading_multiplier,
-                    self.min_volume
-                )
-                adjusted_ask_volume = floor_to(
-                    leg_ask_volume / trading_multiplier,
-                    self.min_volume
-                )
-            else:
-                adjusted_bid_volume = floor_to(
-                    leg_ask_volume / abs(trading_multiplier),
-                    self.min_volume
-                )
-                adjusted_ask_volume = floor_to(
-                    leg_bid_volume / abs(trading_multiplier),
-                    self.min_volume
-                )
-
-            # For the first leg, just initialize
-            if not volume_inited:
-                self.bid_volume = adjusted_bid_volume
-                self.ask_volume = adjusted_ask_volume
-                volume_inited = True
-            # For following legs, use min value of each leg quoting volume
-            else:
-                self.bid_volume = min(self.bid_volume, adjusted_bid_volume)
-                self.ask_volume = min(self.ask_volume, adjusted_ask_volume)
 
-        # Calculate spread price
-        self.bid_price = self.parse_formula(self.price_code, bid_data)
-        self.ask_price = self.parse_formula(self.price_code, ask_data)
+def compile_formula(formula: str) -> CodeType:
+    """"""
+    return compile(formula, "<spread>", "eval")
 
-        # Round price to pricetick
-        if self.pricetick:
-            self.bid_price = round_to(self.bid_price, self.pricetick)
-            self.ask_price = round_to(self.ask_price, self.pricetick)
 
-        # Update calculate time
-        self.datetime = datetime.now()
+def get_linear_form(
+    formula: str,
+    variables: List[str]
+) -> Optional[Tuple[float, Dict[str, float]]]:
+    """
+    Get constant and coefficients of variables if formula is linear,
+    such as "A - 2 * B + 10", otherwise return None.
+    """
+    try:
+        node = ast.parse(formula, mode="eval").body
+    except SyntaxError:
+        return None
 
-    def parse_formula(self, formula: str, data: Dict[str, float]):
-        """"""
-        locals().update(data)
-        value = eval(formula)
-        return value
+    if not is_linear(node):
+        return None
+
+    code = compile_formula(formula)
+    data = dict.fromkeys(variables, 0)
+
+    constant = eval(code, FORMULA_GLOBALS, dict(data))
+
+    coefficients = {}
+    for variable in variables:
+        data[variable] = 1
+        coefficients[variable] = eval(code, FORMULA_GLOBALS, dict(data)) - constant
+        data[variable] = 0
+
+    return constant, coefficients
+
+
+def is_linear(node: ast.AST) -> bool:
+    """"""
+    if isinstance(node, ast.Name):
+        return True
+    elif isinstance(node, ast.Num):
+        return isinstance(node.n, (int, float))
+    elif isinstance(node, ast.UnaryOp):
+        return isinstance(node.op, (ast.UAdd, ast.USub)) and is_linear(node.operand)
+    elif isinstance(node, ast.BinOp):
+        if not is_linear(node.left) or not is_linear(node.right):
+            return False
+
+        if isinstance(node.op, (ast.Add, ast.Sub)):
+            return True
+        elif isinstance(node.op, ast.Mult):
+            return is_constant(node.left) or is_constant(node.right)
+        elif isinstance(node.op, ast.Div):
+            return is_constant(node.right)
+
+    return False
+
+
+def is_constant(node: ast.AST) -> bool:
+    """"""
+    return not any(isinstance(n, ast.Name) for n in ast.walk(node))
 
 
 def calculate_inverse_volume(
@@ -228,7 +228,7 @@ class SpreadDataEngine:
         leg.update_tick(tick)
 
         for spread in self.symbol_spread_map[tick.vt_symbol]:
-            spread.calculate_price()
+            spread.calculate_price(tick.vt_symbol)
             self.put_data_event(spread)
 
     def process_position_event(self, event: Event) -> None:
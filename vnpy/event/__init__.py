@@ -1 +1 @@
-from .engine import Event, EventEngine, EVENT_TIMER
+from .engine import Event, EventEngine, PriorityEventEngine, EVENT_TIMER
@@ -4,11 +4,12 @@ Event-driven framework of vn.py framework.
 
 from collections import defaultdict
 from queue import Empty, Queue
-from threading import Thread
-from time import sleep
-from typing import Any, Callable, List
+from threading import Lock, Thread
+from time import sleep, perf_counter
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
 EVENT_TIMER = "eTimer"
+EVENT_CONFLATED = "eConflated"
 
 
 class Event:
@@ -35,6 +36,11 @@ class EventEngine:
 
     It also generates timer event by every interval seconds,
     which can be used for timing purpose.
+
+    Handlers registered with conflate enabled only receive the newest
+    pending event for each (type, vt_symbol) key, older events still
+    waiting in queue are dropped for them. Other handlers of the same
+    type always receive the full event stream.
     """
 
     def __init__(self, interval: int = 1):
@@ -50,6 +56,11 @@ class EventEngine:
         self._handlers: defaultdict = defaultdict(list)
         self._general_handlers: List = []
 
+        self._conflated_handlers: defaultdict = defaultdict(list)
+        self._conflated_events: Dict[Tuple[str, Any], Event] = {}
+        self._conflated_dropped: defaultdict = defaultdict(int)
+        self._conflation_lock: Lock = Lock()
+
     def _run(self) -> None:
         """
         Get event from queue and then process it.
@@ -69,12 +80,49 @@ class EventEngine:
         Then distrubute event to those general handlers which listens
         to all types.
         """
+        if event.type == EVENT_CONFLATED:
+            event, handlers = self._pop_conflated(event.data)
+            [handler(event) for handler in handlers]
+            return
+
         if event.type in self._handlers:
             [handler(event) for handler in self._handlers[event.type]]
 
         if self._general_handlers:
             [handler(event) for handler in self._general_handlers]
 
+    def _put_conflated(self, event: Event) -> None:
+        """
+        Keep only the newest pending event of the same key, and schedule
+        a conflated event for the first pending one.
+        """
+        key = (event.type, getattr(event.data, "vt_symbol", None))
+
+        with self._conflation_lock:
+            if key in self._conflated_events:
+                self._conflated_dropped[event.type] += 1
+                self._conflated_events[key] = event
+                return
+
+            self._conflated_events[key] = event
+
+        self._put_queue(event.type, Event(EVENT_CONFLATED, key))
+
+    def _pop_conflated(self, key: Tuple[str, Any]) -> Tuple[Event, List]:
+        """
+        Get the newest pending event of key and its conflated handlers.
+        """
+        with self._conflation_lock:
+            event = self._conflated_events.pop(key)
+
+        return event, self._conflated_handlers.get(event.type, [])
+
+    def _put_queue(self, type: str, event: Event) -> None:
+        """
+        Put event into queue which processes events of type.
+        """
+        self._queue.put(event)
+
     def _run_timer(self) -> None:
         """
         Sleep by interval second(s) and then generate a timer event.
@@ -104,14 +152,29 @@ class EventEngine:
         """
         Put an event object into event queue.
         """
-        self._queue.put(event)
+        if event.type in self._conflated_handlers:
+            self._put_conflated(event)
 
-    def register(self, type: str, handler: HandlerType) -> None:
+        self._put_queue(event.type, event)
+
+    def register(
+        self,
+        type: str,
+        handler: HandlerType,
+        conflate: bool = False
+    ) -> None:
         """
         Register a new handler function for a specific event type. Every
         function can only be registered once for each event type.
+
+        If conflate is True, handler only receives the newest pending
+        event of each vt_symbol.
         """
-        handler_list = self._handlers[type]
+        if conflate:
+            handler_list = self._conflated_handlers[type]
+        else:
+            handler_list = self._handlers[type]
+
         if handler not in handler_list:
             handler_list.append(handler)
 
@@ -119,13 +182,23 @@ class EventEngine:
         """
         Unregister an existing handler function from event engine.
         """
-        handler_list = self._handlers[type]
+        for handlers in [self._handlers, self._conflated_handlers]:
+            if type not in handlers:
+                continue
+
+            handler_list = handlers[type]
+
+            if handler in handler_list:
+                handler_list.remove(handler)
 
-        if handler in handler_list:
-            handler_list.remove(handler)
+            if not handler_list:
+                handlers.pop(type)
 
-        if not handler_list:
-            self._handlers.pop(type)
+    def get_conflated_dropped(self) -> Dict[str, int]:
+        """
+        Return number of events dropped by conflation for each type.
+        """
+        return dict(self._conflated_dropped)
 
     def register_general(self, handler: HandlerType) -> None:
         """
@@ -141,3 +214,171 @@ class EventEngine:
         """
         if handler in self._general_handlers:
             self._general_handlers.remove(handler)
+
+
+# Defines lane setting: (lane name, event type prefixes routed to the lane).
+LaneType = Tuple[str, Sequence[str]]
+
+
+class PriorityEventEngine(EventEngine):
+    """
+    Event engine which partitions events by type into several lanes.
+
+    Every lane has its own bounded queue and worker thread, so that slow
+    handlers in one lane (e.g. log or UI) will not delay events in another
+    lane (e.g. tick). Event type is routed to the first lane which has a
+    matching type prefix, or the last lane if no prefix matched.
+
+    Handlers of the same event type are always processed in one lane and
+    keep their registration order. General handlers are called from every
+    lane thread.
+    """
+
+    def __init__(
+        self,
+        interval: int = 1,
+        lanes: Sequence[LaneType] = None,
+        queue_size: int = 0
+    ):
+        """
+        Lanes are ordered from highest priority, each with a queue limited
+        to queue_size events (0 for unbounded).
+        """
+        super().__init__(interval)
+
+        if not lanes:
+            lanes = [("default", [])]
+
+        self._lane_names: List[str] = [name for name, _ in lanes]
+        self._lane_prefixes: List[Tuple[str, int]] = []
+        for n, (_, prefixes) in enumerate(lanes):
+            for prefix in prefixes:
+                self._lane_prefixes.append((prefix, n))
+
+        self._queues: List[Queue] = [Queue(queue_size) for _ in lanes]
+        self._threads: List[Thread] = [
+            Thread(target=self._run_lane, args=(queue,), name=f"EventLane-{name}")
+            for name, queue in zip(self._lane_names, self._queues)
+        ]
+        self._type_lanes: Dict[str, Queue] = {}
+
+        # Latency statistics of each handler: [count, total, max]
+        self._handler_stats: Dict[Tuple[str, HandlerType], List[float]] = {}
+
+    def _get_lane(self, type: str) -> Queue:
+        """
+        Find the lane queue of event type, result is cached.
+        """
+        queue = self._type_lanes.get(type, None)
+
+        if not queue:
+            queue = self._queues[-1]
+            for prefix, n in self._lane_prefixes:
+                if type.startswith(prefix):
+                    queue = self._queues[n]
+                    break
+            self._type_lanes[type] = queue
+
+        return queue
+
+    def _run_lane(self, queue: Queue) -> None:
+        """
+        Get event from lane queue and then process it.
+        """
+        while self._active:
+            try:
+                event = queue.get(block=True, timeout=1)
+                self._process(event)
+            except Empty:
+                pass
+
+    def _process(self, event: Event) -> None:
+        """
+        Distribute event to handlers and record latency of each call.
+        """
+        if event.type == EVENT_CONFLATED:
+            event, handlers = self._pop_conflated(event.data)
+            for handler in handlers:
+                self._call_handler(event, handler)
+            return
+
+        if event.type in self._handlers:
+            for handler in self._handlers[event.type]:
+                self._call_handler(event, handler)
+
+        if self._general_handlers:
+            for handler in self._general_handlers:
+                self._call_handler(event, handler)
+
+    def _call_handler(self, event: Event, handler: HandlerType) -> None:
+        """"""
+        start = perf_counter()
+        handler(event)
+        cost = perf_counter() - start
+
+        key = (event.type, handler)
+        stats = self._handler_stats.get(key, None)
+        if not stats:
+            stats = [0, 0.0, 0.0]
+            self._handler_stats[key] = stats
+
+        stats[0] += 1
+        stats[1] += cost
+        if cost > stats[2]:
+            stats[2] = cost
+
+    def start(self) -> None:
+        """
+        Start lane threads and timer thread.
+        """
+        self._active = True
+        for thread in self._threads:
+            thread.start()
+        self._timer.start()
+
+    def stop(self) -> None:
+        """
+        Stop event engine.
+        """
+        self._active = False
+        self._timer.join()
+        for thread in self._threads:
+            thread.join()
+
+    def _put_queue(self, type: str, event: Event) -> None:
+        """
+        Put event into the queue of the lane which type is routed to.
+        """
+        self._get_lane(type).put(event)
+
+    def get_queue_sizes(self) -> Dict[str, int]:
+        """
+        Return number of pending events in each lane.
+        """
+        return {
+            name: queue.qsize()
+            for name, queue in zip(self._lane_names, self._queues)
+        }
+
+    def get_handler_stats(self) -> List[dict]:
+        """
+        Return call count and latency (in seconds) of each handler.
+        """
+        data = []
+
+        for (type, handler), (count, total, max_cost) in list(self._handler_stats.items()):
+            data.append({
+                "type": type,
+                "handler": getattr(handler, "__qualname__", repr(handler)),
+                "count": count,
+                "average": total / count,
+                "max": max_cost
+            })
+
+        return data
+
+    def clear_handler_stats(self) -> None:
+        """
+        Reset latency statistics of all handlers.
+        """
+        self._handler_stats.clear()
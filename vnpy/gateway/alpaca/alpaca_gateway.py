@@ -158,6 +158,8 @@ class AlpacaRestApi(RestClient):
     Alpaca REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: AlpacaGateway):
         """"""
         super().__init__()
@@ -568,6 +570,8 @@ class AlpacaDataRestApi(RestClient):
     Alpaca Market Data REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: AlpacaGateway):
         """"""
         super().__init__()
@@ -14,7 +14,7 @@ import pytz
 
 from requests.exceptions import SSLError
 
-from vnpy.api.rest import RestClient, Request
+from vnpy.api.rest import AsyncRestClient, Request
 from vnpy.api.websocket import WebsocketClient
 from vnpy.trader.constant import (
     Direction,
@@ -161,11 +161,13 @@ class BinanceGateway(BaseGateway):
         self.rest_api.keep_user_stream()
 
 
-class BinanceRestApi(RestClient):
+class BinanceRestApi(AsyncRestClient):
     """
     BINANCE REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BinanceGateway):
         """"""
         super().__init__()
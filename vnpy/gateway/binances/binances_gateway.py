@@ -191,6 +191,8 @@ class BinancesRestApi(RestClient):
     BINANCE REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BinancesGateway):
         """"""
         super().__init__()
@@ -25,8 +25,8 @@ from vnpy.trader.constant import (
     Interval
 )
 from vnpy.trader.gateway import BaseGateway
+from vnpy.trader.orderbook import OrderBook
 from vnpy.trader.object import (
-    TickData,
     OrderData,
     TradeData,
     BarData,
@@ -378,13 +378,10 @@ class BitfinexWebsocketApi(WebsocketClient):
         self.key = ""
         self.secret = ""
 
-        self.ticks = {}
         self.accounts = {}
         self.orders = {}
         self.trades = set()
-        self.ticks = {}
-        self.bids = {}
-        self.asks = {}
+        self.books = {}
         self.channels = {}       # channel_id : (Channel, Symbol)
 
         self.subscribed = {}
@@ -526,19 +523,13 @@ class BitfinexWebsocketApi(WebsocketClient):
         channel, symbol = self.channels[channel_id]
         symbol = str(symbol.replace("t", ""))
 
-        # Get the Tick object
-        if symbol in self.ticks:
-            tick = self.ticks[symbol]
-        else:
-            tick = TickData(
-                symbol=symbol,
-                exchange=Exchange.BITFINEX,
-                name=symbol,
-                datetime=datetime.now(UTC_TZ),
-                gateway_name=self.gateway_name,
-            )
+        # Get the Tick object of order book
+        book = self.books.get(symbol, None)
+        if not book:
+            book = OrderBook(symbol, Exchange.BITFINEX, self.gateway_name, symbol)
+            self.books[symbol] = book
 
-            self.ticks[symbol] = tick
+        tick = book.tick
 
         l_data1 = data[1]
 
@@ -552,71 +543,32 @@ class BitfinexWebsocketApi(WebsocketClient):
 
         # Update deep quote
         elif channel == "book":
-            bid = self.bids.setdefault(symbol, {})
-            ask = self.asks.setdefault(symbol, {})
-
             if len(l_data1) > 3:
                 for price, count, amount in l_data1:
-                    price = float(price)
-                    count = int(count)
-                    amount = float(amount)
-
                     if amount > 0:
-                        bid[price] = amount
+                        book.update_bid(float(price), float(amount))
                     else:
-                        ask[price] = -amount
+                        book.update_ask(float(price), -float(amount))
             else:
                 price, count, amount = l_data1
                 price = float(price)
-                count = int(count)
-                amount = float(amount)
 
                 if not count:
-                    if price in bid:
-                        del bid[price]
-                    elif price in ask:
-                        del ask[price]
+                    if price in book.bids.volumes:
+                        book.update_bid(price, 0)
+                    else:
+                        book.update_ask(price, 0)
                 else:
                     if amount > 0:
-                        bid[price] = amount
+                        book.update_bid(price, float(amount))
                     else:
-                        ask[price] = -amount
-
-            try:
-                # BID
-                bid_keys = bid.keys()
-                bidPriceList = sorted(bid_keys, reverse=True)
-
-                tick.bid_price_1 = bidPriceList[0]
-                tick.bid_price_2 = bidPriceList[1]
-                tick.bid_price_3 = bidPriceList[2]
-                tick.bid_price_4 = bidPriceList[3]
-                tick.bid_price_5 = bidPriceList[4]
-
-                tick.bid_volume_1 = bid[tick.bid_price_1]
-                tick.bid_volume_2 = bid[tick.bid_price_2]
-                tick.bid_volume_3 = bid[tick.bid_price_3]
-                tick.bid_volume_4 = bid[tick.bid_price_4]
-                tick.bid_volume_5 = bid[tick.bid_price_5]
-
-                # ASK
-                ask_keys = ask.keys()
-                askPriceList = sorted(ask_keys)
-
-                tick.ask_price_1 = askPriceList[0]
-                tick.ask_price_2 = askPriceList[1]
-                tick.ask_price_3 = askPriceList[2]
-                tick.ask_price_4 = askPriceList[3]
-                tick.ask_price_5 = askPriceList[4]
-
-                tick.ask_volume_1 = ask[tick.ask_price_1]
-                tick.ask_volume_2 = ask[tick.ask_price_2]
-                tick.ask_volume_3 = ask[tick.ask_price_3]
-                tick.ask_volume_4 = ask[tick.ask_price_4]
-                tick.ask_volume_5 = ask[tick.ask_price_5]
-            except IndexError:
+                        book.update_ask(price, -float(amount))
+
+            if len(book.bids) < 5 or len(book.asks) < 5:
                 return
 
+            book.update_tick()
+
         dt = datetime.now(UTC_TZ)
         tick.datetime = dt
 
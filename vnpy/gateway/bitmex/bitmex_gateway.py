@@ -163,6 +163,8 @@ class BitmexRestApi(RestClient):
     BitMEX REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BaseGateway):
         """"""
         super(BitmexRestApi, self).__init__()
@@ -213,6 +213,8 @@ class BitstampRestApi(RestClient):
     Bitstamp REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BaseGateway):
         """"""
         super(BitstampRestApi, self).__init__()
@@ -304,7 +306,7 @@ class BitstampRestApi(RestClient):
         return request
 
     def _process_request(
-        self, request: Request
+        self, request: Request, session: requests.Session
     ):
         """
         Bistamp API server does not support keep-alive connection.
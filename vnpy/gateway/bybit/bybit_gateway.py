@@ -182,6 +182,8 @@ class BybitRestApi(RestClient):
     ByBit REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BybitGateway):
         """"""
         super().__init__()
@@ -26,8 +26,8 @@ from vnpy.trader.constant import (
     Interval
 )
 from vnpy.trader.gateway import BaseGateway
+from vnpy.trader.orderbook import OrderBook
 from vnpy.trader.object import (
-    TickData,
     OrderData,
     TradeData,
     AccountData,
@@ -234,7 +234,7 @@ class CoinbaseWebsocketApi(WebsocketClient):
         symbol = req.symbol
         exchange = req.exchange
 
-        orderbook = OrderBook(symbol, exchange, self.gateway)
+        orderbook = CoinbaseOrderBook(symbol, exchange, self.gateway)
         self.orderbooks[symbol] = orderbook
 
         sub_req = {
@@ -378,7 +378,7 @@ class CoinbaseWebsocketApi(WebsocketClient):
         self.gateway.on_trade(trade)
 
 
-class OrderBook():
+class CoinbaseOrderBook(OrderBook):
     """
     Used to maintain orderbook of coinbase data
     """
@@ -387,20 +387,15 @@ class OrderBook():
         """
         one symbol per orderbook
         """
-
-        self.asks = dict()
-        self.bids = dict()
-        self.gateway = gateway
-
-        self.tick = TickData(
-            symbol=symbol,
-            exchange=exchange,
-            name=symbol_name_map.get(symbol, ""),
-            datetime=datetime.now(UTC_TZ),
-            gateway_name=gateway.gateway_name,
+        super().__init__(
+            symbol,
+            exchange,
+            gateway.gateway_name,
+            symbol_name_map.get(symbol, "")
         )
 
-        self.first_update = False
+        self.gateway = gateway
+        self.tick.datetime = datetime.now(UTC_TZ)
 
     def on_message(self, d: dict):
         """
@@ -418,28 +413,15 @@ class OrderBook():
         """
         call back  when type is 12update
         """
-        size = d[2]
-        price = d[1]
-        side = d[0]
+        side, price, size = d
 
         if side == "buy":
-            if float(price) in self.bids:
-                if size == 0:
-                    del self.bids[float(price)]
-                else:
-                    self.bids[float(price)] = float(size)
-            else:
-                self.bids[float(price)] = float(size)
+            self.update_bid(float(price), float(size))
         else:
-            if float(price) in self.asks:
-                if size == 0:
-                    del self.asks[float(price)]
-                else:
-                    self.asks[float(price)] = float(size)
-            else:
-                self.asks[float(price)] = float(size)
+            self.update_ask(float(price), float(size))
 
-        self.generate_tick(dt)
+        tick = self.update_tick(dt)
+        self.gateway.on_tick(copy(tick))
 
     def on_ticker(self, d: dict):
         """
@@ -459,48 +441,7 @@ class OrderBook():
         """
         call back when type is snapshot
         """
-        for price, size in asks:
-            self.asks[float(price)] = float(size)
-
-        for price, size in bids:
-            self.bids[float(price)] = float(size)
-
-    def generate_tick(self, dt: datetime):
-        """"""
-        tick = self.tick
-
-        bids_keys = self.bids.keys()
-        bids_keys = sorted(bids_keys, reverse=True)
-
-        tick.bid_price_1 = bids_keys[0]
-        tick.bid_price_2 = bids_keys[1]
-        tick.bid_price_3 = bids_keys[2]
-        tick.bid_price_4 = bids_keys[3]
-        tick.bid_price_5 = bids_keys[4]
-
-        tick.bid_volume_1 = self.bids[bids_keys[0]]
-        tick.bid_volume_2 = self.bids[bids_keys[1]]
-        tick.bid_volume_3 = self.bids[bids_keys[2]]
-        tick.bid_volume_4 = self.bids[bids_keys[3]]
-        tick.bid_volume_5 = self.bids[bids_keys[4]]
-
-        asks_keys = self.asks.keys()
-        asks_keys = sorted(asks_keys)
-
-        tick.ask_price_1 = asks_keys[0]
-        tick.ask_price_2 = asks_keys[1]
-        tick.ask_price_3 = asks_keys[2]
-        tick.ask_price_4 = asks_keys[3]
-        tick.ask_price_5 = asks_keys[4]
-
-        tick.ask_volume_1 = self.asks[asks_keys[0]]
-        tick.ask_volume_2 = self.asks[asks_keys[1]]
-        tick.ask_volume_3 = self.asks[asks_keys[2]]
-        tick.ask_volume_4 = self.asks[asks_keys[3]]
-        tick.ask_volume_5 = self.asks[asks_keys[4]]
-
-        tick.datetime = dt
-        self.gateway.on_tick(copy(tick))
+        self.apply_snapshot(bids, asks)
 
 
 class CoinbaseRestApi(RestClient):
@@ -508,6 +449,8 @@ class CoinbaseRestApi(RestClient):
     Coinbase REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BaseGateway):
         """"""
         super(CoinbaseRestApi, self).__init__()
@@ -128,6 +128,8 @@ class GateiosRestApi(RestClient):
     Gateios REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BaseGateway):
         """"""
         super().__init__()
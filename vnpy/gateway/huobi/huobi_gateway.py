@@ -6,7 +6,6 @@ import re
 import urllib
 import base64
 import json
-import zlib
 import hashlib
 import hmac
 import sys
@@ -16,7 +15,7 @@ import pytz
 from typing import Dict, List, Any
 
 from vnpy.api.rest import RestClient, Request
-from vnpy.api.websocket import WebsocketClient
+from vnpy.api.websocket import WebsocketClient, GzipJsonDecoder
 from vnpy.trader.constant import (
     Direction,
     Exchange,
@@ -162,6 +161,8 @@ class HuobiRestApi(RestClient):
     HUOBI REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BaseGateway):
         """"""
         super().__init__()
@@ -512,6 +513,7 @@ class HuobiWebsocketApiBase(WebsocketClient):
     def __init__(self, gateway):
         """"""
         super().__init__()
+        self.decoder = GzipJsonDecoder()
 
         self.gateway: HuobiGateway = gateway
         self.gateway_name: str = gateway.gateway_name
@@ -562,16 +564,6 @@ class HuobiWebsocketApiBase(WebsocketClient):
         """"""
         pass
 
-    @staticmethod
-    def unpack_data(data):
-        """"""
-        if isinstance(data, bytes):
-            buf = zlib.decompress(data, 31)
-        else:
-            buf = data
-
-        return json.loads(buf)
-
     def on_packet(self, packet: dict):
         """"""
         # print("on packet", packet)
@@ -6,7 +6,6 @@ import re
 import urllib
 import base64
 import json
-import zlib
 import hashlib
 import hmac
 import sys
@@ -18,7 +17,7 @@ import pytz
 
 from vnpy.event import Event
 from vnpy.api.rest import RestClient, Request
-from vnpy.api.websocket import WebsocketClient
+from vnpy.api.websocket import WebsocketClient, GzipJsonDecoder
 from vnpy.trader.constant import (
     Direction,
     Offset,
@@ -207,6 +206,8 @@ class HuobifRestApi(RestClient):
     HUOBIF REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BaseGateway):
         """"""
         super().__init__()
@@ -731,6 +732,7 @@ class HuobifWebsocketApiBase(WebsocketClient):
     def __init__(self, gateway):
         """"""
         super(HuobifWebsocketApiBase, self).__init__()
+        self.decoder = GzipJsonDecoder()
 
         self.gateway = gateway
         self.gateway_name = gateway.gateway_name
@@ -776,11 +778,6 @@ class HuobifWebsocketApiBase(WebsocketClient):
         """"""
         pass
 
-    @staticmethod
-    def unpack_data(data):
-        """"""
-        return json.loads(zlib.decompress(data, 31))
-
     def on_packet(self, packet):
         """"""
         if "ping" in packet:
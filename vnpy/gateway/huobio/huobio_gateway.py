@@ -6,7 +6,6 @@ import re
 import urllib
 import base64
 import json
-import zlib
 import hashlib
 import hmac
 import sys
@@ -19,7 +18,7 @@ from typing import Dict, List, Any
 
 from vnpy.event import Event
 from vnpy.api.rest import RestClient, Request
-from vnpy.api.websocket import WebsocketClient
+from vnpy.api.websocket import WebsocketClient, GzipJsonDecoder
 from vnpy.trader.constant import (
     Direction,
     Offset,
@@ -205,6 +204,8 @@ class HuobioRestApi(RestClient):
     HUOBIO REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BaseGateway):
         """"""
         super().__init__()
@@ -752,6 +753,7 @@ class HuobioWebsocketApiBase(WebsocketClient):
     def __init__(self, gateway):
         """"""
         super(HuobioWebsocketApiBase, self).__init__()
+        self.decoder = GzipJsonDecoder()
 
         self.gateway: HuobioGateway = gateway
         self.gateway_name: str = gateway.gateway_name
@@ -805,11 +807,6 @@ class HuobioWebsocketApiBase(WebsocketClient):
         """"""
         pass
 
-    @staticmethod
-    def unpack_data(data) -> json.JSONDecoder:
-        """"""
-        return json.loads(zlib.decompress(data, 31))
-
     def on_packet(self, packet) -> None:
         """"""
         if "ping" in packet:
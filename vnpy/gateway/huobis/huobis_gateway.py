@@ -6,7 +6,6 @@ import re
 import urllib
 import base64
 import json
-import zlib
 import hashlib
 import hmac
 import sys
@@ -19,7 +18,7 @@ from typing import Dict, List, Any
 
 from vnpy.event import Event
 from vnpy.api.rest import RestClient, Request
-from vnpy.api.websocket import WebsocketClient
+from vnpy.api.websocket import WebsocketClient, GzipJsonDecoder
 from vnpy.trader.constant import (
     Direction,
     Offset,
@@ -199,6 +198,8 @@ class HuobisRestApi(RestClient):
     HUOBIS REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BaseGateway):
         """"""
         super().__init__()
@@ -746,6 +747,7 @@ class HuobisWebsocketApiBase(WebsocketClient):
     def __init__(self, gateway):
         """"""
         super(HuobisWebsocketApiBase, self).__init__()
+        self.decoder = GzipJsonDecoder()
 
         self.gateway: HuobisGateway = gateway
         self.gateway_name: str = gateway.gateway_name
@@ -799,11 +801,6 @@ class HuobisWebsocketApiBase(WebsocketClient):
         """"""
         pass
 
-    @staticmethod
-    def unpack_data(data) -> json.JSONDecoder:
-        """"""
-        return json.loads(zlib.decompress(data, 31))
-
     def on_packet(self, packet) -> None:
         """"""
         if "ping" in packet:
@@ -286,6 +286,8 @@ class KaisaTradeRestApi(RestClient):
     KAISA REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BaseGateway):
         """"""
         super().__init__()
@@ -7,7 +7,6 @@ import sys
 import time
 import json
 import base64
-import zlib
 from copy import copy
 from datetime import datetime, timedelta
 from threading import Lock
@@ -18,7 +17,7 @@ from requests import ConnectionError
 from pytz import utc as UTC_TZ
 
 from vnpy.api.rest import Request, RestClient
-from vnpy.api.websocket import WebsocketClient
+from vnpy.api.websocket import WebsocketClient, DeflateJsonDecoder
 from vnpy.trader.constant import (
     Direction,
     Exchange,
@@ -167,6 +166,8 @@ class OkexRestApi(RestClient):
     OKEX REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: BaseGateway):
         """"""
         super(OkexRestApi, self).__init__()
@@ -548,6 +549,7 @@ class OkexWebsocketApi(WebsocketClient):
     def __init__(self, gateway):
         """"""
         super(OkexWebsocketApi, self).__init__()
+        self.decoder = DeflateJsonDecoder()
         self.ping_interval = 20     # OKEX use 30 seconds for ping
 
         self.gateway = gateway
@@ -582,10 +584,6 @@ class OkexWebsocketApi(WebsocketClient):
         self.init(WEBSOCKET_HOST, proxy_host, proxy_port)
         # self.start()
 
-    def unpack_data(self, data):
-        """"""
-        return json.loads(zlib.decompress(data, -zlib.MAX_WBITS))
-
     def subscribe(self, req: SubscribeRequest):
         """
         Subscribe to tick data upate.
@@ -8,7 +8,6 @@ import sys
 import time
 import json
 import base64
-import zlib
 from copy import copy
 from datetime import datetime
 from threading import Lock
@@ -19,7 +18,7 @@ from requests import ConnectionError
 import pytz
 
 from vnpy.api.rest import Request, RestClient
-from vnpy.api.websocket import WebsocketClient
+from vnpy.api.websocket import WebsocketClient, DeflateJsonDecoder
 from vnpy.trader.constant import (
     Direction,
     Exchange,
@@ -185,6 +184,8 @@ class OkexfRestApi(RestClient):
     OKEXF REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: "OkexfGateway"):
         """"""
         super(OkexfRestApi, self).__init__()
@@ -622,6 +623,7 @@ class OkexfWebsocketApi(WebsocketClient):
     def __init__(self, gateway):
         """"""
         super().__init__()
+        self.decoder = DeflateJsonDecoder()
         self.ping_interval = 20     # OKEX use 30 seconds for ping
 
         self.gateway = gateway
@@ -654,10 +656,6 @@ class OkexfWebsocketApi(WebsocketClient):
 
         self.init(WEBSOCKET_HOST, proxy_host, proxy_port)
 
-    def unpack_data(self, data):
-        """"""
-        return json.loads(zlib.decompress(data, -zlib.MAX_WBITS))
-
     def subscribe(self, req: SubscribeRequest):
         """
         Subscribe to tick data upate.
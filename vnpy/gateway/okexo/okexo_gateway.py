@@ -8,7 +8,6 @@ import sys
 import time
 import json
 import base64
-import zlib
 from copy import copy
 from datetime import datetime
 from threading import Lock
@@ -20,7 +19,7 @@ from pytz import utc as UTC_TZ
 
 from vnpy.event.engine import EventEngine
 from vnpy.api.rest import Request, RestClient
-from vnpy.api.websocket import WebsocketClient
+from vnpy.api.websocket import WebsocketClient, DeflateJsonDecoder
 from vnpy.trader.constant import (
     Direction,
     Exchange,
@@ -168,6 +167,8 @@ class OkexoRestApi(RestClient):
     OKEXO REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: "OkexoGateway"):
         """"""
         super().__init__()
@@ -616,6 +617,7 @@ class OkexoWebsocketApi(WebsocketClient):
     def __init__(self, gateway):
         """"""
         super().__init__()
+        self.decoder = DeflateJsonDecoder()
 
         self.ping_interval: int = 20     # OKEX use 30 seconds for ping
 
@@ -649,10 +651,6 @@ class OkexoWebsocketApi(WebsocketClient):
 
         self.init(WEBSOCKET_HOST, proxy_host, proxy_port)
 
-    def unpack_data(self, data) -> json.JSONDecoder:
-        """"""
-        return json.loads(zlib.decompress(data, -zlib.MAX_WBITS))
-
     def subscribe(self, req: SubscribeRequest) -> None:
         """
         Subscribe to tick data upate.
@@ -8,7 +8,6 @@ import hmac
 import json
 import sys
 import time
-import zlib
 from copy import copy
 from datetime import datetime
 from threading import Lock
@@ -19,7 +18,7 @@ from requests import ConnectionError
 from pytz import utc as UTC_TZ
 
 from vnpy.api.rest import Request, RestClient
-from vnpy.api.websocket import WebsocketClient
+from vnpy.api.websocket import WebsocketClient, DeflateJsonDecoder
 from vnpy.trader.constant import (Direction, Exchange, Interval, Offset, OrderType, Product, Status)
 from vnpy.trader.gateway import BaseGateway
 from vnpy.trader.object import (AccountData, BarData, CancelRequest, ContractData, HistoryRequest,
@@ -157,6 +156,8 @@ class OkexsRestApi(RestClient):
     OKEX Swap REST API
     """
 
+    max_workers: int = 8
+
     def __init__(self, gateway: "OkexsGateway"):
         """"""
         super(OkexsRestApi, self).__init__()
@@ -542,6 +543,7 @@ class OkexsWebsocketApi(WebsocketClient):
     def __init__(self, gateway):
         """"""
         super(OkexsWebsocketApi, self).__init__()
+        self.decoder = DeflateJsonDecoder()
         self.ping_interval = 20  # OKEX use 30 seconds for ping
 
         self.gateway = gateway
@@ -575,10 +577,6 @@ class OkexsWebsocketApi(WebsocketClient):
 
         self.init(WEBSOCKET_HOST, proxy_host, proxy_port)
 
-    def unpack_data(self, data):
-        """"""
-        return json.loads(zlib.decompress(data, -zlib.MAX_WBITS))
-
     def subscribe(self, req: SubscribeRequest):
         """
         Subscribe to tick data upate.
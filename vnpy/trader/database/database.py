@@ -2,6 +2,9 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Sequence, List, Dict, TYPE_CHECKING
+
+import numpy as np
+from pandas import DataFrame, Series
 from pytz import timezone
 
 from vnpy.trader.setting import SETTINGS
@@ -14,12 +17,50 @@ if TYPE_CHECKING:
 DB_TZ = timezone(SETTINGS["database.timezone"])
 
 
+# Columns of DataFrame returned by load_bar_frame/load_tick_frame
+BAR_FRAME_FIELDS = [
+    "datetime",
+    "open_price", "high_price", "low_price", "close_price",
+    "volume", "open_interest",
+]
+
+TICK_FRAME_FIELDS = [
+    "datetime",
+    "volume", "open_interest", "last_price", "last_volume",
+    "limit_up", "limit_down",
+    "open_price", "high_price", "low_price", "pre_close",
+    "bid_price_1", "bid_price_2", "bid_price_3", "bid_price_4", "bid_price_5",
+    "ask_price_1", "ask_price_2", "ask_price_3", "ask_price_4", "ask_price_5",
+    "bid_volume_1", "bid_volume_2", "bid_volume_3", "bid_volume_4", "bid_volume_5",
+    "ask_volume_1", "ask_volume_2", "ask_volume_3", "ask_volume_4", "ask_volume_5",
+]
+
+
+def generate_frame(rows: Sequence, fields: List[str]) -> DataFrame:
+    """
+    Generate DataFrame from database rows (tuples or dicts) directly.
+
+    Datetime column is parsed from naive datetime object or ISO format
+    string and localized to DB_TZ, null value of price/volume is set to 0.
+    """
+    df = DataFrame.from_records(rows, columns=fields)
+
+    dt = np.array(df["datetime"].to_numpy(), dtype="datetime64[us]")
+    df["datetime"] = Series(dt).dt.tz_localize(DB_TZ)
+
+    for name in fields[1:]:
+        df[name] = df[name].astype(float).fillna(0)
+
+    return df
+
+
 class Driver(Enum):
     SQLITE = "sqlite"
     MYSQL = "mysql"
     POSTGRESQL = "postgresql"
     MONGODB = "mongodb"
     INFLUX = "influxdb"
+    FILE = "file"
 
 
 class BaseDatabaseManager(ABC):
@@ -47,6 +88,59 @@ class BaseDatabaseManager(ABC):
     ) -> Sequence["TickData"]:
         pass
 
+    def load_bar_frame(
+        self,
+        symbol: str,
+        exchange: "Exchange",
+        interval: "Interval",
+        start: datetime,
+        end: datetime
+    ) -> DataFrame:
+        """
+        Return bar data as DataFrame with columns in BAR_FRAME_FIELDS.
+
+        This default implementation is based on load_bar_data, database
+        managers should override it to read columns from cursor directly.
+        """
+        bars = self.load_bar_data(symbol, exchange, interval, start, end)
+
+        rows = [
+            (
+                bar.datetime.astimezone(DB_TZ).replace(tzinfo=None),
+                bar.open_price,
+                bar.high_price,
+                bar.low_price,
+                bar.close_price,
+                bar.volume,
+                bar.open_interest
+            )
+            for bar in bars
+        ]
+        return generate_frame(rows, BAR_FRAME_FIELDS)
+
+    def load_tick_frame(
+        self,
+        symbol: str,
+        exchange: "Exchange",
+        start: datetime,
+        end: datetime
+    ) -> DataFrame:
+        """
+        Return tick data as DataFrame with columns in TICK_FRAME_FIELDS.
+
+        This default implementation is based on load_tick_data, database
+        managers should override it to read columns from cursor directly.
+        """
+        ticks = self.load_tick_data(symbol, exchange, start, end)
+
+        rows = []
+        for tick in ticks:
+            row = [getattr(tick, name) for name in TICK_FRAME_FIELDS]
+            row[0] = tick.datetime.astimezone(DB_TZ).replace(tzinfo=None)
+            rows.append(row)
+
+        return generate_frame(rows, TICK_FRAME_FIELDS)
+
     @abstractmethod
     def save_bar_data(
         self,
@@ -0,0 +1,590 @@
+""""""
+import json
+import os
+import shutil
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from pandas import DataFrame
+
+from vnpy.trader.constant import Exchange, Interval
+from vnpy.trader.object import BarData, TickData
+from vnpy.trader.utility import get_folder_path
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+from .database import (
+    BaseDatabaseManager,
+    Driver,
+    DB_TZ,
+    BAR_FRAME_FIELDS,
+    TICK_FRAME_FIELDS
+)
+
+
+# Fixed-width record of bar/tick file, datetime is saved as
+# microseconds from epoch of naive datetime in DB_TZ.
+BAR_DTYPE = np.dtype(
+    [("datetime", "<i8")] + [(name, "<f8") for name in BAR_FRAME_FIELDS[1:]]
+)
+TICK_DTYPE = np.dtype(
+    [("datetime", "<i8")] + [(name, "<f8") for name in TICK_FRAME_FIELDS[1:]]
+)
+
+EPOCH = datetime(1970, 1, 1)
+DAY_FORMAT = "%Y%m%d"
+TICK_KEY = "tick"
+
+
+def init(_: Driver, settings: dict):
+    database = settings["database"]
+    path = get_folder_path(database)
+    return FileManager(path)
+
+
+def to_timestamp(dt: datetime) -> int:
+    """
+    Convert datetime into microseconds of naive datetime in DB_TZ.
+    """
+    if dt.tzinfo:
+        dt = dt.astimezone(DB_TZ).replace(tzinfo=None)
+
+    delta = dt - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def to_datetime(timestamp: int) -> datetime:
+    """
+    Convert microseconds into datetime localized with DB_TZ.
+    """
+    dt = EPOCH + timedelta(microseconds=int(timestamp))
+    return DB_TZ.localize(dt)
+
+
+@contextmanager
+def lock_file(path: Path):
+    """
+    Hold exclusive lock of file shared by all processes.
+    """
+    with open(path, mode="a+") as f:
+        if os.name == "nt":
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(f, fcntl.LOCK_EX)
+
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class FileManager(BaseDatabaseManager):
+    """
+    Database manager storing bar and tick data in local memory-mapped files.
+
+    Records are saved as fixed-width numpy structured arrays sorted by
+    datetime, with one file for each vt_symbol(+interval) and each day:
+
+        root/bar/{vt_symbol}/{interval}/{YYYYMMDD}.dat
+        root/tick/{vt_symbol}/{YYYYMMDD}.dat
+
+    A json index of count, start and end is kept for each series.
+
+    Files may be shared by several processes, so data files and index are
+    only changed under lock of root/index.lock, and index is read again
+    from file before each change.
+    """
+
+    def __init__(self, root: Path):
+        """"""
+        self.root: Path = Path(root)
+        self.index_path: Path = self.root.joinpath("index.json")
+        self.lock_path: Path = self.root.joinpath("index.lock")
+        self.lock: Lock = Lock()
+
+        self.index: Dict[str, dict] = {}
+        self.load_index()
+
+    @contextmanager
+    def lock_index(self):
+        """
+        Lock files for change in this process and other processes, and
+        reload index changed by other processes.
+        """
+        with self.lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+            with lock_file(self.lock_path):
+                self.load_index()
+                yield
+
+    def load_index(self) -> Dict[str, dict]:
+        """
+        Read index from file, index file is always replaced atomically.
+        """
+        if self.index_path.exists():
+            with open(self.index_path, encoding="UTF-8") as f:
+                self.index = json.load(f)
+        return self.index
+
+    def get_bar_folder(self, vt_symbol: str, interval: Interval) -> Path:
+        """"""
+        return self.root.joinpath("bar", vt_symbol, interval.value)
+
+    def get_tick_folder(self, vt_symbol: str) -> Path:
+        """"""
+        return self.root.joinpath("tick", vt_symbol)
+
+    def save_index(self) -> None:
+        """"""
+        temp_path = self.index_path.with_suffix(".tmp")
+        with open(temp_path, mode="w", encoding="UTF-8") as f:
+            json.dump(self.index, f, indent=4, ensure_ascii=False)
+        os.replace(temp_path, self.index_path)
+
+    def read_day(self, path: Path, dtype: np.dtype) -> np.ndarray:
+        """
+        Map day file into memory, return empty array if not exists.
+        """
+        # Partial record left by interrupted append is ignored
+        count = path.stat().st_size // dtype.itemsize if path.exists() else 0
+        if not count:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+
+    def read_range(
+        self,
+        folder: Path,
+        dtype: np.dtype,
+        start: datetime,
+        end: datetime
+    ) -> List[np.ndarray]:
+        """
+        Return zero-copy slices of each day file within [start, end].
+        """
+        if not folder.exists():
+            return []
+
+        start_ts = to_timestamp(start)
+        end_ts = to_timestamp(end)
+        start_name = f"{(EPOCH + timedelta(microseconds=start_ts)).strftime(DAY_FORMAT)}.dat"
+        end_name = f"{(EPOCH + timedelta(microseconds=end_ts)).strftime(DAY_FORMAT)}.dat"
+
+        names = sorted(
+            name for name in os.listdir(folder)
+            if name.endswith(".dat") and start_name <= name <= end_name
+        )
+
+        slices = []
+        for name in names:
+            data = self.read_day(folder.joinpath(name), dtype)
+
+            timestamps = data["datetime"]
+            left = np.searchsorted(timestamps, start_ts, side="left")
+            right = np.searchsorted(timestamps, end_ts, side="right")
+
+            if right > left:
+                slices.append(data[left:right])
+
+        return slices
+
+    def write_records(
+        self,
+        folder: Path,
+        dtype: np.dtype,
+        records: np.ndarray
+    ) -> None:
+        """
+        Merge records into day files, newer record replaces older one
+        with the same datetime.
+
+        Records after the end of day file are appended, the file is only
+        rewritten if records overlap with existing ones.
+        """
+        folder.mkdir(parents=True, exist_ok=True)
+
+        records = self.sort_records(records)
+
+        dts = records["datetime"].astype("datetime64[us]")
+        days = dts.astype("datetime64[D]")
+
+        for day in np.unique(days):
+            path = folder.joinpath(f"{day.item().strftime(DAY_FORMAT)}.dat")
+
+            old = self.read_day(path, dtype)
+            new = records[days == day]
+
+            size = path.stat().st_size if path.exists() else 0
+            if size == old.nbytes and (
+                not len(old) or old["datetime"][-1] < new["datetime"][0]
+            ):
+                with open(path, mode="ab") as f:
+                    new.tofile(f)
+                continue
+
+            # Mapping of old file is released before file replaced
+            data = self.sort_records(np.concatenate([old, new]))
+            del old
+
+            temp_path = path.with_suffix(".tmp")
+            data.tofile(temp_path)
+            os.replace(temp_path, path)
+
+    def sort_records(self, records: np.ndarray) -> np.ndarray:
+        """
+        Sort records by datetime, and keep the last one of each datetime.
+        """
+        timestamps = records["datetime"]
+        if np.all(timestamps[1:] > timestamps[:-1]):
+            return records
+
+        # Stable sort keeps newer record after older one of same datetime
+        records = records[np.argsort(timestamps, kind="stable")]
+        keep = np.append(records["datetime"][1:] != records["datetime"][:-1], True)
+        return records[keep]
+
+    def update_index(self, key: str, folder: Path, dtype: np.dtype, info: dict) -> None:
+        """
+        Update count and datetime range of series into index.
+        """
+        names = sorted(name for name in os.listdir(folder) if name.endswith(".dat"))
+
+        count = 0
+        for name in names:
+            count += os.path.getsize(folder.joinpath(name)) // dtype.itemsize
+
+        if not count:
+            self.index.pop(key, None)
+            self.save_index()
+            return
+
+        first = self.read_day(folder.joinpath(names[0]), dtype)
+        last = self.read_day(folder.joinpath(names[-1]), dtype)
+
+        info["count"] = int(count)
+        info["start"] = int(first["datetime"][0])
+        info["end"] = int(last["datetime"][-1])
+        self.index[key] = info
+        self.save_index()
+
+    def load_bar_data(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        interval: Interval,
+        start: datetime,
+        end: datetime,
+        collection_name: str = None
+    ) -> Sequence[BarData]:
+        vt_symbol = f"{symbol}.{exchange.value}"
+        folder = self.get_bar_folder(vt_symbol, interval)
+
+        data = []
+        for records in self.read_range(folder, BAR_DTYPE, start, end):
+            for r in records.tolist():
+                bar = BarData(
+                    symbol=symbol,
+                    exchange=exchange,
+                    datetime=to_datetime(r[0]),
+                    interval=interval,
+                    open_price=r[1],
+                    high_price=r[2],
+                    low_price=r[3],
+                    close_price=r[4],
+                    volume=r[5],
+                    open_interest=r[6],
+                    gateway_name="DB",
+                )
+                data.append(bar)
+
+        return data
+
+    def load_tick_data(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        start: datetime,
+        end: datetime,
+        collection_name: str = None
+    ) -> Sequence[TickData]:
+        vt_symbol = f"{symbol}.{exchange.value}"
+        folder = self.get_tick_folder(vt_symbol)
+        name = self.load_index().get(f"{vt_symbol}/{TICK_KEY}", {}).get("name", "")
+
+        data = []
+        for records in self.read_range(folder, TICK_DTYPE, start, end):
+            for r in records.tolist():
+                tick = TickData(
+                    symbol=symbol,
+                    exchange=exchange,
+                    datetime=to_datetime(r[0]),
+                    name=name,
+                    gateway_name="DB",
+                )
+
+                for field_name, value in zip(TICK_FRAME_FIELDS[1:], r[1:]):
+                    setattr(tick, field_name, value)
+
+                data.append(tick)
+
+        return data
+
+    def load_bar_frame(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        interval: Interval,
+        start: datetime,
+        end: datetime
+    ) -> DataFrame:
+        vt_symbol = f"{symbol}.{exchange.value}"
+        folder = self.get_bar_folder(vt_symbol, interval)
+        slices = self.read_range(folder, BAR_DTYPE, start, end)
+        return self.to_frame(slices, BAR_DTYPE, BAR_FRAME_FIELDS)
+
+    def load_tick_frame(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        start: datetime,
+        end: datetime
+    ) -> DataFrame:
+        vt_symbol = f"{symbol}.{exchange.value}"
+        folder = self.get_tick_folder(vt_symbol)
+        slices = self.read_range(folder, TICK_DTYPE, start, end)
+        return self.to_frame(slices, TICK_DTYPE, TICK_FRAME_FIELDS)
+
+    def to_frame(
+        self,
+        slices: List[np.ndarray],
+        dtype: np.dtype,
+        fields: List[str]
+    ) -> DataFrame:
+        """"""
+        if slices:
+            records = np.concatenate(slices)
+        else:
+            records = np.zeros(0, dtype=dtype)
+
+        df = DataFrame({name: records[name] for name in fields[1:]}, columns=fields)
+        df["datetime"] = (
+            DataFrame({"dt": records["datetime"].astype("datetime64[us]")})["dt"]
+            .dt.tz_localize(DB_TZ)
+        )
+        return df
+
+    def save_bar_data(
+        self,
+        datas: Sequence[BarData],
+        collection_name: str = None
+    ):
+        # Each symbol and interval is saved into its own folder
+        groups = defaultdict(list)
+        for bar in datas:
+            groups[(bar.vt_symbol, bar.interval)].append(bar)
+
+        for bars in groups.values():
+            self.save_bar_group(bars)
+
+    def save_bar_group(self, datas: Sequence[BarData]):
+        """
+        Save bars of the same symbol and interval.
+        """
+        bar = datas[0]
+        folder = self.get_bar_folder(bar.vt_symbol, bar.interval)
+
+        records = np.array(
+            [
+                (
+                    to_timestamp(bar.datetime),
+                    bar.open_price,
+                    bar.high_price,
+                    bar.low_price,
+                    bar.close_price,
+                    bar.volume,
+                    bar.open_interest
+                )
+                for bar in datas
+            ],
+            dtype=BAR_DTYPE
+        )
+
+        info = {
+            "symbol": bar.symbol,
+            "exchange": bar.exchange.value,
+            "interval": bar.interval.value
+        }
+
+        with self.lock_index():
+            self.write_records(folder, BAR_DTYPE, records)
+            self.update_index(f"{bar.vt_symbol}/{bar.interval.value}", folder, BAR_DTYPE, info)
+
+    def save_tick_data(
+        self,
+        datas: Sequence[TickData],
+        collection_name: str = None
+    ):
+        # Each symbol is saved into its own folder
+        groups = defaultdict(list)
+        for tick in datas:
+            groups[tick.vt_symbol].append(tick)
+
+        for ticks in groups.values():
+            self.save_tick_group(ticks)
+
+    def save_tick_group(self, datas: Sequence[TickData]):
+        """
+        Save ticks of the same symbol.
+        """
+        tick = datas[0]
+        folder = self.get_tick_folder(tick.vt_symbol)
+
+        records = np.array(
+            [
+                tuple([to_timestamp(tick.datetime)] + [
+                    getattr(tick, name) or 0 for name in TICK_FRAME_FIELDS[1:]
+                ])
+                for tick in datas
+            ],
+            dtype=TICK_DTYPE
+        )
+
+        info = {
+            "symbol": tick.symbol,
+            "exchange": tick.exchange.value,
+            "name": tick.name
+        }
+
+        with self.lock_index():
+            self.write_records(folder, TICK_DTYPE, records)
+            self.update_index(f"{tick.vt_symbol}/{TICK_KEY}", folder, TICK_DTYPE, info)
+
+    def get_edge_bar_data(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        interval: Interval,
+        newest: bool
+    ) -> Optional[BarData]:
+        """
+        Return the newest or the oldest bar data according to index.
+        """
+        vt_symbol = f"{symbol}.{exchange.value}"
+        info = self.load_index().get(f"{vt_symbol}/{interval.value}", None)
+        if not info:
+            return None
+
+        if newest:
+            dt = to_datetime(info["end"])
+        else:
+            dt = to_datetime(info["start"])
+
+        bars = self.load_bar_data(symbol, exchange, interval, dt, dt)
+        if bars:
+            return bars[0]
+        return None
+
+    def get_newest_bar_data(
+        self,
+        symbol: str,
+        exchange: "Exchange",
+        interval: "Interval"
+    ) -> Optional["BarData"]:
+        return self.get_edge_bar_data(symbol, exchange, interval, True)
+
+    def get_oldest_bar_data(
+        self,
+        symbol: str,
+        exchange: "Exchange",
+        interval: "Interval"
+    ) -> Optional["BarData"]:
+        return self.get_edge_bar_data(symbol, exchange, interval, False)
+
+    def get_newest_tick_data(
+        self,
+        symbol: str,
+        exchange: "Exchange"
+    ) -> Optional["TickData"]:
+        vt_symbol = f"{symbol}.{exchange.value}"
+        info = self.load_index().get(f"{vt_symbol}/{TICK_KEY}", None)
+        if not info:
+            return None
+
+        dt = to_datetime(info["end"])
+        ticks = self.load_tick_data(symbol, exchange, dt, dt)
+        if ticks:
+            return ticks[0]
+        return None
+
+    def get_bar_data_statistics(self) -> List[Dict]:
+        """"""
+        result = []
+
+        for key, info in self.load_index().items():
+            if key.endswith(f"/{TICK_KEY}"):
+                continue
+
+            result.append({
+                "symbol": info["symbol"],
+                "exchange": info["exchange"],
+                "interval": info["interval"],
+                "count": info["count"]
+            })
+
+        return result
+
+    def delete_bar_data(
+        self,
+        symbol: str,
+        exchange: "Exchange",
+        interval: "Interval"
+    ) -> int:
+        """
+        Delete all bar data with given symbol + exchange + interval.
+        """
+        vt_symbol = f"{symbol}.{exchange.value}"
+        key = f"{vt_symbol}/{interval.value}"
+
+        with self.lock_index():
+            folder = self.get_bar_folder(vt_symbol, interval)
+            if folder.exists():
+                shutil.rmtree(folder)
+
+            info = self.index.pop(key, None)
+            self.save_index()
+
+        if info:
+            return info["count"]
+        return 0
+
+    def clean(self, symbol: str):
+        with self.lock_index():
+            for key, info in list(self.index.items()):
+                if info["symbol"] != symbol:
+                    continue
+
+                vt_symbol = f"{info['symbol']}.{info['exchange']}"
+                if key.endswith(f"/{TICK_KEY}"):
+                    folder = self.get_tick_folder(vt_symbol)
+                else:
+                    folder = self.get_bar_folder(vt_symbol, Interval(info["interval"]))
+
+                if folder.exists():
+                    shutil.rmtree(folder)
+
+                self.index.pop(key)
+
+            self.save_index()
@@ -1,18 +1,29 @@
 from datetime import datetime
 from typing import Optional, Sequence, List
 
+import numpy as np
 from influxdb import InfluxDBClient
 
 from vnpy.trader.constant import Exchange, Interval
 from vnpy.trader.object import BarData, TickData
 from vnpy.trader.utility import generate_vt_symbol
 
-from .database import BaseDatabaseManager, Driver, DB_TZ
+from pandas import DataFrame
+
+from .database import (
+    BaseDatabaseManager,
+    Driver,
+    DB_TZ,
+    BAR_FRAME_FIELDS,
+    generate_frame
+)
 
 
 influx_database = ""
 influx_client = None
 
+EPOCH_US = np.datetime64(0, "us")
+
 
 def init(_: Driver, settings: dict):
     database = settings["database"]
@@ -88,6 +99,46 @@ class InfluxManager(BaseDatabaseManager):
 
         return data
 
+    def load_bar_frame(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        interval: Interval,
+        start: datetime,
+        end: datetime,
+    ) -> DataFrame:
+        if isinstance(start, datetime):
+            start = start.date()
+
+        if isinstance(end, datetime):
+            end = end.date()
+
+        columns = ", ".join(BAR_FRAME_FIELDS[1:])
+        query = (
+            f"select {columns} from bar_data"
+            " where vt_symbol=$vt_symbol"
+            " and interval=$interval"
+            f" and time >= '{start.isoformat()}'"
+            f" and time <= '{end.isoformat()}';"
+        )
+
+        bind_params = {
+            "vt_symbol": generate_vt_symbol(symbol, exchange),
+            "interval": interval.value
+        }
+
+        # Time is returned as epoch microseconds of naive datetime
+        result = influx_client.query(query, bind_params=bind_params, epoch="u")
+        rows = [
+            [d["time"]] + [d[name] for name in BAR_FRAME_FIELDS[1:]]
+            for d in result.get_points()
+        ]
+
+        for row in rows:
+            row[0] = EPOCH_US + row[0]
+
+        return generate_frame(rows, BAR_FRAME_FIELDS)
+
     def load_tick_data(
         self, symbol: str, exchange: Exchange, start: datetime, end: datetime
     ) -> Sequence[TickData]:
@@ -8,7 +8,16 @@ from mongoengine import DateTimeField, Document, FloatField, StringField, connec
 from vnpy.trader.constant import Exchange, Interval
 from vnpy.trader.object import BarData, TickData
 
-from .database import BaseDatabaseManager, Driver, DB_TZ
+from pandas import DataFrame
+
+from .database import (
+    BaseDatabaseManager,
+    Driver,
+    DB_TZ,
+    BAR_FRAME_FIELDS,
+    TICK_FRAME_FIELDS,
+    generate_frame
+)
 
 from mongoengine.context_managers import switch_collection
 
@@ -249,6 +258,47 @@ class MongoManager(BaseDatabaseManager):
         data = [db_tick.to_tick() for db_tick in s]
         return data
 
+    def load_bar_frame(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        interval: Interval,
+        start: datetime,
+        end: datetime,
+        collection_name: str = None,
+    ) -> DataFrame:
+        if collection_name is None:
+            collection_name = DbBarData._get_collection_name()
+
+        with switch_collection(DbBarData, collection_name):
+            s = DbBarData.objects(
+                symbol=symbol,
+                exchange=exchange.value,
+                interval=interval.value,
+                datetime__gte=start,
+                datetime__lte=end,
+            ).order_by("datetime").only(*BAR_FRAME_FIELDS).exclude("id").as_pymongo()
+            rows = list(s)
+
+        return generate_frame(rows, BAR_FRAME_FIELDS)
+
+    def load_tick_frame(
+        self, symbol: str, exchange: Exchange, start: datetime, end: datetime, collection_name: str = None,
+    ) -> DataFrame:
+        if collection_name is None:
+            collection_name = DbTickData._get_collection_name()
+
+        with switch_collection(DbTickData, collection_name):
+            s = DbTickData.objects(
+                symbol=symbol,
+                exchange=exchange.value,
+                datetime__gte=start,
+                datetime__lte=end,
+            ).order_by("datetime").only(*TICK_FRAME_FIELDS).exclude("id").as_pymongo()
+            rows = list(s)
+
+        return generate_frame(rows, TICK_FRAME_FIELDS)
+
     @staticmethod
     def to_update_param(d) -> dict:
         dt = d.datetime.astimezone(DB_TZ)
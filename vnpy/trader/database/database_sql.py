@@ -1,5 +1,8 @@
 """"""
 from datetime import datetime
+from io import BytesIO
+from struct import Struct
+from time import time
 from typing import List, Dict, Optional, Sequence, Type
 
 from peewee import (
@@ -20,7 +23,16 @@ from vnpy.trader.constant import Exchange, Interval
 from vnpy.trader.object import BarData, TickData
 from vnpy.trader.utility import get_file_path
 
-from .database import BaseDatabaseManager, Driver, DB_TZ
+from pandas import DataFrame
+
+from .database import (
+    BaseDatabaseManager,
+    Driver,
+    DB_TZ,
+    BAR_FRAME_FIELDS,
+    TICK_FRAME_FIELDS,
+    generate_frame
+)
 
 
 def init(driver: Driver, settings: dict):
@@ -39,7 +51,7 @@ def init(driver: Driver, settings: dict):
 def init_sqlite(settings: dict):
     database = settings["database"]
     path = str(get_file_path(database))
-    db = SqliteDatabase(path)
+    db = SqliteDatabase(path, pragmas={"journal_mode": "wal"})
     return db
 
 
@@ -57,6 +69,232 @@ def init_postgresql(settings: dict):
     return db
 
 
+BAR_FIELDS = [
+    "symbol", "exchange", "datetime", "interval",
+    "volume", "open_interest",
+    "open_price", "high_price", "low_price", "close_price",
+]
+
+TICK_FIELDS = [
+    "symbol", "exchange", "datetime", "name",
+    "volume", "open_interest", "last_price", "last_volume",
+    "limit_up", "limit_down",
+    "open_price", "high_price", "low_price", "pre_close",
+    "bid_price_1", "bid_price_2", "bid_price_3", "bid_price_4", "bid_price_5",
+    "ask_price_1", "ask_price_2", "ask_price_3", "ask_price_4", "ask_price_5",
+    "bid_volume_1", "bid_volume_2", "bid_volume_3", "bid_volume_4", "bid_volume_5",
+    "ask_volume_1", "ask_volume_2", "ask_volume_3", "ask_volume_4", "ask_volume_5",
+]
+
+# Field names of TickData for depth data, only saved if bid_price_2 exists
+TICK_DEPTH_FIELDS = TICK_FIELDS[15:19] + TICK_FIELDS[20:24] + TICK_FIELDS[25:29] + TICK_FIELDS[30:34]
+
+
+def to_db_datetime(dt: datetime) -> datetime:
+    """
+    Change datetime to database timezone, then
+    remove tzinfo since not supported by SQLite.
+    """
+    dt = dt.astimezone(DB_TZ)
+    return dt.replace(tzinfo=None)
+
+
+def bar_to_row(bar: BarData) -> tuple:
+    """
+    Convert BarData into row tuple with fields in BAR_FIELDS.
+    """
+    return (
+        bar.symbol,
+        bar.exchange.value,
+        to_db_datetime(bar.datetime),
+        bar.interval.value,
+        bar.volume,
+        bar.open_interest,
+        bar.open_price,
+        bar.high_price,
+        bar.low_price,
+        bar.close_price,
+    )
+
+
+def tick_to_row(tick: TickData) -> tuple:
+    """
+    Convert TickData into row tuple with fields in TICK_FIELDS.
+    """
+    if tick.bid_price_2:
+        depth = [getattr(tick, name) for name in TICK_DEPTH_FIELDS]
+    else:
+        depth = [None] * len(TICK_DEPTH_FIELDS)
+
+    return (
+        tick.symbol,
+        tick.exchange.value,
+        to_db_datetime(tick.datetime),
+        tick.name,
+        tick.volume,
+        tick.open_interest,
+        tick.last_price,
+        tick.last_volume,
+        tick.limit_up,
+        tick.limit_down,
+        tick.open_price,
+        tick.high_price,
+        tick.low_price,
+        tick.pre_close,
+        tick.bid_price_1, *depth[0:4],
+        tick.ask_price_1, *depth[4:8],
+        tick.bid_volume_1, *depth[8:12],
+        tick.ask_volume_1, *depth[12:16],
+    )
+
+
+# Binary COPY format of PostgreSQL
+PG_COPY_HEADER = b"PGCOPY\n\377\r\n\0" + b"\0\0\0\0" + b"\0\0\0\0"
+PG_COPY_TRAILER = b"\xff\xff"
+PG_EPOCH = datetime(2000, 1, 1)
+PG_FIELD_COUNT = Struct("!h")
+PG_NULL = Struct("!i").pack(-1)
+PG_DOUBLE = Struct("!id")
+PG_TIMESTAMP = Struct("!iq")
+PG_LENGTH = Struct("!i")
+
+
+def pack_copy_binary(rows: Sequence[tuple]) -> BytesIO:
+    """
+    Pack rows into PostgreSQL binary COPY data. Value of str, datetime and
+    float is packed as text, timestamp and float8 respectively.
+    """
+    buf = BytesIO()
+    buf.write(PG_COPY_HEADER)
+
+    for row in rows:
+        buf.write(PG_FIELD_COUNT.pack(len(row)))
+
+        for value in row:
+            if value is None:
+                buf.write(PG_NULL)
+            elif isinstance(value, str):
+                data = value.encode("utf-8")
+                buf.write(PG_LENGTH.pack(len(data)))
+                buf.write(data)
+            elif isinstance(value, datetime):
+                delta = value - PG_EPOCH
+                us = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+                buf.write(PG_TIMESTAMP.pack(8, us))
+            else:
+                buf.write(PG_DOUBLE.pack(8, value))
+
+    buf.write(PG_COPY_TRAILER)
+    buf.seek(0)
+    return buf
+
+
+def save_rows(
+    db: Database,
+    driver: Driver,
+    model: Type[Model],
+    fields: List[str],
+    rows: Sequence[tuple],
+    conflict_fields: List[str],
+    batch_size: int,
+    use_copy: bool = True
+) -> None:
+    """
+    Save rows into table of model with a single transaction, update if exists.
+
+    PostgreSQL: binary COPY into temporary table then upsert, or multi-row
+    INSERT ... ON CONFLICT if use_copy is False.
+    SQLite: executemany of INSERT OR REPLACE.
+    MySQL: multi-row INSERT ... ON DUPLICATE KEY UPDATE.
+    """
+    if not rows:
+        return
+
+    # Keep only the last row of each key, since one upsert statement
+    # cannot update the same row twice
+    rows = deduplicate_rows(fields, rows, conflict_fields)
+
+    table = model._meta.table_name
+    columns = ", ".join(f'"{f}"' for f in fields)
+
+    with db.atomic():
+        if driver is Driver.POSTGRESQL and use_copy:
+            temp_table = f"{table}_copy"
+            conflict = ", ".join(f'"{f}"' for f in conflict_fields)
+            update = ", ".join(
+                f'"{f}" = EXCLUDED."{f}"' for f in fields if f not in conflict_fields
+            )
+
+            types = []
+            for name in fields:
+                if isinstance(model._meta.fields[name], DateTimeField):
+                    types.append(f'"{name}" timestamp')
+                elif isinstance(model._meta.fields[name], CharField):
+                    types.append(f'"{name}" text')
+                else:
+                    types.append(f'"{name}" float8')
+
+            cursor = db.cursor()
+            cursor.execute(
+                f'CREATE TEMP TABLE IF NOT EXISTS "{temp_table}" ({", ".join(types)}) ON COMMIT DELETE ROWS'
+            )
+
+            for c in chunked(rows, batch_size):
+                cursor.copy_expert(
+                    f'COPY "{temp_table}" ({columns}) FROM STDIN WITH (FORMAT binary)',
+                    pack_copy_binary(c)
+                )
+
+            cursor.execute(
+                f'INSERT INTO "{table}" ({columns}) SELECT {columns} FROM "{temp_table}" '
+                f"ON CONFLICT ({conflict}) DO UPDATE SET {update}"
+            )
+            cursor.execute(f'TRUNCATE "{temp_table}"')
+        elif driver is Driver.SQLITE:
+            marks = ", ".join("?" * len(fields))
+            sql = f'INSERT OR REPLACE INTO "{table}" ({columns}) VALUES ({marks})'
+
+            cursor = db.cursor()
+            for c in chunked(rows, batch_size):
+                cursor.executemany(
+                    sql,
+                    [[str(v) if isinstance(v, datetime) else v for v in row] for row in c]
+                )
+        else:
+            model_fields = [model._meta.fields[f] for f in fields]
+            conflict_target = [model._meta.fields[f] for f in conflict_fields]
+            preserve = [f for f in model_fields if f.name not in conflict_fields]
+
+            # MySQL generates ON DUPLICATE KEY UPDATE without conflict target
+            if driver is Driver.MYSQL:
+                conflict_target = None
+
+            for c in chunked(rows, batch_size):
+                model.insert_many(c, fields=model_fields).on_conflict(
+                    conflict_target=conflict_target,
+                    preserve=preserve
+                ).execute()
+
+
+def deduplicate_rows(
+    fields: List[str],
+    rows: Sequence[tuple],
+    conflict_fields: List[str]
+) -> Sequence[tuple]:
+    """
+    Remove rows with duplicated conflict key, the last one is kept.
+    """
+    ixs = [fields.index(f) for f in conflict_fields]
+
+    data = {}
+    for row in rows:
+        data[tuple(row[ix] for ix in ixs)] = row
+
+    if len(data) == len(rows):
+        return rows
+    return list(data.values())
+
+
 class ModelBase(Model):
 
     def to_dict(self):
@@ -137,23 +375,24 @@ def init_models(db: Database, driver: Driver):
             """
             save a list of objects, update if exists.
             """
-            dicts = [i.to_dict() for i in objs]
-            with db.atomic():
-                if driver is Driver.POSTGRESQL:
-                    for bar in dicts:
-                        DbBarData.insert(bar).on_conflict(
-                            update=bar,
-                            conflict_target=(
-                                DbBarData.symbol,
-                                DbBarData.exchange,
-                                DbBarData.interval,
-                                DbBarData.datetime,
-                            ),
-                        ).execute()
-                else:
-                    for c in chunked(dicts, 50):
-                        DbBarData.insert_many(
-                            c).on_conflict_replace().execute()
+            rows = [tuple(i.__data__.get(f, None) for f in BAR_FIELDS) for i in objs]
+            DbBarData.save_rows(rows)
+
+        @staticmethod
+        def save_rows(rows: Sequence[tuple], batch_size: int = 1000, use_copy: bool = True):
+            """
+            save rows with fields in BAR_FIELDS, update if exists.
+            """
+            save_rows(
+                db,
+                driver,
+                DbBarData,
+                BAR_FIELDS,
+                rows,
+                ["symbol", "exchange", "interval", "datetime"],
+                batch_size,
+                use_copy
+            )
 
     class DbTickData(ModelBase):
         """
@@ -315,21 +554,24 @@ def init_models(db: Database, driver: Driver):
 
         @staticmethod
         def save_all(objs: List["DbTickData"]):
-            dicts = [i.to_dict() for i in objs]
-            with db.atomic():
-                if driver is Driver.POSTGRESQL:
-                    for tick in dicts:
-                        DbTickData.insert(tick).on_conflict(
-                            update=tick,
-                            conflict_target=(
-                                DbTickData.symbol,
-                                DbTickData.exchange,
-                                DbTickData.datetime,
-                            ),
-                        ).execute()
-                else:
-                    for c in chunked(dicts, 50):
-                        DbTickData.insert_many(c).on_conflict_replace().execute()
+            rows = [tuple(i.__data__.get(f, None) for f in TICK_FIELDS) for i in objs]
+            DbTickData.save_rows(rows)
+
+        @staticmethod
+        def save_rows(rows: Sequence[tuple], batch_size: int = 1000, use_copy: bool = True):
+            """
+            save rows with fields in TICK_FIELDS, update if exists.
+            """
+            save_rows(
+                db,
+                driver,
+                DbTickData,
+                TICK_FIELDS,
+                rows,
+                ["symbol", "exchange", "datetime"],
+                batch_size,
+                use_copy
+            )
 
     db.connect()
     db.create_tables([DbBarData, DbTickData])
@@ -382,13 +624,91 @@ class SqlManager(BaseDatabaseManager):
         data = [db_tick.to_tick() for db_tick in s]
         return data
 
+    def load_bar_frame(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        interval: Interval,
+        start: datetime,
+        end: datetime,
+    ) -> DataFrame:
+        fields = [getattr(self.class_bar, name) for name in BAR_FRAME_FIELDS]
+        s = (
+            self.class_bar.select(*fields)
+            .where(
+                (self.class_bar.symbol == symbol)
+                & (self.class_bar.exchange == exchange.value)
+                & (self.class_bar.interval == interval.value)
+                & (self.class_bar.datetime >= start)
+                & (self.class_bar.datetime <= end)
+            )
+            .order_by(self.class_bar.datetime)
+        )
+
+        cursor = self.class_bar._meta.database.execute(s)
+        return generate_frame(cursor.fetchall(), BAR_FRAME_FIELDS)
+
+    def load_tick_frame(
+        self, symbol: str, exchange: Exchange, start: datetime, end: datetime
+    ) -> DataFrame:
+        fields = [getattr(self.class_tick, name) for name in TICK_FRAME_FIELDS]
+        s = (
+            self.class_tick.select(*fields)
+            .where(
+                (self.class_tick.symbol == symbol)
+                & (self.class_tick.exchange == exchange.value)
+                & (self.class_tick.datetime >= start)
+                & (self.class_tick.datetime <= end)
+            )
+            .order_by(self.class_tick.datetime)
+        )
+
+        cursor = self.class_tick._meta.database.execute(s)
+        return generate_frame(cursor.fetchall(), TICK_FRAME_FIELDS)
+
     def save_bar_data(self, datas: Sequence[BarData]):
-        ds = [self.class_bar.from_bar(i) for i in datas]
-        self.class_bar.save_all(ds)
+        self.bulk_save_bar_data(datas)
 
     def save_tick_data(self, datas: Sequence[TickData]):
-        ds = [self.class_tick.from_tick(i) for i in datas]
-        self.class_tick.save_all(ds)
+        self.bulk_save_tick_data(datas)
+
+    def bulk_save_bar_data(
+        self,
+        datas: Sequence[BarData],
+        batch_size: int = 1000,
+        use_copy: bool = True
+    ) -> Dict:
+        """
+        Save bar data in batches of batch_size rows with single transaction.
+        use_copy is only for PostgreSQL to choose binary COPY or multi-row INSERT.
+
+        Return count, cost seconds and speed (rows per second) of saving.
+        """
+        start = time()
+
+        rows = [bar_to_row(bar) for bar in datas]
+        self.class_bar.save_rows(rows, batch_size, use_copy)
+
+        return generate_save_result(len(rows), time() - start)
+
+    def bulk_save_tick_data(
+        self,
+        datas: Sequence[TickData],
+        batch_size: int = 1000,
+        use_copy: bool = True
+    ) -> Dict:
+        """
+        Save tick data in batches of batch_size rows with single transaction.
+        use_copy is only for PostgreSQL to choose binary COPY or multi-row INSERT.
+
+        Return count, cost seconds and speed (rows per second) of saving.
+        """
+        start = time()
+
+        rows = [tick_to_row(tick) for tick in datas]
+        self.class_tick.save_rows(rows, batch_size, use_copy)
+
+        return generate_save_result(len(rows), time() - start)
 
     def get_newest_bar_data(
         self, symbol: str, exchange: "Exchange", interval: "Interval"
@@ -487,3 +807,17 @@ class SqlManager(BaseDatabaseManager):
     def clean(self, symbol: str):
         self.class_bar.delete().where(self.class_bar.symbol == symbol).execute()
         self.class_tick.delete().where(self.class_tick.symbol == symbol).execute()
+
+
+def generate_save_result(count: int, cost: float) -> Dict:
+    """"""
+    if cost:
+        speed = count / cost
+    else:
+        speed = 0
+
+    return {
+        "count": count,
+        "cost": cost,
+        "speed": speed
+    }
@@ -367,7 +367,7 @@ class OmsEngine(BaseEngine):
 
     def register_event(self) -> None:
         """"""
-        self.event_engine.register(EVENT_TICK, self.process_tick_event)
+        self.event_engine.register(EVENT_TICK, self.process_tick_event, conflate=True)
         self.event_engine.register(EVENT_ORDER, self.process_order_event)
         self.event_engine.register(EVENT_TRADE, self.process_trade_event)
         self.event_engine.register(EVENT_POSITION, self.process_position_event)
@@ -11,3 +11,11 @@ EVENT_POSITION = "ePosition."
 EVENT_ACCOUNT = "eAccount."
 EVENT_CONTRACT = "eContract."
 EVENT_LOG = "eLog"
+
+# Lane setting for PriorityEventEngine, ordered from highest priority.
+EVENT_LANES = [
+    ("tick", [EVENT_TICK]),
+    ("order", [EVENT_ORDER, EVENT_TRADE]),
+    ("position", [EVENT_POSITION, EVENT_ACCOUNT]),
+    ("default", []),
+]
@@ -0,0 +1,210 @@
+"""
+Local order book maintained with incremental L2 updates.
+"""
+import zlib
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from .constant import Exchange
+from .object import TickData
+
+
+BID_PRICE_NAMES = [f"bid_price_{n}" for n in range(1, 6)]
+BID_VOLUME_NAMES = [f"bid_volume_{n}" for n in range(1, 6)]
+ASK_PRICE_NAMES = [f"ask_price_{n}" for n in range(1, 6)]
+ASK_VOLUME_NAMES = [f"ask_volume_{n}" for n in range(1, 6)]
+
+
+class BookSide:
+    """
+    Price levels of one side. Prices are kept in ascending order with
+    bisect, so that top levels are read by slicing without sorting.
+    """
+
+    def __init__(self, descending: bool):
+        """"""
+        self.descending: bool = descending
+        self.prices: List[float] = []
+        self.volumes: Dict[float, float] = {}
+
+    def update(self, price: float, volume: float) -> None:
+        """
+        Set volume of price level, level with zero volume is deleted.
+        """
+        volumes = self.volumes
+
+        if volume:
+            if price not in volumes:
+                insort(self.prices, price)
+            volumes[price] = volume
+        elif price in volumes:
+            del volumes[price]
+
+            ix = bisect_left(self.prices, price)
+            del self.prices[ix]
+
+    def clear(self) -> None:
+        """"""
+        self.prices.clear()
+        self.volumes.clear()
+
+    def top(self, n: int) -> List[Tuple[float, float]]:
+        """
+        Get best n levels of (price, volume).
+        """
+        if self.descending:
+            prices = self.prices[-1:-n - 1:-1]
+        else:
+            prices = self.prices[:n]
+
+        volumes = self.volumes
+        return [(price, volumes[price]) for price in prices]
+
+    def best(self) -> float:
+        """"""
+        if not self.prices:
+            return 0
+
+        if self.descending:
+            return self.prices[-1]
+        else:
+            return self.prices[0]
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+
+class OrderBook:
+    """
+    Local order book of one symbol.
+    * Use apply_snapshot and update_bid/update_ask to maintain price levels.
+    * Use check_sequence to find gap of update sequence.
+    * Use calculate_checksum to verify book with exchange checksum.
+    * Use update_tick to fill top 5 levels into tick.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        gateway_name: str,
+        name: str = ""
+    ):
+        """"""
+        self.bids: BookSide = BookSide(descending=True)
+        self.asks: BookSide = BookSide(descending=False)
+        self.sequence: int = 0
+
+        self.tick: TickData = TickData(
+            symbol=symbol,
+            exchange=exchange,
+            name=name,
+            datetime=datetime.now(),
+            gateway_name=gateway_name,
+        )
+
+    def apply_snapshot(
+        self,
+        bids: Iterable[Tuple[float, float]],
+        asks: Iterable[Tuple[float, float]],
+        sequence: int = 0
+    ) -> None:
+        """
+        Replace all price levels with snapshot.
+        """
+        self.bids.clear()
+        self.asks.clear()
+
+        for price, volume in bids:
+            self.bids.update(float(price), float(volume))
+
+        for price, volume in asks:
+            self.asks.update(float(price), float(volume))
+
+        self.sequence = sequence
+
+    def update_bid(self, price: float, volume: float) -> None:
+        """"""
+        self.bids.update(price, volume)
+
+    def update_ask(self, price: float, volume: float) -> None:
+        """"""
+        self.asks.update(price, volume)
+
+    def check_sequence(self, sequence: int) -> bool:
+        """
+        Return False if there is gap between sequence and the last one,
+        then snapshot should be requested again.
+        """
+        if self.sequence and sequence != self.sequence + 1:
+            return False
+
+        self.sequence = sequence
+        return True
+
+    def calculate_checksum(
+        self,
+        depth: int = 25,
+        format_level: Callable[[float, float, bool], str] = None
+    ) -> int:
+        """
+        Calculate signed crc32 of top levels joined by ":" with bid and ask
+        interleaved, which is used by okex and bitfinex.
+
+        format_level(price, volume, is_bid) returns string of one level,
+        "price:volume" by default.
+        """
+        if not format_level:
+            format_level = _format_level
+
+        bids = self.bids.top(depth)
+        asks = self.asks.top(depth)
+
+        parts = []
+        for n in range(depth):
+            if n < len(bids):
+                parts.append(format_level(*bids[n], True))
+            if n < len(asks):
+                parts.append(format_level(*asks[n], False))
+
+        checksum = zlib.crc32(":".join(parts).encode())
+        if checksum >= 2 ** 31:
+            checksum -= 2 ** 32
+        return checksum
+
+    def update_tick(self, dt: datetime = None) -> TickData:
+        """
+        Fill top 5 levels into tick, empty levels are set to 0.
+        """
+        tick = self.tick
+
+        bids = self.bids.top(5)
+        for n in range(5):
+            if n < len(bids):
+                price, volume = bids[n]
+            else:
+                price, volume = 0, 0
+
+            setattr(tick, BID_PRICE_NAMES[n], price)
+            setattr(tick, BID_VOLUME_NAMES[n], volume)
+
+        asks = self.asks.top(5)
+        for n in range(5):
+            if n < len(asks):
+                price, volume = asks[n]
+            else:
+                price, volume = 0, 0
+
+            setattr(tick, ASK_PRICE_NAMES[n], price)
+            setattr(tick, ASK_VOLUME_NAMES[n], volume)
+
+        if dt:
+            tick.datetime = dt
+
+        return tick
+
+
+def _format_level(price: float, volume: float, is_bid: bool) -> str:
+    """"""
+    return f"{price}:{volume}"
@@ -8,8 +8,9 @@ import logging
 import sys
 from pathlib import Path
 from typing import Callable, Dict, Tuple, Union, Optional, Set
+from collections import deque
 from decimal import Decimal
-from math import floor, ceil
+from math import floor, ceil, sqrt
 
 import numpy as np
 import talib
@@ -846,6 +847,377 @@ class ArrayManager(object):
         return result[-1]
 
 
+class RingArrayManager(ArrayManager):
+    """
+    ArrayManager backed by ring buffer, so that update_bar costs O(1)
+    instead of shifting all arrays.
+
+    Every value is written twice into a buffer of double size, time series
+    properties are returned as contiguous views without copying.
+
+    Incremental indicators (inc_*) are updated in O(1) with every new bar
+    once they are first called, and return running values calculated since
+    the first bar instead of over the array window.
+    """
+
+    def __init__(self, size: int = 100):
+        """Constructor"""
+        self.count: int = 0
+        self.size: int = size
+        self.inited: bool = False
+
+        # Rows: open, high, low, close, volume, open_interest
+        self.buffer: np.ndarray = np.zeros((6, size * 2))
+        self.index: int = 0
+
+        self.indicators: Dict[tuple, "IncrementalIndicator"] = {}
+
+    def update_bar(self, bar: BarData) -> None:
+        """
+        Update new bar data into array manager.
+        """
+        self.count += 1
+        if not self.inited and self.count >= self.size:
+            self.inited = True
+
+        values = (
+            bar.open_price,
+            bar.high_price,
+            bar.low_price,
+            bar.close_price,
+            bar.volume,
+            bar.open_interest
+        )
+
+        ix = self.index
+        self.buffer[:, ix] = values
+        self.buffer[:, ix + self.size] = values
+        self.index = (ix + 1) % self.size
+
+        for indicator in self.indicators.values():
+            indicator.update(bar.high_price, bar.low_price, bar.close_price)
+
+    def _get_row(self, row: int) -> np.ndarray:
+        """"""
+        return self.buffer[row, self.index:self.index + self.size]
+
+    @property
+    def open_array(self) -> np.ndarray:
+        """"""
+        return self._get_row(0)
+
+    @property
+    def high_array(self) -> np.ndarray:
+        """"""
+        return self._get_row(1)
+
+    @property
+    def low_array(self) -> np.ndarray:
+        """"""
+        return self._get_row(2)
+
+    @property
+    def close_array(self) -> np.ndarray:
+        """"""
+        return self._get_row(3)
+
+    @property
+    def volume_array(self) -> np.ndarray:
+        """"""
+        return self._get_row(4)
+
+    @property
+    def open_interest_array(self) -> np.ndarray:
+        """"""
+        return self._get_row(5)
+
+    def _get_indicator(self, indicator_class: type, *args) -> "IncrementalIndicator":
+        """
+        Get incremental indicator, create it with bars in array if not exists.
+        """
+        key = (indicator_class, *args)
+        indicator = self.indicators.get(key, None)
+
+        if not indicator:
+            indicator = indicator_class(*args)
+
+            n = min(self.count, self.size)
+            if n:
+                for high, low, close in zip(
+                    self.high_array[-n:],
+                    self.low_array[-n:],
+                    self.close_array[-n:]
+                ):
+                    indicator.update(high, low, close)
+
+            self.indicators[key] = indicator
+
+        return indicator
+
+    def inc_sma(self, n: int) -> float:
+        """
+        Incremental simple moving average.
+        """
+        return self._get_indicator(SmaIndicator, n).value
+
+    def inc_ema(self, n: int) -> float:
+        """
+        Incremental exponential moving average.
+        """
+        return self._get_indicator(EmaIndicator, n).value
+
+    def inc_atr(self, n: int) -> float:
+        """
+        Incremental average true range.
+        """
+        return self._get_indicator(AtrIndicator, n).value
+
+    def inc_rsi(self, n: int) -> float:
+        """
+        Incremental relative strength index.
+        """
+        return self._get_indicator(RsiIndicator, n).value
+
+    def inc_boll(self, n: int, dev: float) -> Tuple[float, float]:
+        """
+        Incremental Bollinger Channel.
+        """
+        indicator = self._get_indicator(StdIndicator, n)
+        mid = indicator.mean
+        std = indicator.value
+
+        up = mid + std * dev
+        down = mid - std * dev
+
+        return up, down
+
+    def inc_donchian(self, n: int) -> Tuple[float, float]:
+        """
+        Incremental Donchian Channel.
+        """
+        indicator = self._get_indicator(DonchianIndicator, n)
+        return indicator.up, indicator.down
+
+
+class IncrementalIndicator:
+    """
+    Indicator updated in O(1) with every new bar. Value is nan until
+    enough bars are received.
+    """
+
+    def __init__(self, n: int):
+        """"""
+        self.n: int = n
+        self.value: float = np.nan
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        pass
+
+
+class SmaIndicator(IncrementalIndicator):
+    """
+    Simple moving average, same as talib.SMA.
+    """
+
+    def __init__(self, n: int):
+        """"""
+        super().__init__(n)
+
+        self.values: deque = deque()
+        self.total: float = 0
+        self.updates: int = 0
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        self.values.append(close)
+        self.total += close
+
+        if len(self.values) > self.n:
+            self.total -= self.values.popleft()
+
+        # Re-sum periodically to avoid float error accumulation
+        self.updates += 1
+        if self.updates >= self.n:
+            self.updates = 0
+            self.total = sum(self.values)
+
+        if len(self.values) == self.n:
+            self.value = self.total / self.n
+
+
+class StdIndicator(SmaIndicator):
+    """
+    Standard deviation of population, same as talib.STDDEV with nbdev 1.
+    Mean of the window is also available.
+    """
+
+    def __init__(self, n: int):
+        """"""
+        super().__init__(n)
+
+        self.total_square: float = 0
+        self.mean: float = np.nan
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        self.total_square += close * close
+        if len(self.values) == self.n:
+            first = self.values[0]
+            self.total_square -= first * first
+
+        super().update(high, low, close)
+
+        if not self.updates:
+            self.total_square = sum(v * v for v in self.values)
+
+        if len(self.values) == self.n:
+            self.mean = self.value
+            variance = self.total_square / self.n - self.mean * self.mean
+            self.value = sqrt(max(variance, 0))
+
+
+class EmaIndicator(IncrementalIndicator):
+    """
+    Exponential moving average seeded by SMA of first n bars,
+    same as talib.EMA.
+    """
+
+    def __init__(self, n: int):
+        """"""
+        super().__init__(n)
+
+        self.k: float = 2 / (n + 1)
+        self.count: int = 0
+        self.total: float = 0
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        self.count += 1
+
+        if self.count < self.n:
+            self.total += close
+        elif self.count == self.n:
+            self.value = (self.total + close) / self.n
+        else:
+            self.value += (close - self.value) * self.k
+
+
+class AtrIndicator(IncrementalIndicator):
+    """
+    Average true range with Wilder's smoothing, same as talib.ATR.
+    """
+
+    def __init__(self, n: int):
+        """"""
+        super().__init__(n)
+
+        self.pre_close: float = np.nan
+        self.count: int = 0
+        self.total: float = 0
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        pre_close = self.pre_close
+        self.pre_close = close
+
+        if pre_close != pre_close:
+            return
+
+        tr = max(high - low, abs(high - pre_close), abs(low - pre_close))
+        self.count += 1
+
+        if self.count < self.n:
+            self.total += tr
+        elif self.count == self.n:
+            self.value = (self.total + tr) / self.n
+        else:
+            self.value = (self.value * (self.n - 1) + tr) / self.n
+
+
+class RsiIndicator(IncrementalIndicator):
+    """
+    Relative strength index with Wilder's smoothing, same as talib.RSI.
+    """
+
+    def __init__(self, n: int):
+        """"""
+        super().__init__(n)
+
+        self.pre_close: float = np.nan
+        self.count: int = 0
+        self.gain: float = 0
+        self.loss: float = 0
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        pre_close = self.pre_close
+        self.pre_close = close
+
+        if pre_close != pre_close:
+            return
+
+        diff = close - pre_close
+        gain = max(diff, 0)
+        loss = max(-diff, 0)
+        self.count += 1
+
+        if self.count <= self.n:
+            self.gain += gain / self.n
+            self.loss += loss / self.n
+            if self.count < self.n:
+                return
+        else:
+            self.gain = (self.gain * (self.n - 1) + gain) / self.n
+            self.loss = (self.loss * (self.n - 1) + loss) / self.n
+
+        total = self.gain + self.loss
+        if total:
+            self.value = 100 * self.gain / total
+        else:
+            self.value = 0
+
+
+class DonchianIndicator(IncrementalIndicator):
+    """
+    Highest high and lowest low of last n bars, same as talib.MAX/MIN.
+    Monotonic queues keep amortized O(1) cost per bar.
+    """
+
+    def __init__(self, n: int):
+        """"""
+        super().__init__(n)
+
+        self.count: int = 0
+        self.highs: deque = deque()
+        self.lows: deque = deque()
+        self.up: float = np.nan
+        self.down: float = np.nan
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        ix = self.count
+        self.count += 1
+
+        while self.highs and self.highs[-1][1] <= high:
+            self.highs.pop()
+        self.highs.append((ix, high))
+
+        while self.lows and self.lows[-1][1] >= low:
+            self.lows.pop()
+        self.lows.append((ix, low))
+
+        start = self.count - self.n
+        if self.highs[0][0] < start:
+            self.highs.popleft()
+        if self.lows[0][0] < start:
+            self.lows.popleft()
+
+        if self.count >= self.n:
+            self.up = self.highs[0][1]
+            self.down = self.lows[0][1]
+
+
 def virtual(func: Callable) -> Callable:
     """
     mark a function as "virtual", which means that this function can be override.